@@ -0,0 +1,104 @@
+# ========================================
+# scripts/benchmark_search.py
+# ========================================
+"""Script pour mesurer latence et rappel de la recherche produits (sémantique vs hybride).
+
+Usage:
+    python scripts/benchmark_search.py                      # requêtes dérivées du catalogue
+    python scripts/benchmark_search.py requetes.jsonl       # {"query": ..., "cip13": ...} par ligne
+"""
+import asyncio
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.vector_db.qcadrant_client import qdrant_client
+
+SAMPLE_SIZE = 500
+
+# Mentions de conditionnement absentes d'une commande orale
+_PACKAGING = re.compile(r"\b(cpr|gel|gelule|gélule|sachet|b/?\d+|bt|fl|x\d+)\b.*$", re.IGNORECASE)
+
+
+def spoken_query(name: str, rng: random.Random) -> str:
+    """Requête comme la dicterait un pharmacien: minuscules, sans conditionnement, une faute."""
+    query = re.sub(r"(\d)\s*mg\b", r"\1", _PACKAGING.sub("", name).lower()).strip()
+    words = query.split()
+    if words and len(words[0]) > 5 and rng.random() < 0.5:
+        # Erreur de transcription sur la marque
+        word = list(words[0])
+        position = rng.randrange(1, len(word) - 1)
+        word[position] = rng.choice("aeiou")
+        words[0] = "".join(word)
+    return " ".join(words)
+
+
+def load_queries(path: str | None) -> list:
+    """Requêtes du fichier, ou dérivées d'un échantillon du catalogue."""
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    rng = random.Random(42)
+    payloads = qdrant_client.local_index.payloads()
+    sample = rng.sample(payloads, min(SAMPLE_SIZE, len(payloads)))
+    return [
+        {"query": spoken_query(p["name"], rng), "cip13": p["cip13"]}
+        for p in sample
+    ]
+
+
+async def run(queries: list, hybrid: bool) -> dict:
+    """Rappel top-1/top-5 et latences d'un mode de recherche."""
+    latencies, top1, top5 = [], 0, 0
+
+    for item in queries:
+        started_at = time.perf_counter()
+        results = await qdrant_client.search_product(
+            item["query"], limit=5, score_threshold=0.0, hybrid=hybrid
+        )
+        latencies.append((time.perf_counter() - started_at) * 1000)
+
+        cips = [r["product"].get("cip13") for r in results]
+        top1 += bool(cips) and cips[0] == item["cip13"]
+        top5 += item["cip13"] in cips
+
+    latencies.sort()
+    return {
+        "top1": top1 / len(queries),
+        "top5": top5 / len(queries),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+async def benchmark_search(path: str | None = None):
+    """Comparer recherche sémantique et hybride sur le même jeu de requêtes."""
+    print("🚀 Benchmark recherche produits")
+
+    if not await qdrant_client.load_local_index():
+        print("❌ Index local indisponible (vector_search_backend/hybrid_search_enabled)")
+        return
+
+    queries = load_queries(path)
+    print(f"📦 {len(queries)} requêtes")
+
+    # Préchauffage: modèle chargé et cache d'embeddings rempli pour les deux modes
+    await qdrant_client.search_products_batch([q["query"] for q in queries], hybrid=False)
+
+    for mode, hybrid in (("sémantique", False), ("hybride", True)):
+        stats = await run(queries, hybrid)
+        print(
+            f"📊 {mode:<10} top-1 {stats['top1']:.1%}  top-5 {stats['top5']:.1%}  "
+            f"p50 {stats['p50_ms']:.2f} ms  p95 {stats['p95_ms']:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark_search(sys.argv[1] if len(sys.argv) > 1 else None))
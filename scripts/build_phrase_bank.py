@@ -0,0 +1,37 @@
+
+# ========================================
+# scripts/build_phrase_bank.py
+# ========================================
+"""Script pour pré-rendre la banque de phrases au déploiement."""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agent.dialogue_manager import dialogue_manager
+from src.services.tts.elevenlabs_client import ElevenLabsTTSClient
+from src.services.tts.phrase_bank import phrase_bank
+from src.services.tts.segments import segment_assembler
+
+
+async def build_phrase_bank():
+    """Synthétiser toutes les phrases fixes du dialogue."""
+    print("🚀 Construction de la banque de phrases")
+
+    tts_client = ElevenLabsTTSClient()
+    phrases = dialogue_manager.static_phrases()
+
+    count = await phrase_bank.build(tts_client, phrases)
+    print(f"✅ {count} phrases pré-rendues dans {phrase_bank.directory}")
+
+    # Segments des confirmations et du récapitulatif (quantités, unités, liaisons)
+    segment_assembler.set_templates(dialogue_manager.SEGMENTED_TEMPLATES)
+    count = await segment_assembler.bank.build(
+        tts_client, segment_assembler.prerendered_phrases()
+    )
+    print(f"✅ {count} segments pré-rendus dans {segment_assembler.bank.directory}")
+
+
+if __name__ == "__main__":
+    asyncio.run(build_phrase_bank())
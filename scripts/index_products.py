@@ -2,9 +2,16 @@
 # ========================================
 # scripts/index_products.py
 # ========================================
-"""Script pour indexer les produits dans Qdrant."""
+"""Script pour indexer les produits dans Qdrant.
+
+Usage:
+    python scripts/index_products.py              # indexe dans la collection en service
+    python scripts/index_products.py --reindex    # nouvelle collection, validée puis basculée
+    python scripts/index_products.py --resume     # reprendre une indexation interrompue
+"""
 import asyncio
 import sys
+from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -14,24 +21,41 @@ from sqlalchemy.orm import sessionmaker
 
 from src.core.config import settings
 from src.data.repositories.product_repository import ProductRepository
-from src.services.vector_db.qdrant_client import qdrant_client
+from src.services.vector_db.catalog_sync import catalog_sync
+from src.services.vector_db.indexer import product_indexer
+from src.services.vector_db.qcadrant_client import qdrant_client
+
+PAGE_SIZE = 1000
 
 
-async def index_all_products():
-    """Indexer tous les produits dans Qdrant."""
+async def index_all_products(resume: bool = False, reindex: bool = False):
+    """
+    Indexer tous les produits dans Qdrant.
+
+    Args:
+        resume: Reprendre une indexation interrompue (--resume)
+        reindex: Réindexation blue/green dans une nouvelle collection (--reindex)
+    """
     print("🚀 Indexation des produits dans Qdrant")
+    started_at = datetime.utcnow()
 
     # Connexion DB
     engine = create_async_engine(settings.database_url, echo=False)
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-    # Initialiser Qdrant
-    await qdrant_client.initialize_collection()
+    # Initialiser Qdrant (la réindexation crée sa propre collection)
+    if not reindex:
+        await qdrant_client.initialize_collection()
 
     async with async_session() as session:
         # Récupérer tous les produits
         repo = ProductRepository(session)
-        products = await repo.get_all(skip=0, limit=1000)
+        products = []
+        while True:
+            page = await repo.get_all(skip=len(products), limit=PAGE_SIZE)
+            products.extend(page)
+            if len(page) < PAGE_SIZE:
+                break
 
         print(f"📦 {len(products)} produits à indexer")
 
@@ -45,17 +69,26 @@ async def index_all_products():
                 "category": p.category,
                 "supplier_code": p.supplier_code,
                 "unit_price": p.unit_price,
+                "updated_at": p.updated_at.isoformat() if p.updated_at else None,
             }
             for p in products
         ]
 
-        # Indexer en batch
-        indexed_count = await qdrant_client.index_products_batch(products_dict)
+        # Indexer en batch (encodage et envois en parallèle)
+        if reindex:
+            indexed_count = await product_indexer.reindex_all(products_dict, resume=resume)
+        else:
+            indexed_count = await product_indexer.index_products(products_dict, resume=resume)
 
         print(f"✅ {indexed_count} produits indexés dans Qdrant")
 
+    # Produits modifiés pendant la construction: rattrapés dans la collection en service
+    if reindex and indexed_count:
+        caught_up = await catalog_sync.sync_once(since=started_at)
+        print(f"🔄 {caught_up} produits modifiés pendant la réindexation rattrapés")
+
     await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(index_all_products())
\ No newline at end of file
+    asyncio.run(index_all_products(resume="--resume" in sys.argv, reindex="--reindex" in sys.argv))
\ No newline at end of file
@@ -2,6 +2,8 @@
 from src.agent.orchestrator import AgentOrchestrator
 from src.agent.call_manager import CallManager
 from src.agent.dialogue_manager import DialogueManager
+from src.agent.recap import RecapEngine
+from src.agent.watchdog import LatencyWatchdog
 from src.agent.session import SessionManager
 from src.agent.state_machine import ConversationState, ConversationContext, StateMachine
 
@@ -9,6 +11,8 @@ __all__ = [
     "AgentOrchestrator",
     "CallManager",
     "DialogueManager",
+    "RecapEngine",
+    "LatencyWatchdog",
     "SessionManager",
     "ConversationState",
     "ConversationContext",
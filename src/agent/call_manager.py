@@ -7,6 +7,7 @@ from src.agent.session import session_manager, ConversationContext
 from src.agent.state_machine import StateMachine, ConversationState
 from src.data.models import Call
 from src.data.repositories.call_repository import CallRepository
+from src.utils.metrics import record_call_usage
 
 
 class CallManager:
@@ -70,19 +71,39 @@ class CallManager:
         started_at = call_info["started_at"]
         duration = (datetime.utcnow() - started_at).total_seconds()
 
+        # Consommation de l'appel (la session active peut avoir été recréée)
+        context = session_manager.get_session(call_id) or call_info["context"]
+        usage = context.usage.to_dict()
+        record_call_usage(usage)
+
         # Mettre à jour en base
         call = await call_repository.get_by_call_id(call_id)
         if call:
-            call.status = status
-            call.ended_at = datetime.utcnow()
-            call.duration_seconds = int(duration)
-            await call_repository.update(call)
+            await call_repository.update(call.id, {
+                "status": status,
+                "ended_at": datetime.utcnow(),
+                "duration_seconds": int(duration),
+                "stt_audio_seconds": usage["stt_audio_seconds"],
+                "llm_prompt_tokens": usage["llm_prompt_tokens"],
+                "llm_completion_tokens": usage["llm_completion_tokens"],
+                "tts_characters": usage["tts_characters"],
+                "estimated_cost": usage["estimated_cost"],
+                "usage_details": {
+                    "latencies": usage["latencies"],
+                    "llm_requests": usage["llm_requests"],
+                    # Lignes abandonnées sur dépassement d'échéance, à traiter par un conseiller
+                    "review_queue": context.review_queue,
+                },
+            })
 
         # Nettoyer
         del self.active_calls[call_id]
         session_manager.delete_session(call_id)
 
-        print(f"📵 Appel terminé: {call_id} (durée: {duration:.1f}s)")
+        print(
+            f"📵 Appel terminé: {call_id} "
+            f"(durée: {duration:.1f}s, coût estimé: ${usage['estimated_cost']:.4f})"
+        )
         print(f"📊 Appels actifs: {len(self.active_calls)}/{self.max_concurrent_calls}")
 
     def get_active_call(self, call_id: str) -> Optional[dict]:
@@ -1,4 +1,5 @@
 """Gestionnaire de dialogue pour générer les réponses appropriées."""
+from string import Formatter
 from typing import Dict, Any
 from src.agent.state_machine import ConversationState
 
@@ -45,6 +46,36 @@ class DialogueManager:
         ],
     }
 
+    # Découpage de la confirmation COLLECTING en segments pré-rendus (TTS concaténatif).
+    # Joints par des espaces, ils redonnent exactement TEMPLATES[COLLECTING][0].
+    CONFIRMATION_SEGMENTS = ["Bien noté,", "{quantity}", "{unit} de", "{product}.", "Autre chose ?"]
+    # Une ligne du récapitulatif par page (même rendu du produit que la confirmation)
+    RECAP_LINE_SEGMENTS = ["{quantity}", "{unit} de", "{product}."]
+    SEGMENTED_TEMPLATES = [CONFIRMATION_SEGMENTS, RECAP_LINE_SEGMENTS]
+
+    # Phrases fixes hors machine d'états
+    PHRASES = {
+        "listening": "Je vous écoute.",
+        "product_not_understood": "Je n'ai pas compris quel produit vous voulez. Pouvez-vous répéter ?",
+        "nothing_recognized": "Je n'ai reconnu aucun produit. Pouvez-vous répéter votre commande ?",
+        "modify_request": "D'accord, que voulez-vous modifier ?",
+        # Récapitulatif par pages
+        "recap_first_page": "Voici le début de votre commande.",
+        "recap_next_page": "Ensuite.",
+        "recap_last_page": "Et enfin.",
+        "recap_page_question": "C'est correct ?",
+        "recap_final_question": "Je valide la commande ?",
+        # Repli quand un tour dépasse son échéance
+        "review_queued": "Je n'ai pas pu vérifier ce produit à temps, un conseiller s'en occupera. Autre chose ?",
+        "repeat_request": "Excusez-moi, pouvez-vous répéter ?",
+    }
+
+    # Phrases d'attente quand un tour dépasse son budget de latence
+    FILLERS = ["Un instant, je vérifie.", "Je regarde ça.", "Un petit instant."]
+
+    # Accusés de réception du mode dictée (aucune extraction, aucun appel distant)
+    DICTATION_ACKS = ["Oui.", "Je note.", "D'accord.", "Noté."]
+
     def __init__(self, company_name: str = "votre grossiste pharmaceutique"):
         self.company_name = company_name
 
@@ -58,7 +89,7 @@ class DialogueManager:
         templates = self.TEMPLATES.get(state, [""])
 
         if not templates:
-            return "Je vous écoute."
+            return self.PHRASES["listening"]
 
         # Choisir le premier template (ou faire random plus tard)
         template = templates[0]
@@ -71,6 +102,35 @@ class DialogueManager:
 
         return response
 
+    def static_phrases(self) -> list[str]:
+        """
+        Toutes les phrases sans variable (hors nom de l'entreprise).
+
+        Returns:
+            Phrases pouvant être pré-synthétisées
+        """
+        phrases = []
+        for templates in self.TEMPLATES.values():
+            for template in templates:
+                fields = {name for _, name, _, _ in Formatter().parse(template) if name}
+                if fields <= {"company"}:
+                    phrases.append(template.format(company=self.company_name))
+
+        phrases.extend(self.PHRASES.values())
+        phrases.extend(self.DICTATION_ACKS)
+        phrases.extend(self.FILLERS)
+
+        # Dédoublonner en gardant l'ordre
+        return list(dict.fromkeys(phrases))
+
+    def generate_dictation_ack(self, line_count: int) -> str:
+        """Accusé de réception court pendant la dictée (varie d'une ligne à l'autre)."""
+        return self.DICTATION_ACKS[(line_count - 1) % len(self.DICTATION_ACKS)]
+
+    def generate_filler(self, turn_index: int) -> str:
+        """Phrase d'attente (varie d'un tour à l'autre)."""
+        return self.FILLERS[turn_index % len(self.FILLERS)]
+
     def format_recap(self, items: list[Dict[str, Any]]) -> str:
         """Formater le récapitulatif de commande."""
         if not items:
@@ -85,6 +145,37 @@ class DialogueManager:
 
         return ", ".join(recap_parts)
 
+    def format_recap_page(
+            self, items: list[Dict[str, Any]], first: bool, last: bool
+    ) -> str:
+        """
+        Formater une page du récapitulatif (une phrase par ligne de commande).
+
+        Args:
+            items: Lignes de la page
+            first: Première page
+            last: Dernière page (la confirmation valide la commande)
+
+        Returns:
+            Texte de la page
+        """
+        if first:
+            intro = self.PHRASES["recap_first_page"]
+        elif last:
+            intro = self.PHRASES["recap_last_page"]
+        else:
+            intro = self.PHRASES["recap_next_page"]
+
+        lines = []
+        for item in items:
+            product_name = item.get("product_name", "produit")
+            quantity = item.get("quantity", 0)
+            unit = item.get("unit", "unités")
+            lines.append(f"{quantity} {unit} de {product_name}.")
+
+        question = self.PHRASES["recap_final_question" if last else "recap_page_question"]
+        return " ".join([intro, *lines, question])
+
     def generate_out_of_stock_message(self, product_name: str, alternative: str = None) -> str:
         """Message pour rupture de stock."""
         base = f"Désolé, {product_name} est actuellement en rupture de stock."
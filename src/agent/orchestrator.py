@@ -1,17 +1,23 @@
 """Orchestrateur principal de l'agent IA."""
 import asyncio
 import json
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple, Callable, Awaitable
 
 from src.agent.state_machine import StateMachine, ConversationState, ConversationContext
 from src.agent.dialogue_manager import dialogue_manager
+from src.agent.recap import recap_engine
+from src.agent.watchdog import turn_watchdog
 from src.agent.session import session_manager
 from src.services.stt.deepgram_client import DeepgramSTTClient
+from src.services.stt.spelling import spelling_corrector
 from src.services.llm.openai_client import OpenAIClient
-from src.services.tts.elevenlabs_client import ElevenLabsTTSClient
+from src.services.llm.intent_classifier import intent_classifier
+from src.services.tts.base import BaseTTSClient
 from src.services.vector_db.qcadrant_client import QdrantClient
 from src.business.product_service import ProductService
 from src.business.order_service import OrderService
+from src.core.config import settings
 
 
 class AgentOrchestrator:
@@ -21,7 +27,7 @@ class AgentOrchestrator:
             self,
             stt_client: DeepgramSTTClient,
             llm_client: OpenAIClient,
-            tts_client: ElevenLabsTTSClient,
+            tts_client: BaseTTSClient,
             qdrant_client: QdrantClient,
             product_service: ProductService,
             order_service: OrderService,
@@ -40,6 +46,10 @@ class AgentOrchestrator:
         context = session_manager.create_session(call_id)
         state_machine = StateMachine(context)
 
+        # Rattacher la consommation des services à cet appel
+        for client in (self.stt_client, self.llm_client, self.tts_client):
+            client.usage = context.usage
+
         # Transition vers GREETING
         state_machine.transition(ConversationState.GREETING, "Appel entrant")
 
@@ -63,9 +73,22 @@ class AgentOrchestrator:
             call_id: str,
             transcript: str,
             is_final: bool,
-            confidence: float
+            confidence: float,
+            play: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> Optional[str]:
-        """Gérer une transcription (partielle ou finale)."""
+        """
+        Gérer une transcription (partielle ou finale).
+
+        Args:
+            call_id: ID de l'appel
+            transcript: Transcription
+            is_final: Transcription finale
+            confidence: Confiance du STT
+            play: Joue une phrase pendant le tour (active le budget de latence)
+
+        Returns:
+            Réponse à prononcer, ou None
+        """
 
         # Si partiel, on peut afficher mais ne pas traiter
         if not is_final:
@@ -74,21 +97,43 @@ class AgentOrchestrator:
 
         print(f"✅ Transcription finale: {transcript} (confiance: {confidence:.2f})")
 
+        # Noms de produits mal transcrits ramenés au vocabulaire du catalogue
+        if settings.spelling_correction_enabled:
+            transcript, edits = spelling_corrector.correct(transcript)
+            if edits:
+                print(f"✏️  Corrections: {', '.join(f'{a} -> {b}' for a, b in edits)}")
+
         # Récupérer la session
         context = session_manager.get_session(call_id)
         if not context:
             print(f"⚠️  Session non trouvée: {call_id}")
             return None
 
+        # Échéance du tour: ordonne les requêtes LLM entre appels concurrents
+        self.llm_client.turn_deadline = time.monotonic() + settings.llm_turn_deadline
+
         # Mettre à jour le contexte
         context.current_transcript = transcript
+        context.pending_lines = []
         context.confidence_scores.append(confidence)
         context.add_message("user", transcript)
 
         # State machine
         state_machine = StateMachine(context)
 
-        # Traiter selon l'état actuel
+        turn = self._handle_turn(context, state_machine, transcript, confidence)
+        if play is not None and settings.turn_watchdog_enabled:
+            return await turn_watchdog.guard(turn, context, transcript, play)
+        return await turn
+
+    async def _handle_turn(
+            self,
+            context: ConversationContext,
+            state_machine: StateMachine,
+            transcript: str,
+            confidence: float
+    ) -> Optional[str]:
+        """Traiter un tour selon l'état actuel."""
         if context.state == ConversationState.GREETING:
             return await self._handle_greeting_state(context, state_machine, transcript)
 
@@ -103,6 +148,46 @@ class AgentOrchestrator:
 
         return None
 
+    async def _detect_intent(
+            self,
+            transcript: str,
+            default_intent: str,
+            routing_intents: Tuple[str, ...],
+    ) -> str:
+        """
+        Détecter l'intention: classifieur local, LLM seulement si incertain.
+
+        Args:
+            transcript: Transcription finale
+            default_intent: Intention traitée par défaut dans l'état courant
+            routing_intents: Intentions qui quittent le traitement par défaut
+                (seul un verdict incertain parmi elles justifie le LLM)
+
+        Returns:
+            Nom de l'intention
+        """
+        result = intent_classifier.classify(transcript)
+
+        # Confiance suffisante, ou verdict incertain qui ne change pas le routage
+        # (une ligne produit classée "unknown" reste une ligne produit)
+        if result["confidence"] >= settings.intent_confidence_threshold:
+            return result["intent"]
+        if result["intent"] not in routing_intents:
+            return default_intent
+
+        llm_result = await self.llm_client.analyze_intent(transcript)
+        print(
+            f"🧠 Intention incertaine ({result['intent']} {result['confidence']:.2f}) "
+            f"-> LLM: {llm_result.get('intent')}"
+        )
+
+        if llm_result.get("confidence", 0.0) >= result["confidence"]:
+            intent = llm_result.get("intent", "unknown")
+            # Les arbitrages du LLM alimentent le prochain entraînement local
+            await intent_classifier.log_example(transcript, intent)
+            return intent
+        return result["intent"]
+
     async def _handle_greeting_state(
             self,
             context: ConversationContext,
@@ -127,19 +212,30 @@ class AgentOrchestrator:
         """Gérer l'état COLLECTING - extraction de produits."""
 
         # Vérifier si l'utilisateur veut valider
-        transcript_lower = transcript.lower()
-        validation_keywords = ["c'est tout", "je valide", "confirme", "c'est bon", "terminé", "fini"]
+        intent = await self._detect_intent(
+            transcript,
+            default_intent="add_product",
+            routing_intents=("validate_order",),
+        )
+
+        if intent == "validate_order" and context.dictation_buffer:
+            # La dernière phrase peut porter des lignes ("... et 2 smecta, c'est tout")
+            context.dictation_buffer.append(transcript)
+            return await self._handle_dictation_end(context, state_machine)
 
-        if any(keyword in transcript_lower for keyword in validation_keywords):
+        if intent == "validate_order":
             # Transition vers CONFIRMING
             state_machine.transition(ConversationState.CONFIRMING, "Utilisateur demande validation")
 
-            # Générer récapitulatif
-            recap = dialogue_manager.format_recap(context.items)
-            response = dialogue_manager.generate_response(
-                ConversationState.CONFIRMING,
-                {"recap": recap}
-            )
+            # Générer récapitulatif (par pages pour une longue commande)
+            response = recap_engine.current_page(context, self.tts_client)
+            context.add_message("assistant", response)
+            return response
+
+        # Mode dictée: accumuler sans extraction ni recherche, accusé de réception local
+        if self._is_dictation_mode(context):
+            context.dictation_buffer.append(transcript)
+            response = dialogue_manager.generate_dictation_ack(len(context.dictation_buffer))
             context.add_message("assistant", response)
             return response
 
@@ -159,11 +255,29 @@ class AgentOrchestrator:
             context.add_message("assistant", response)
             return response
 
+        # Recherches catalogue du tour, partagées entre la cascade et le traitement
+        search_cache: Dict[str, list] = {}
+
+        async def search(product_name: str) -> list:
+            if product_name not in search_cache:
+                search_cache[product_name] = await self.qdrant_client.search_product(
+                    product_name, limit=3
+                )
+            return search_cache[product_name]
+
+        async def catalog_score(product_name: str) -> float:
+            results = await search(product_name)
+            return results[0]["score"] if results else 0.0
+
+        # Ligne de commande: mise de côté pour un conseiller si le tour est abandonné
+        context.pending_lines = [transcript]
+
         # Extraire le produit et la quantité avec LLM
         try:
             extraction = await self.llm_client.extract_order_items(
                 transcript,
-                {"conversation_history": context.conversation_history[-5:]}
+                {"conversation_history": context.conversation_history[-5:]},
+                catalog_scorer=catalog_score,
             )
 
             extracted_data = json.loads(extraction)
@@ -171,65 +285,20 @@ class AgentOrchestrator:
 
             if not products:
                 # Aucun produit détecté
-                response = "Je n'ai pas compris quel produit vous voulez. Pouvez-vous répéter ?"
+                response = dialogue_manager.PHRASES["product_not_understood"]
                 context.add_message("assistant", response)
                 return response
 
             # Traiter chaque produit
+            context.pending_lines = [self._describe_line(p) for p in products]
             responses = []
             for product_data in products:
-                product_name = product_data.get("name", "")
-                quantity = product_data.get("quantity", 1)
-                unit = product_data.get("unit", "boites")
-
-                # Rechercher le produit dans Qdrant
-                search_results = await self.qdrant_client.search_product(product_name, limit=3)
-
-                if not search_results:
-                    # Produit non trouvé
-                    response = dialogue_manager.generate_product_not_found_message(product_name)
-                    responses.append(response)
-                    continue
-
-                # Prendre le meilleur match
-                best_match = search_results[0]
-                matched_product = best_match["product"]
-                match_score = best_match["score"]
-
-                # Vérifier le stock
-                stock_available = await self.product_service.check_stock(
-                    matched_product["cip13"],
-                    quantity
-                )
-
-                if not stock_available:
-                    response = dialogue_manager.generate_out_of_stock_message(
-                        matched_product["name"]
-                    )
-                    responses.append(response)
-                    continue
-
-                # Ajouter l'item au contexte
-                item = {
-                    "product_name": matched_product["name"],
-                    "product_cip": matched_product["cip13"],
-                    "quantity": quantity,
-                    "unit": unit,
-                    "unit_price": matched_product.get("unit_price", 0),
-                    "confidence": match_score,
-                    "transcript": transcript,
-                }
-                context.add_item(item)
-
-                # Générer réponse
-                response = dialogue_manager.generate_response(
-                    ConversationState.COLLECTING,
-                    {
-                        "product": matched_product["name"],
-                        "quantity": quantity,
-                        "unit": unit,
-                    }
+                search_results = await search(product_data.get("name", ""))
+                _, response = await self._add_product_line(
+                    context, product_data, search_results, transcript
                 )
+                # Ligne traitée (ajoutée ou signalée): plus rien à mettre de côté
+                context.pending_lines.pop(0)
                 responses.append(response)
 
             final_response = " ".join(responses)
@@ -243,6 +312,156 @@ class AgentOrchestrator:
             context.add_message("assistant", response)
             return response
 
+    @staticmethod
+    def _describe_line(product_data: Dict[str, Any]) -> str:
+        """Ligne extraite lisible par un conseiller ("2 boites smecta")."""
+        return (
+            f"{product_data.get('quantity', 1)} {product_data.get('unit', 'boites')} "
+            f"{product_data.get('name', '')}"
+        )
+
+    async def _add_product_line(
+            self,
+            context: ConversationContext,
+            product_data: Dict[str, Any],
+            search_results: list,
+            transcript: str,
+    ) -> Tuple[bool, str]:
+        """
+        Rapprocher une ligne extraite du catalogue et l'ajouter à la commande.
+
+        Args:
+            context: Contexte de la conversation
+            product_data: Produit extrait par le LLM (name, quantity, unit)
+            search_results: Résultats de recherche catalogue pour ce produit
+            transcript: Transcription d'origine
+
+        Returns:
+            (ligne ajoutée, message à dire)
+        """
+        product_name = product_data.get("name", "")
+        quantity = product_data.get("quantity", 1)
+        unit = product_data.get("unit", "boites")
+
+        if not search_results:
+            # Produit non trouvé
+            return False, dialogue_manager.generate_product_not_found_message(product_name)
+
+        # Prendre le meilleur match
+        best_match = search_results[0]
+        matched_product = best_match["product"]
+        match_score = best_match["score"]
+
+        # Vérifier le stock
+        stock_available = await self.product_service.check_stock(
+            matched_product["cip13"],
+            quantity
+        )
+
+        if not stock_available:
+            return False, dialogue_manager.generate_out_of_stock_message(matched_product["name"])
+
+        # Ajouter l'item au contexte
+        item = {
+            "product_name": matched_product["name"],
+            "product_cip": matched_product["cip13"],
+            "quantity": quantity,
+            "unit": unit,
+            "unit_price": matched_product.get("unit_price", 0),
+            "confidence": match_score,
+            "transcript": transcript,
+        }
+        context.add_item(item)
+
+        # Générer réponse
+        response = dialogue_manager.generate_response(
+            ConversationState.COLLECTING,
+            {
+                "product": matched_product["name"],
+                "quantity": quantity,
+                "unit": unit,
+            }
+        )
+        return True, response
+
+    def _is_dictation_mode(self, context: ConversationContext) -> bool:
+        """Mode dictée actif pour cet appel (réglage global ou par appel)."""
+        return context.metadata.get("dictation_mode", settings.dictation_mode_enabled)
+
+    async def _handle_dictation_end(
+            self,
+            context: ConversationContext,
+            state_machine: StateMachine,
+    ) -> str:
+        """
+        Fin de dictée: une extraction LLM et une recherche catalogue groupée.
+
+        Args:
+            context: Contexte de la conversation
+            state_machine: Machine d'états
+
+        Returns:
+            Réponse (anomalies éventuelles + récapitulatif)
+        """
+        dictation = " ".join(context.dictation_buffer)
+        print(f"📋 Fin de dictée: {len(dictation)} caractères")
+
+        # Extraction longue (dictation_max_tokens): échéance propre, pas celle du tour
+        self.llm_client.turn_deadline = time.monotonic() + settings.dictation_llm_deadline
+        context.dictation_ending = True
+        context.pending_lines = list(context.dictation_buffer)
+
+        try:
+            extraction = await self.llm_client.extract_order_items(
+                dictation,
+                {"conversation_history": []},
+                max_tokens=settings.dictation_max_tokens,
+            )
+            products = json.loads(extraction).get("products", [])
+
+            names = [product_data.get("name", "") for product_data in products]
+            all_results = (
+                await self.qdrant_client.search_products_batch(names, limit=3) if names else []
+            )
+
+            # Lignes extraites: celles déjà ajoutées ne seront pas mises de côté
+            context.pending_lines = [self._describe_line(p) for p in products]
+            notices = []
+            for product_data, search_results in zip(products, all_results):
+                added, message = await self._add_product_line(
+                    context, product_data, search_results, dictation
+                )
+                context.pending_lines.pop(0)
+                if not added:
+                    notices.append(message)
+
+        except Exception as e:
+            print(f"❌ Erreur extraction dictée: {e}")
+            # Les lignes non ajoutées ne sont pas perdues: un conseiller les reprendra
+            context.review_queue.extend(context.pending_lines)
+            context.pending_lines = []
+            state_machine.transition(ConversationState.ERROR, str(e))
+            response = dialogue_manager.generate_response(ConversationState.ERROR)
+            context.add_message("assistant", response)
+            return response
+
+        finally:
+            # Succès, échec ou abandon: ce qui reste à traiter est dans pending_lines
+            context.dictation_buffer.clear()
+            context.dictation_ending = False
+
+        if not context.items:
+            response = dialogue_manager.PHRASES["nothing_recognized"]
+            context.add_message("assistant", response)
+            return response
+
+        state_machine.transition(ConversationState.CONFIRMING, "Fin de dictée")
+        notices.append(recap_engine.current_page(context, self.tts_client))
+
+        response = " ".join(notices)
+        context.add_message("assistant", response)
+        return response
+
     async def _handle_clarifying_state(
             self,
             context: ConversationContext,
@@ -263,10 +482,20 @@ class AgentOrchestrator:
     ) -> str:
         """Gérer l'état CONFIRMING - validation finale."""
 
-        transcript_lower = transcript.lower()
+        intent = await self._detect_intent(
+            transcript,
+            default_intent="modify_order",
+            routing_intents=("confirm", "validate_order", "add_product"),
+        )
 
         # Vérifier confirmation
-        if any(word in transcript_lower for word in ["oui", "ok", "valide", "confirme", "d'accord"]):
+        if intent in ("confirm", "validate_order"):
+            # Page du récapitulatif confirmée: lire la suivante avant de valider
+            next_page = recap_engine.confirm_page(context, self.tts_client)
+            if next_page is not None:
+                context.add_message("assistant", next_page)
+                return next_page
+
             # Transition vers PROCESSING
             state_machine.transition(ConversationState.PROCESSING, "Commande validée")
 
@@ -297,13 +526,13 @@ class AgentOrchestrator:
                 return response
 
         # Ajout de produits
-        elif any(word in transcript_lower for word in ["ajoute", "aussi", "encore", "en plus"]):
+        elif intent == "add_product":
             state_machine.transition(ConversationState.COLLECTING, "Ajout produits")
             return await self._handle_collecting_state(context, state_machine, transcript, 0.90)
 
         # Annulation
         else:
             state_machine.transition(ConversationState.COLLECTING, "Modification demandée")
-            response = "D'accord, que voulez-vous modifier ?"
+            response = dialogue_manager.PHRASES["modify_request"]
             context.add_message("assistant", response)
             return response
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""Récapitulatif progressif: commande lue et confirmée page par page."""
+from typing import Any, Dict, List, Optional
+
+from src.agent.dialogue_manager import dialogue_manager
+from src.agent.state_machine import ConversationContext, ConversationState
+from src.core.config import settings
+from src.services.tts.base import BaseTTSClient
+from src.services.tts.planner import TTSPlanner
+
+
+class RecapEngine:
+    """
+    Découpe le récapitulatif en pages courtes.
+
+    La page suivante est synthétisée pendant la lecture de la page en cours;
+    les lignes d'une page confirmée le restent si le pharmacien corrige une
+    page plus loin (le récapitulatif reprend à la première page non confirmée).
+    """
+
+    def __init__(self, page_size: int = 5):
+        """
+        Initialiser le moteur.
+
+        Args:
+            page_size: Lignes de commande par page
+        """
+        self.page_size = page_size
+
+    def _page_items(self, context: ConversationContext) -> List[Dict[str, Any]]:
+        """Lignes de la page en cours."""
+        start = context.recap_confirmed_lines
+        return context.items[start:start + self.page_size]
+
+    def _is_last_page(self, context: ConversationContext) -> bool:
+        return context.recap_confirmed_lines + self.page_size >= len(context.items)
+
+    def _page_text(self, context: ConversationContext, start: int) -> str:
+        """Texte de la page commençant à la ligne start."""
+        items = context.items[start:start + self.page_size]
+
+        # Commande courte: un seul récapitulatif, comme avant la pagination
+        if start == 0 and len(context.items) <= self.page_size:
+            recap = dialogue_manager.format_recap(items)
+            return dialogue_manager.generate_response(
+                ConversationState.CONFIRMING, {"recap": recap}
+            )
+
+        return dialogue_manager.format_recap_page(
+            items,
+            first=start == 0,
+            last=start + self.page_size >= len(context.items),
+        )
+
+    def current_page(
+            self, context: ConversationContext, tts_client: Optional[BaseTTSClient] = None
+    ) -> str:
+        """
+        Page à lire (première page non confirmée), et préchargement de la suivante.
+
+        Args:
+            context: Contexte de la conversation
+            tts_client: Client TTS pour précharger la page suivante
+
+        Returns:
+            Texte de la page
+        """
+        # Lignes retirées depuis la dernière lecture
+        context.recap_confirmed_lines = min(context.recap_confirmed_lines, len(context.items))
+
+        start = context.recap_confirmed_lines
+        next_start = start + self.page_size
+
+        if tts_client is not None and next_start < len(context.items):
+            TTSPlanner(tts_client).prefetch(self._page_text(context, next_start))
+
+        return self._page_text(context, start)
+
+    def confirm_page(
+            self, context: ConversationContext, tts_client: Optional[BaseTTSClient] = None
+    ) -> Optional[str]:
+        """
+        Confirmer la page en cours.
+
+        Args:
+            context: Contexte de la conversation
+            tts_client: Client TTS pour précharger la page d'après
+
+        Returns:
+            Page suivante, ou None si toute la commande est confirmée
+        """
+        last = self._is_last_page(context)
+        context.recap_confirmed_lines += len(self._page_items(context))
+
+        if last:
+            return None
+
+        print(f"📋 Récapitulatif: {context.recap_confirmed_lines}/{len(context.items)} lignes confirmées")
+        return self.current_page(context, tts_client)
+
+
+# Instance globale
+recap_engine = RecapEngine(page_size=settings.recap_page_size)
@@ -3,6 +3,8 @@ from enum import Enum
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from src.agent.usage import CallUsage
+
 
 class ConversationState(str, Enum):
     """États possibles de la conversation."""
@@ -30,7 +32,14 @@ class ConversationContext:
         self.conversation_history: list[Dict[str, str]] = []
         self.attempts = 0
         self.confidence_scores: list[float] = []
+        self.dictation_buffer: list[str] = []
+        self.dictation_ending = False
+        self.recap_confirmed_lines = 0
+        self.review_queue: list[str] = []
+        # Lignes du tour en cours pas encore ajoutées à la commande
+        self.pending_lines: list[str] = []
         self.metadata: Dict[str, Any] = {}
+        self.usage = CallUsage()
         self.started_at = datetime.utcnow()
         self.last_updated = datetime.utcnow()
 
@@ -74,6 +83,8 @@ class ConversationContext:
             "conversation_history": self.conversation_history,
             "attempts": self.attempts,
             "average_confidence": self.get_average_confidence(),
+            "usage": self.usage.to_dict(),
+            "review_queue": self.review_queue,
             "started_at": self.started_at.isoformat(),
             "last_updated": self.last_updated.isoformat(),
         }
@@ -0,0 +1,99 @@
+"""Comptabilité par appel: volume, latence et coût estimé de STT, LLM et TTS."""
+from typing import Dict, Any
+
+from src.core.config import settings
+
+
+class CallUsage:
+    """Consommation agrégée d'un appel, alimentée par les clients STT/LLM/TTS."""
+
+    STAGES = ("stt", "llm", "tts")
+
+    def __init__(self):
+        self.stt_audio_seconds = 0.0
+        self.llm_prompt_tokens = 0
+        self.llm_completion_tokens = 0
+        self.tts_characters = 0
+        self.llm_requests: list[Dict[str, Any]] = []
+        self.latencies: Dict[str, list[float]] = {stage: [] for stage in self.STAGES}
+
+    def record_stt_audio(self, seconds: float) -> None:
+        """Ajouter de l'audio envoyé au STT."""
+        self.stt_audio_seconds += seconds
+
+    def record_stt_latency(self, latency: float) -> None:
+        """Ajouter la latence d'une transcription finale."""
+        self.latencies["stt"].append(latency)
+
+    def record_llm(
+            self, model: str, prompt_tokens: int, completion_tokens: int, latency: float
+    ) -> None:
+        """
+        Ajouter une requête LLM.
+
+        Args:
+            model: Modèle utilisé
+            prompt_tokens: Tokens du prompt
+            completion_tokens: Tokens générés
+            latency: Latence (file d'attente incluse)
+        """
+        self.llm_prompt_tokens += prompt_tokens
+        self.llm_completion_tokens += completion_tokens
+        self.llm_requests.append({
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "latency": round(latency, 4),
+        })
+        self.latencies["llm"].append(latency)
+
+    def record_tts(self, characters: int, latency: float) -> None:
+        """
+        Ajouter une synthèse.
+
+        Args:
+            characters: Caractères synthétisés
+            latency: Latence jusqu'au premier chunk audio
+        """
+        self.tts_characters += characters
+        self.latencies["tts"].append(latency)
+
+    def estimated_cost(self) -> float:
+        """
+        Coût estimé de l'appel (USD).
+
+        Returns:
+            Somme des coûts STT, LLM et TTS
+        """
+        cost = self.stt_audio_seconds / 60 * settings.cost_stt_per_minute
+        cost += self.tts_characters / 1000 * settings.cost_tts_per_1k_characters
+
+        for request in self.llm_requests:
+            pricing = settings.llm_pricing.get(request["model"], {})
+            cost += request["prompt_tokens"] / 1_000_000 * pricing.get("prompt", 0.0)
+            cost += request["completion_tokens"] / 1_000_000 * pricing.get("completion", 0.0)
+
+        return cost
+
+    def latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Nombre, total et maximum des latences par étape."""
+        return {
+            stage: {
+                "count": len(values),
+                "total": round(sum(values), 4),
+                "max": round(max(values), 4) if values else 0.0,
+            }
+            for stage, values in self.latencies.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertir en dictionnaire."""
+        return {
+            "stt_audio_seconds": round(self.stt_audio_seconds, 3),
+            "llm_prompt_tokens": self.llm_prompt_tokens,
+            "llm_completion_tokens": self.llm_completion_tokens,
+            "tts_characters": self.tts_characters,
+            "estimated_cost": round(self.estimated_cost(), 6),
+            "latencies": self.latency_summary(),
+            "llm_requests": self.llm_requests,
+        }
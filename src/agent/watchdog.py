@@ -0,0 +1,133 @@
+"""Budget de latence par tour: phrase d'attente, puis repli au-delà de l'échéance."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from src.agent.dialogue_manager import dialogue_manager
+from src.agent.state_machine import ConversationContext, ConversationState
+from src.core.config import settings
+from src.utils.metrics import turn_latency, turn_budget_overruns_total, turn_degraded_total
+
+
+class LatencyWatchdog:
+    """
+    Surveille la durée d'un tour de dialogue.
+
+    Au-delà du budget, une phrase d'attente pré-rendue est jouée (le silence
+    au téléphone paraît bien plus long qu'il n'est). Au-delà de l'échéance,
+    le tour est abandonné: la ligne est mise de côté pour un conseiller, ou
+    le pharmacien est invité à répéter.
+    """
+
+    # États où l'abandon d'un tour ne perd qu'une ligne de commande
+    REVIEWABLE_STATES = (
+        ConversationState.GREETING,
+        ConversationState.COLLECTING,
+        ConversationState.CLARIFYING,
+    )
+
+    def __init__(
+            self,
+            soft_budget: float = 1.2,
+            hard_deadline: float = 6.0,
+            dictation_deadline: float = 40.0,
+    ):
+        """
+        Initialiser le watchdog.
+
+        Args:
+            soft_budget: Délai avant la phrase d'attente (secondes)
+            hard_deadline: Délai avant abandon du tour (secondes)
+            dictation_deadline: Délai avant abandon d'une fin de dictée (secondes)
+        """
+        self.soft_budget = soft_budget
+        self.hard_deadline = hard_deadline
+        self.dictation_deadline = dictation_deadline
+
+    def _degrade(self, context: ConversationContext) -> str:
+        """Réponse de repli quand le tour n'a pas abouti à temps."""
+        # Seules les lignes produit pas encore ajoutées: une ligne déjà dans la
+        # commande serait commandée deux fois, et "c'est tout" n'est pas un produit
+        lines = context.pending_lines
+        context.pending_lines = []
+
+        if lines and context.state in self.REVIEWABLE_STATES:
+            context.review_queue.extend(lines)
+            turn_degraded_total.labels(action="review").inc()
+            print(f"🗂️  Lignes mises de côté pour un conseiller: {' | '.join(lines)}")
+            response = dialogue_manager.PHRASES["review_queued"]
+        else:
+            turn_degraded_total.labels(action="repeat").inc()
+            response = dialogue_manager.PHRASES["repeat_request"]
+
+        context.add_message("assistant", response)
+        return response
+
+    async def guard(
+            self,
+            turn: Awaitable[Optional[str]],
+            context: ConversationContext,
+            transcript: str,
+            play: Callable[[str], Awaitable[None]],
+    ) -> Optional[str]:
+        """
+        Exécuter un tour sous budget.
+
+        Args:
+            turn: Traitement du tour (coroutine de l'orchestrateur)
+            context: Contexte de la conversation
+            transcript: Transcription du tour
+            play: Joue une phrase au pharmacien (phrase d'attente)
+
+        Returns:
+            Réponse du tour, ou réponse de repli
+        """
+        started_at = time.monotonic()
+        task = asyncio.ensure_future(turn)
+
+        done, _ = await asyncio.wait({task}, timeout=self.soft_budget)
+
+        if not done:
+            turn_budget_overruns_total.labels(kind="soft").inc()
+            filler = dialogue_manager.generate_filler(len(context.conversation_history))
+            try:
+                await play(filler)
+            except Exception as e:
+                print(f"⚠️  Phrase d'attente non jouée: {e}")
+
+            remaining = self.hard_deadline - (time.monotonic() - started_at)
+            done, _ = await asyncio.wait({task}, timeout=max(remaining, 0))
+
+        # Fin de dictée: extraction de toute la commande, budget propre
+        deadline = self.hard_deadline
+        if not done and context.dictation_ending:
+            deadline = self.dictation_deadline
+            remaining = deadline - (time.monotonic() - started_at)
+            done, _ = await asyncio.wait({task}, timeout=max(remaining, 0))
+
+        if not done:
+            # Une commande en cours de création ne s'abandonne pas
+            if context.state == ConversationState.PROCESSING:
+                response = await task
+                turn_latency.observe(time.monotonic() - started_at)
+                return response
+
+            turn_budget_overruns_total.labels(kind="hard").inc()
+            print(f"⏱️  Tour abandonné après {deadline:.1f}s: {transcript}")
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+            return self._degrade(context)
+
+        turn_latency.observe(time.monotonic() - started_at)
+        return task.result()
+
+
+# Instance globale
+turn_watchdog = LatencyWatchdog(
+    soft_budget=settings.turn_soft_budget,
+    hard_deadline=settings.turn_hard_deadline,
+    dictation_deadline=settings.dictation_hard_deadline,
+)
@@ -1,11 +1,69 @@
 """Point d'entrée principal de l'API FastAPI."""
+import asyncio
+import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.core.config import settings
-from src.utils.cache import cache
+from src.utils.cache import cache, binary_cache
 from src.api.routes import health, calls, orders, products, websocket
+from src.agent.dialogue_manager import dialogue_manager
+from src.services.llm.intent_classifier import intent_classifier
+from src.services.stt.spelling import spelling_corrector
+from src.services.tts.elevenlabs_client import ElevenLabsTTSClient
+from src.services.tts.phrase_bank import phrase_bank
+from src.services.tts.segments import segment_assembler
+from src.services.vector_db.catalog_sync import catalog_sync
+from src.services.vector_db.model_registry import model_registry
+from src.services.vector_db.qcadrant_client import qdrant_client
+
+
+async def warm_phrase_bank():
+    """Préchauffer les banques audio, en réessayant tant qu'elles ne sont pas prêtes."""
+    tts_client = ElevenLabsTTSClient()
+    phrases = dialogue_manager.static_phrases()
+
+    while not await phrase_bank.warm(tts_client, phrases):
+        await asyncio.sleep(settings.phrase_bank_retry_seconds)
+
+    # Segments ensuite: l'instance est déjà prête, les confirmations sont
+    # synthétisées en entier en attendant
+    if settings.tts_segments_enabled:
+        templates = dialogue_manager.SEGMENTED_TEMPLATES
+        while not await segment_assembler.warm(tts_client, templates):
+            await asyncio.sleep(settings.phrase_bank_retry_seconds)
+
+
+def rebuild_spelling_dictionary() -> None:
+    """Reconstruire le dictionnaire orthographique depuis le catalogue chargé (bloquant)."""
+    names = [p.get("name", "") for p in qdrant_client.local_index.payloads()]
+    words = spelling_corrector.build_from_catalog(names)
+    spelling_corrector.save(settings.spelling_dictionary_path)
+    print(f"✅ Dictionnaire orthographique reconstruit: {words} mots")
+
+
+async def refresh_local_index():
+    """
+    Charger l'index local du catalogue (vecteurs, lexical), puis le recharger
+    périodiquement ou dès que l'alias passe à une nouvelle collection.
+    """
+    loaded_collection, loaded_at = None, None
+    while True:
+        try:
+            collection = await qdrant_client.resolve_collection()
+        except Exception as e:
+            print(f"⚠️  Résolution de l'alias Qdrant impossible: {e}")
+            collection = loaded_collection
+
+        due = loaded_at is None or time.monotonic() - loaded_at >= settings.local_index_refresh_seconds
+        if due or collection != loaded_collection:
+            if await qdrant_client.load_local_index():
+                loaded_collection, loaded_at = collection, time.monotonic()
+                if settings.spelling_correction_enabled:
+                    await asyncio.to_thread(rebuild_spelling_dictionary)
+
+        await asyncio.sleep(settings.local_index_alias_check_seconds)
 
 
 @asynccontextmanager
@@ -14,13 +72,53 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Démarrage de l'application...")
     await cache.connect()
+    await binary_cache.connect()
     print("✅ Redis connecté")
 
+    # Classifieur d'intentions entraîné avant le premier tour, pas pendant
+    await asyncio.to_thread(intent_classifier.train)
+
+    # Dictionnaire de la dernière exécution: corrections dès le premier appel
+    if settings.spelling_correction_enabled:
+        await asyncio.to_thread(spelling_corrector.load, settings.spelling_dictionary_path)
+
+    # Instance hors rotation (/health/ready) tant que la banque n'est pas prête
+    warmup_task = None
+    if settings.phrase_bank_enabled:
+        warmup_task = asyncio.create_task(warm_phrase_bank())
+
+    # Modèle d'embeddings chargé avant le premier appel, pas pendant
+    model_task = None
+    if settings.embedding_warmup:
+        model_task = asyncio.create_task(model_registry.warmup())
+
+    # En attendant le chargement, les recherches interrogent Qdrant
+    index_task = None
+    if qdrant_client.local_index is not None:
+        index_task = asyncio.create_task(refresh_local_index())
+
+    # Modifications du catalogue répercutées au fil de l'eau
+    sync_task = None
+    if settings.catalog_sync_enabled:
+        sync_task = asyncio.create_task(catalog_sync.run(
+            settings.catalog_sync_interval_seconds, settings.catalog_sync_reconcile_seconds
+        ))
+
     yield
 
     # Shutdown
     print("🛑 Arrêt de l'application...")
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    if model_task and not model_task.done():
+        model_task.cancel()
+    if index_task and not index_task.done():
+        index_task.cancel()
+    if sync_task and not sync_task.done():
+        sync_task.cancel()
+    await qdrant_client.close()
     await cache.disconnect()
+    await binary_cache.disconnect()
     print("✅ Redis déconnecté")
 
 
@@ -1,11 +1,18 @@
 """Routes de health check et monitoring."""
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.data.database import get_db
 from src.utils.cache import cache
 from src.agent.call_manager import call_manager
 from src.agent.session import session_manager
+from src.core.config import settings
+from src.services.llm.scheduler import llm_scheduler
+from src.services.tts.phrase_bank import phrase_bank
+from src.services.vector_db.catalog_sync import catalog_sync
+from src.services.vector_db.model_registry import model_registry
+from src.services.vector_db.local_index import local_vector_index
+from src.services.vector_db.query_cache import query_embedding_cache
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -21,12 +28,14 @@ async def health_check():
 
 
 @router.get("/ready")
-async def readiness_check(db: AsyncSession = Depends(get_db)):
-    """Readiness check (database + redis)."""
+async def readiness_check(response: Response, db: AsyncSession = Depends(get_db)):
+    """Readiness check (database + redis + banque de phrases + modèle d'embeddings)."""
 
     checks = {
         "database": False,
         "redis": False,
+        "phrase_bank": phrase_bank.is_ready or not settings.phrase_bank_enabled,
+        "embedding_model": model_registry.is_loaded() or not settings.embedding_warmup,
     }
 
     # Check database
@@ -46,6 +55,10 @@ async def readiness_check(db: AsyncSession = Depends(get_db)):
 
     all_healthy = all(checks.values())
 
+    # 503: la sonde de readiness retire l'instance de la rotation
+    if not all_healthy:
+        response.status_code = 503
+
     return {
         "status": "ready" if all_healthy else "not_ready",
         "checks": checks
@@ -60,4 +73,9 @@ async def metrics():
         "active_calls": call_manager.get_active_calls_count(),
         "active_sessions": session_manager.get_active_sessions_count(),
         "max_concurrent_calls": call_manager.max_concurrent_calls,
+        "llm_scheduler": llm_scheduler.get_stats(),
+        "embedding_models": model_registry.get_stats(),
+        "query_embedding_cache": query_embedding_cache.get_stats(),
+        "local_vector_index": local_vector_index.get_stats(),
+        "catalog_sync": catalog_sync.get_stats(),
     }
\ No newline at end of file
@@ -2,6 +2,7 @@
 import json
 import base64
 import asyncio
+from typing import AsyncIterator, Union
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,7 +11,11 @@ from src.agent.orchestrator import AgentOrchestrator
 from src.agent.call_manager import call_manager
 from src.services.stt.deepgram_client import DeepgramSTTClient
 from src.services.llm.openai_client import OpenAIClient
-from src.services.tts.elevenlabs_client import ElevenLabsTTSClient
+from src.services.tts.caching_client import CachingTTSClient
+from src.services.tts.router import create_tts_router
+from src.agent.dialogue_manager import dialogue_manager
+from src.agent.state_machine import ConversationState
+from src.services.tts.planner import TTSPlanner
 from src.services.vector_db.qcadrant_client import qdrant_client
 from src.business.product_service import ProductService
 from src.business.order_service import OrderService
@@ -32,7 +37,13 @@ class VoiceWebSocketHandler:
         # Initialiser les services
         self.stt_client = DeepgramSTTClient()
         self.llm_client = OpenAIClient()
-        self.tts_client = ElevenLabsTTSClient()
+        # Fournisseur principal, repli sur un second fournisseur puis sur l'audio pré-rendu
+        self.tts_client = CachingTTSClient(
+            create_tts_router(
+                fallback_phrase=dialogue_manager.generate_response(ConversationState.ERROR)
+            )
+        )
+        self.tts_planner = TTSPlanner(self.tts_client)
 
         # Services métier
         self.product_service = ProductService(db)
@@ -80,7 +91,9 @@ class VoiceWebSocketHandler:
                 call_id=call_sid,
                 transcript=transcript,
                 is_final=is_final,
-                confidence=confidence
+                confidence=confidence,
+                # Phrase d'attente si le tour dépasse son budget de latence
+                play=self.send_tts_response,
             )
 
             if response_text and is_final:
@@ -119,31 +132,36 @@ class VoiceWebSocketHandler:
         # Fermer le STT
         await self.stt_client.close()
 
-    async def send_tts_response(self, text: str):
-        """Envoyer une réponse TTS."""
-        print(f"🔊 TTS: {text}")
-
-        # Générer l'audio avec ElevenLabs
-        audio_chunks = []
-        async for chunk in self.tts_client.text_to_speech_stream(text):
-            audio_chunks.append(chunk)
-
-        # Combiner les chunks
-        full_audio = b"".join(audio_chunks)
-
-        # Encoder en base64
-        audio_base64 = base64.b64encode(full_audio).decode("utf-8")
-
-        # Envoyer l'audio
-        message = {
-            "event": "media",
-            "streamSid": self.stream_sid,
-            "media": {
-                "payload": audio_base64
+    async def send_tts_response(self, text: Union[str, AsyncIterator[str]]):
+        """
+        Envoyer une réponse TTS.
+
+        Args:
+            text: Réponse complète, ou flux de tokens LLM (generate_response_stream)
+        """
+        if isinstance(text, str):
+            print(f"🔊 TTS: {text}")
+            # Segments synthétisés en parallèle, envoyés dans l'ordre dès qu'ils arrivent
+            audio_stream = self.tts_planner.stream(text)
+        else:
+            print("🔊 TTS: réponse LLM en streaming")
+            # L'audio de la première phrase part pendant que le LLM génère la suite
+            audio_stream = self.tts_client.text_stream_to_speech(text)
+
+        async for chunk in audio_stream:
+            # Encoder en base64
+            audio_base64 = base64.b64encode(chunk).decode("utf-8")
+
+            # Envoyer l'audio
+            message = {
+                "event": "media",
+                "streamSid": self.stream_sid,
+                "media": {
+                    "payload": audio_base64
+                }
             }
-        }
 
-        await self.websocket.send_json(message)
+            await self.websocket.send_json(message)
 
 
 @router.websocket("/ws/voice")
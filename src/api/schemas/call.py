@@ -28,6 +28,11 @@ class CallResponse(CallBase):
     agent_version: str
     started_at: datetime
     ended_at: Optional[datetime] = None
+    stt_audio_seconds: Optional[float] = None
+    llm_prompt_tokens: Optional[int] = None
+    llm_completion_tokens: Optional[int] = None
+    tts_characters: Optional[int] = None
+    estimated_cost: Optional[float] = None
 
 
 class CallStats(BaseModel):
@@ -5,6 +5,9 @@
 """Conversion de formats audio."""
 import base64
 import audioop
+from typing import List
+
+import numpy as np
 
 
 class AudioFormatConverter:
@@ -86,3 +89,69 @@ class AudioFormatConverter:
         return audioop.ratecv(
             audio_data, sample_width, 1, orig_rate, new_rate, None
         )[0]
+
+    @staticmethod
+    def trim_silence(
+            pcm_data: bytes,
+            threshold: int = 500,
+            keep_ms: int = 20,
+            sample_rate: int = 8000,
+    ) -> bytes:
+        """
+        Retirer le silence en début et fin de segment (PCM 16 bits mono).
+
+        Args:
+            pcm_data: Données PCM
+            threshold: Amplitude sous laquelle un échantillon est du silence
+            keep_ms: Marge de silence conservée de chaque côté
+            sample_rate: Fréquence d'échantillonnage
+
+        Returns:
+            Données PCM rognées
+        """
+        samples = np.frombuffer(pcm_data, dtype=np.int16)
+        loud = np.flatnonzero(np.abs(samples.astype(np.int32)) > threshold)
+        if loud.size == 0:
+            return pcm_data
+
+        keep = sample_rate * keep_ms // 1000
+        start = max(int(loud[0]) - keep, 0)
+        end = min(int(loud[-1]) + keep + 1, len(samples))
+        return samples[start:end].tobytes()
+
+    @staticmethod
+    def crossfade(
+            pcm_segments: List[bytes],
+            overlap_ms: int = 10,
+            sample_rate: int = 8000,
+    ) -> bytes:
+        """
+        Concaténer des segments PCM 16 bits avec un fondu enchaîné linéaire.
+
+        Args:
+            pcm_segments: Segments PCM dans l'ordre
+            overlap_ms: Durée du recouvrement entre deux segments
+            sample_rate: Fréquence d'échantillonnage
+
+        Returns:
+            Données PCM concaténées
+        """
+        overlap = sample_rate * overlap_ms // 1000
+        parts: List[np.ndarray] = []
+        tail = np.zeros(0, dtype=np.float32)
+
+        for segment in pcm_segments:
+            samples = np.frombuffer(segment, dtype=np.int16).astype(np.float32)
+            n = min(overlap, len(tail), len(samples))
+
+            if n:
+                ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+                parts.append(tail[:-n])
+                parts.append(tail[-n:] * (1.0 - ramp) + samples[:n] * ramp)
+            else:
+                parts.append(tail)
+            tail = samples[n:]
+
+        parts.append(tail)
+        mixed = np.concatenate(parts)
+        return np.clip(mixed, -32768, 32767).astype(np.int16).tobytes()
@@ -1,5 +1,5 @@
 """Configuration centralisée de l'application."""
-from typing import List
+from typing import Dict, List
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -40,11 +40,75 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-4o"
     openai_temperature: float = 0.3
     openai_max_tokens: int = 1000
+    openai_fast_model: str = "gpt-4o-mini"
+
+    # Cascade d'extraction (petit modèle, escalade si doute)
+    llm_cascade_enabled: bool = True
+    llm_cascade_min_confidence: float = 0.7
+    llm_cascade_min_catalog_score: float = 0.6
+
+    # Mode dictée: extraction groupée en fin de commande
+    dictation_mode_enabled: bool = Field(default=False, alias="DICTATION_MODE_ENABLED")
+    dictation_max_tokens: int = 4000
+    # Extraction de toute la dictée: échéances propres, hors budget d'un tour
+    dictation_llm_deadline: float = 30.0
+    dictation_hard_deadline: float = 40.0
+
+    # Budget de latence par tour (phrase d'attente, puis repli)
+    turn_watchdog_enabled: bool = True
+    turn_soft_budget: float = 1.2
+    turn_hard_deadline: float = 6.0
+
+    # Récapitulatif par pages
+    recap_page_size: int = 5
+
+    # Ordonnanceur LLM (partagé par tous les appels du process)
+    llm_max_concurrency: int = 8
+    llm_tokens_per_minute: int = 300000
+    llm_request_timeout: float = 10.0
+    llm_turn_deadline: float = 4.0
+    llm_hedge_enabled: bool = True
+    llm_hedge_quantile: float = 0.95
+    llm_hedge_min_delay: float = 0.5
+    llm_hedge_default_delay: float = 2.0
+
+    # Intentions (classifieur local, LLM en dernier recours)
+    intent_confidence_threshold: float = 0.75
+    intent_training_data_path: str = Field(default="", alias="INTENT_TRAINING_DATA_PATH")
     
     # ElevenLabs
     elevenlabs_api_key: str = Field(default="", alias="ELEVENLABS_API_KEY")
     elevenlabs_voice_id: str = Field(default="", alias="ELEVENLABS_VOICE_ID")
     elevenlabs_model: str = "eleven_turbo_v2_5"
+    elevenlabs_output_format: str = "ulaw_8000"  # Format opérateur (mu-law 8 kHz)
+    elevenlabs_stream_input_url: str = "wss://api.elevenlabs.io/v1/text-to-speech"
+
+    # Cache audio TTS (mémoire + Redis binaire)
+    tts_cache_ttl: int = 86400
+    tts_cache_memory_max_bytes: int = 64 * 1024 * 1024
+    tts_cache_compression: bool = True
+
+    # Banque de phrases pré-synthétisées
+    phrase_bank_enabled: bool = True
+    phrase_bank_dir: str = "data/phrase_bank"
+    phrase_bank_retry_seconds: int = 30
+
+    # Planification TTS (synthèse parallèle par phrases)
+    tts_planner_max_segment_chars: int = 150
+
+    # Routage TTS (limites fournisseur, délais de premier chunk, repli)
+    tts_max_concurrency: int = 4
+    tts_first_chunk_deadline: float = 1.0
+    tts_secondary_provider: str = "elevenlabs"  # elevenlabs (modèle rapide), local, ou vide
+    tts_secondary_model: str = "eleven_flash_v2_5"
+    tts_secondary_max_concurrency: int = 4  # fournisseur distinct seulement (ElevenLabs: tts_max_concurrency partagé)
+    tts_secondary_first_chunk_deadline: float = 1.5
+
+    # TTS concaténatif (confirmations assemblées par segments)
+    tts_segments_enabled: bool = True
+    segment_bank_dir: str = "data/segment_bank"
+    tts_segments_max_quantity: int = 1000
+    tts_segments_crossfade_ms: int = 10
 
     # Telnyx (remplace Twilio)
     telnyx_api_key: str = Field(..., alias="TELNYX_API_KEY")
@@ -57,6 +121,68 @@ class Settings(BaseSettings):
     qdrant_port: int = 6333
     qdrant_api_key: str | None = None
     qdrant_collection: str = "products"
+    # gRPC (canal HTTP/2 partagé) si le serveur l'expose, sinon REST
+    qdrant_prefer_grpc: bool = True
+    qdrant_grpc_port: int = 6334
+    qdrant_timeout: float = 5.0
+    qdrant_search_timeout: float = 1.0
+    qdrant_max_attempts: int = 3
+    qdrant_retry_base_delay: float = 0.1
+    qdrant_retry_max_delay: float = 2.0
+
+    # Recherche vectorielle: "local" (copie en mémoire de la collection) ou "qdrant"
+    vector_search_backend: str = "local"
+    local_index_refresh_seconds: int = 600
+    local_index_alias_check_seconds: int = 30
+
+    # Recherche hybride (BM25 sur n-grammes + vecteurs, fusion RRF, dosage)
+    hybrid_search_enabled: bool = True
+    hybrid_rrf_k: int = 60
+    hybrid_candidates: int = 20
+    hybrid_semantic_floor: float = 0.3
+
+    # Index phonétique (noms de produits mal transcrits)
+    phonetic_search_enabled: bool = True
+    phonetic_min_similarity: float = 0.75
+
+    # Correction orthographique des transcriptions (SymSpell sur le vocabulaire du catalogue)
+    spelling_correction_enabled: bool = True
+    spelling_dictionary_path: str = "data/spelling_dictionary.pkl"
+    spelling_max_edit_distance: int = 2
+
+    # Modèle d'embeddings (chargé une fois par process, voir ModelRegistry)
+    embedding_model_name: str = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
+    embedding_vector_size: int = 768
+    embedding_model_version: str = "1"
+    embedding_warmup: bool = True
+    embedding_batch_window_ms: float = 5.0
+    embedding_max_batch_size: int = 32
+    embedding_workers: int = 1
+
+    # Cache des embeddings de requêtes
+    embedding_cache_max_entries: int = 10_000
+    embedding_cache_redis: bool = True
+    embedding_cache_ttl: int = 7 * 24 * 3600
+
+    # Indexation du catalogue
+    indexer_batch_size: int = 256
+    indexer_encode_batch_size: int = 64
+    indexer_max_inflight_upserts: int = 4
+    indexer_checkpoint_path: str = "data/index_checkpoint.json"
+
+    # Réindexation blue/green (collection versionnée derrière l'alias qdrant_collection)
+    reindex_min_recall: float = 0.9
+    reindex_smoke_sample: int = 50
+    reindex_validation_timeout: float = 60.0
+    reindex_keep_previous: bool = True
+
+    # Synchronisation incrémentale du catalogue (Product.updated_at)
+    catalog_sync_enabled: bool = True
+    catalog_sync_interval_seconds: int = 30
+    catalog_sync_reconcile_seconds: int = 300
+    catalog_sync_batch_size: int = 256
+    catalog_sync_overlap_seconds: float = 5.0
+    catalog_sync_max_delete_ratio: float = 0.2
     
     # ERP
     erp_api_url: str = Field(default="http://localhost:8080", alias="ERP_API_URL")
@@ -73,6 +199,14 @@ class Settings(BaseSettings):
     audio_buffer_size: int = 320
     vad_aggressiveness: int = 2
 
+    # Coûts estimés (USD) pour la comptabilité par appel
+    cost_stt_per_minute: float = 0.0043
+    cost_tts_per_1k_characters: float = 0.18
+    llm_pricing: Dict[str, Dict[str, float]] = {
+        "gpt-4o": {"prompt": 2.50, "completion": 10.00},  # par million de tokens
+        "gpt-4o-mini": {"prompt": 0.15, "completion": 0.60},
+    }
+
     # Brevo Email
     brevo_api_key: str = Field(default="", alias="BREVO_API_KEY")
     brevo_sender_email: str = Field(default="noreply@heyi.local", alias="BREVO_SENDER_EMAIL")
@@ -0,0 +1,33 @@
+"""Call usage accounting
+
+Revision ID: 002_call_usage
+Revises: 001_initial
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_call_usage'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('calls', sa.Column('stt_audio_seconds', sa.Float(), nullable=True))
+    op.add_column('calls', sa.Column('llm_prompt_tokens', sa.Integer(), nullable=True))
+    op.add_column('calls', sa.Column('llm_completion_tokens', sa.Integer(), nullable=True))
+    op.add_column('calls', sa.Column('tts_characters', sa.Integer(), nullable=True))
+    op.add_column('calls', sa.Column('estimated_cost', sa.Float(), nullable=True))
+    op.add_column('calls', sa.Column('usage_details', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('calls', 'usage_details')
+    op.drop_column('calls', 'estimated_cost')
+    op.drop_column('calls', 'tts_characters')
+    op.drop_column('calls', 'llm_completion_tokens')
+    op.drop_column('calls', 'llm_prompt_tokens')
+    op.drop_column('calls', 'stt_audio_seconds')
@@ -0,0 +1,26 @@
+"""Index on products.updated_at for incremental catalog sync
+
+Revision ID: 003_product_updated_at
+Revises: 002_call_usage
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003_product_updated_at'
+down_revision = '002_call_usage'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lignes sans date: invisibles pour la synchronisation incrémentale
+    op.execute(
+        "UPDATE products SET updated_at = COALESCE(created_at, now()) WHERE updated_at IS NULL"
+    )
+    op.create_index('ix_products_updated_at', 'products', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_updated_at', table_name='products')
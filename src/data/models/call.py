@@ -1,6 +1,6 @@
 """Modèle Call."""
 from datetime import datetime
-from sqlalchemy import String, Integer, Float, DateTime, Text, ForeignKey
+from sqlalchemy import String, Integer, Float, DateTime, Text, ForeignKey, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.data.database import Base
@@ -23,5 +23,13 @@ class Call(Base):
     started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     ended_at: Mapped[datetime | None] = mapped_column(DateTime)
 
+    # Consommation (voir CallUsage)
+    stt_audio_seconds: Mapped[float | None] = mapped_column(Float)
+    llm_prompt_tokens: Mapped[int | None] = mapped_column(Integer)
+    llm_completion_tokens: Mapped[int | None] = mapped_column(Integer)
+    tts_characters: Mapped[int | None] = mapped_column(Integer)
+    estimated_cost: Mapped[float | None] = mapped_column(Float)
+    usage_details: Mapped[dict | None] = mapped_column(JSON)
+
     # Relation
     pharmacy: Mapped["Pharmacy"] = relationship("Pharmacy")
\ No newline at end of file
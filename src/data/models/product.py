@@ -1,6 +1,6 @@
 """Modèle Product."""
 from datetime import datetime
-from sqlalchemy import String, Float, Integer, DateTime
+from sqlalchemy import String, Float, Integer, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.data.database import Base
@@ -10,6 +10,8 @@ class Product(Base):
     """Modèle pour les produits pharmaceutiques."""
 
     __tablename__ = "products"
+    # Lignes modifiées par ordre (updated_at, id): synchronisation incrémentale
+    __table_args__ = (Index("ix_products_updated_at", "updated_at", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     cip13: Mapped[str] = mapped_column(String(13), unique=True, index=True)
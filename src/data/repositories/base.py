@@ -23,9 +23,9 @@ class BaseRepository(Generic[ModelType]):
         return result.scalar_one_or_none()
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
-        """Récupérer tous les enregistrements."""
+        """Récupérer tous les enregistrements (ordre stable pour la pagination)."""
         result = await self.session.execute(
-            select(self.model).offset(skip).limit(limit)
+            select(self.model).order_by(self.model.id).offset(skip).limit(limit)
         )
         return list(result.scalars().all())
 
@@ -8,7 +8,13 @@ from src.services.llm import (
     FUNCTION_SCHEMAS,
 )
 from src.services.stt import DeepgramSTTClient, BaseSTTClient
-from src.services.tts import ElevenLabsTTSClient, BaseTTSClient, TTSCache, tts_cache
+from src.services.tts import (
+    ElevenLabsTTSClient,
+    BaseTTSClient,
+    TTSCache,
+    tts_cache,
+    CachingTTSClient,
+)
 from src.services.vector_db import (
     qdrant_client,
     QdrantClient,
@@ -35,6 +41,7 @@ __all__ = [
     "BaseTTSClient",
     "TTSCache",
     "tts_cache",
+    "CachingTTSClient",
     # Vector DB
     "qdrant_client",
     "QdrantClient",
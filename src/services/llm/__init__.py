@@ -3,6 +3,9 @@ from src.services.llm.openai_client import OpenAIClient
 from src.services.llm.base import BaseLLMClient
 from src.services.llm.prompts import SYSTEM_PROMPTS, get_extraction_prompt, get_dialogue_prompt
 from src.services.llm.functions import FUNCTION_SCHEMAS
+from src.services.llm.intent_classifier import IntentClassifier, intent_classifier
+from src.services.llm.scheduler import LLMScheduler, llm_scheduler
+from src.services.llm.cascade import ExtractionCascade, extraction_cascade
 
 __all__ = [
     "OpenAIClient",
@@ -11,4 +14,10 @@ __all__ = [
     "get_extraction_prompt",
     "get_dialogue_prompt",
     "FUNCTION_SCHEMAS",
+    "IntentClassifier",
+    "intent_classifier",
+    "LLMScheduler",
+    "llm_scheduler",
+    "ExtractionCascade",
+    "extraction_cascade",
 ]
@@ -0,0 +1,180 @@
+"""Cascade de modèles pour l'extraction: petit modèle d'abord, escalade si doute."""
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.core.config import settings
+from src.services.llm.functions import FUNCTION_SCHEMAS
+from src.utils.metrics import (
+    llm_cascade_stage_latency,
+    llm_cascade_escalations_total,
+    llm_cascade_requests_total,
+)
+
+JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "array": list,
+    "object": dict,
+}
+
+
+def validate_against_schema(value: Any, schema: Dict[str, Any], path: str = "$") -> Optional[str]:
+    """
+    Valider une valeur contre un sous-ensemble de JSON Schema (type, required, enum).
+
+    Args:
+        value: Valeur à valider
+        schema: Schéma (format FUNCTION_SCHEMAS)
+        path: Chemin courant (pour le message d'erreur)
+
+    Returns:
+        Message d'erreur, ou None si valide
+    """
+    expected = schema.get("type")
+    if expected:
+        # bool est un int en Python: on le refuse explicitement
+        if isinstance(value, bool) or not isinstance(value, JSON_TYPES[expected]):
+            return f"{path}: type {type(value).__name__} au lieu de {expected}"
+
+    if "enum" in schema and value not in schema["enum"]:
+        return f"{path}: valeur hors enum ({value})"
+
+    if expected == "object":
+        for key in schema.get("required", []):
+            if key not in value:
+                return f"{path}.{key}: champ requis manquant"
+        for key, sub_schema in schema.get("properties", {}).items():
+            if key in value:
+                error = validate_against_schema(value[key], sub_schema, f"{path}.{key}")
+                if error:
+                    return error
+
+    if expected == "array" and "items" in schema:
+        for i, item in enumerate(value):
+            error = validate_against_schema(item, schema["items"], f"{path}[{i}]")
+            if error:
+                return error
+
+    return None
+
+
+class ExtractionCascade:
+    """Essaie les modèles du plus rapide au plus capable, valide chaque sortie."""
+
+    def __init__(
+            self,
+            models: List[str],
+            min_confidence: float = 0.7,
+            min_catalog_score: float = 0.6,
+    ):
+        """
+        Initialiser la cascade.
+
+        Args:
+            models: Modèles par ordre d'essai (le dernier est accepté tel quel)
+            min_confidence: Confiance déclarée minimale par produit
+            min_catalog_score: Score catalogue minimal du meilleur match par produit
+        """
+        self.models = models
+        self.min_confidence = min_confidence
+        self.min_catalog_score = min_catalog_score
+        self.schema = FUNCTION_SCHEMAS["extract_order"]["parameters"]
+
+    async def validate(
+            self,
+            raw: str,
+            catalog_scorer: Optional[Callable[[str], Awaitable[float]]] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Valider une extraction.
+
+        Args:
+            raw: Sortie JSON du modèle
+            catalog_scorer: Fonction async nom -> score du meilleur match catalogue
+
+        Returns:
+            (valide, raison de l'escalade)
+        """
+        try:
+            data = json.loads(raw)
+        except (TypeError, json.JSONDecodeError):
+            return False, "invalid_json"
+
+        error = validate_against_schema(data, self.schema)
+        if error:
+            print(f"⚠️  Extraction hors schéma: {error}")
+            return False, "schema"
+
+        # Liste vide conforme au schéma: tour sans produit ("bonjour", "attendez"),
+        # acceptée sans escalade
+        for product in data["products"]:
+            if product["quantity"] <= 0 or not product["name"].strip():
+                return False, "schema"
+
+            if product.get("confidence", 1.0) < self.min_confidence:
+                return False, "low_confidence"
+
+            if catalog_scorer is not None:
+                score = await catalog_scorer(product["name"])
+                if score < self.min_catalog_score:
+                    return False, "catalog_mismatch"
+
+        return True, ""
+
+    async def run(
+            self,
+            call_model: Callable[[str], Awaitable[str]],
+            catalog_scorer: Optional[Callable[[str], Awaitable[float]]] = None,
+    ) -> str:
+        """
+        Exécuter la cascade.
+
+        Args:
+            call_model: Fonction async modèle -> sortie JSON brute
+            catalog_scorer: Fonction async nom -> score catalogue
+
+        Returns:
+            Sortie JSON retenue
+        """
+        raw = json.dumps({"products": []})
+
+        for stage, model in enumerate(self.models):
+            is_last = stage == len(self.models) - 1
+            started_at = time.monotonic()
+
+            try:
+                raw = await call_model(model)
+            except Exception as e:
+                print(f"❌ Cascade {model}: {e}")
+                llm_cascade_stage_latency.labels(model=model).observe(
+                    time.monotonic() - started_at
+                )
+                if is_last:
+                    raise
+                llm_cascade_escalations_total.labels(reason="error").inc()
+                continue
+
+            llm_cascade_stage_latency.labels(model=model).observe(time.monotonic() - started_at)
+
+            if is_last:
+                break
+
+            valid, reason = await self.validate(raw, catalog_scorer)
+            if valid:
+                break
+
+            print(f"⬆️  Escalade extraction {model} -> {self.models[stage + 1]} ({reason})")
+            llm_cascade_escalations_total.labels(reason=reason).inc()
+
+        llm_cascade_requests_total.labels(model=model).inc()
+        return raw
+
+
+# Instance globale
+extraction_cascade = ExtractionCascade(
+    models=[settings.openai_fast_model, settings.openai_model],
+    min_confidence=settings.llm_cascade_min_confidence,
+    min_catalog_score=settings.llm_cascade_min_catalog_score,
+)
@@ -30,6 +30,10 @@ FUNCTION_SCHEMAS = {
                                 "enum": ["boites", "unités", "flacons"],
                                 "description": "Unité",
                             },
+                            "confidence": {
+                                "type": "number",
+                                "description": "Certitude sur le nom et la quantité (0 à 1)",
+                            },
                         },
                         "required": ["name", "quantity"],
                     },
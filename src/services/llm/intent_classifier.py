@@ -0,0 +1,419 @@
+"""Classification locale des intentions (motifs + TF-IDF / régression logistique)."""
+import asyncio
+import json
+import math
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.config import settings
+
+
+# Intentions reconnues (mêmes noms que OpenAIClient.analyze_intent)
+INTENTS = [
+    "add_product",
+    "validate_order",
+    "confirm",
+    "modify_order",
+    "cancel",
+    "unknown",
+]
+
+# Mots d'acquiescement: "confirm" seulement si la phrase n'est faite que d'eux
+# ("oui c'est tout" valide la commande, "oui ajoute..." ajoute un produit)
+AFFIRMATIONS = [
+    r"oui",
+    r"ok",
+    r"okay",
+    r"d'? ?accord",
+    r"parfait",
+    r"exact(?:ement)?",
+    r"tout a fait",
+    r"c'? ?est (?:bien )?ca",
+    r"bien sur",
+]
+
+# Intentions qui font avancer la commande: jamais retenues sur une phrase niée
+# ("je ne valide pas", "pas fini")
+AFFIRMATIVE_INTENTS = ("validate_order", "confirm")
+NEGATION_PATTERN = re.compile(r"\b(?:pas|non)\b")
+
+# Motifs à frontières de mots (évite de matcher "ok" dans "stock").
+# L'apostrophe est optionnelle: la transcription rend parfois "c est tout".
+INTENT_PATTERNS = {
+    "validate_order": [
+        r"c'? ?est tout",
+        r"valide[rz]?",
+        # En fin de phrase: "confirmez-moi le prix..." est une question
+        r"confirme[rz]?(?: (?:la|ma) commande)?(?: merci)?$",
+        r"c'? ?est bon",
+        r"termin[eé]",
+        r"fini",
+        r"ce sera tout",
+        r"rien d'? ?autre",
+        r"(?:envoie[sz]?|envoye[rz])(?: (?:la|ma) commande| tout)?(?: merci)?$",
+    ],
+    "confirm": [
+        # "merci" seul ne confirme rien: accepté seulement en fin de phrase
+        r"^(?:(?:" + "|".join(AFFIRMATIONS) + r") ?)+(?:merci(?: beaucoup)?)?$",
+    ],
+    "modify_order": [
+        r"modifie[rz]?",
+        r"change[rz]?",
+        r"enleve[rz]?",
+        r"retire[rz]?",
+        r"remplace[rz]?",
+        r"corrige[rz]?",
+    ],
+    "cancel": [
+        r"annule[rz]?",
+        r"laisse tomber",
+        r"oublie[rz]? (?:tout|la commande)",
+    ],
+    "add_product": [
+        r"ajoute[rz]?",
+        r"aussi",
+        r"encore",
+        r"en plus",
+    ],
+}
+
+# Exemples d'amorçage, complétés par les transcriptions journalisées
+SEED_EXAMPLES: List[Tuple[str, str]] = [
+    ("10 boites de doliprane 1000", "add_product"),
+    ("je voudrais 5 spasfon lyoc", "add_product"),
+    ("deux flacons de toplexil", "add_product"),
+    ("mettez moi 3 efferalgan", "add_product"),
+    ("il me faudrait du dafalgan 500", "add_product"),
+    ("ajoute 4 boites de smecta", "add_product"),
+    ("et aussi 2 gaviscon", "add_product"),
+    ("c'est tout merci", "validate_order"),
+    ("ce sera tout pour aujourd'hui", "validate_order"),
+    ("je valide la commande", "validate_order"),
+    ("c'est bon pour moi", "validate_order"),
+    ("j'ai fini", "validate_order"),
+    ("je confirme", "validate_order"),
+    ("c est tout", "validate_order"),
+    ("oui c'est tout", "validate_order"),
+    ("non c'est tout merci", "validate_order"),
+    ("ok c'est bon vous pouvez envoyer", "validate_order"),
+    ("envoie la commande", "validate_order"),
+    ("oui", "confirm"),
+    ("oui c'est ça", "confirm"),
+    ("ok parfait", "confirm"),
+    ("d'accord", "confirm"),
+    ("tout à fait", "confirm"),
+    ("oui merci", "confirm"),
+    ("non change la quantité de doliprane", "modify_order"),
+    ("enlève le spasfon", "modify_order"),
+    ("remplace par du dafalgan", "modify_order"),
+    ("non ce n'est pas ça", "modify_order"),
+    ("je ne valide pas", "modify_order"),
+    ("attendez j'ai pas fini", "add_product"),
+    ("annule la commande", "cancel"),
+    ("laisse tomber", "cancel"),
+    ("oubliez tout", "cancel"),
+    ("allô", "unknown"),
+    ("merci", "unknown"),
+    ("merci beaucoup", "unknown"),
+    ("vous m'entendez", "unknown"),
+    ("attendez deux secondes", "unknown"),
+    ("confirmez-moi le prix du doliprane", "unknown"),
+    ("vous pouvez me confirmer le délai de livraison", "unknown"),
+]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normaliser un texte pour la classification.
+
+    Args:
+        text: Texte brut
+
+    Returns:
+        Texte en minuscules, sans accents ni ponctuation superflue
+    """
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = text.replace("’", "'")
+    text = re.sub(r"[^\w' ]+", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Découper un texte normalisé en features (unigrammes + bigrammes).
+
+    Args:
+        text: Texte normalisé
+
+    Returns:
+        Liste de features
+    """
+    words = ["<num>" if w.isdigit() else w for w in re.findall(r"[\w']+", text)]
+    bigrams = [f"{a}_{b}" for a, b in zip(words, words[1:])]
+    return words + bigrams
+
+
+class TfidfLogisticModel:
+    """Classifieur TF-IDF + régression logistique multinomiale (CPU, sans dépendance)."""
+
+    def __init__(self):
+        self.classes: List[str] = []
+        self.idf: Dict[str, float] = {}
+        # Poids par feature: vecteur de scores par classe
+        self.weights: Dict[str, np.ndarray] = {}
+        self.bias: np.ndarray = np.zeros(0)
+
+    @property
+    def is_trained(self) -> bool:
+        """Le modèle a-t-il été entraîné."""
+        return bool(self.classes)
+
+    def _vectorize(self, tokens: List[str]) -> Dict[str, float]:
+        """Vecteur TF-IDF (normalisé L2) sous forme creuse."""
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            if token in self.idf:
+                counts[token] = counts.get(token, 0) + 1
+
+        vector = {t: c * self.idf[t] for t, c in counts.items()}
+        norm = math.sqrt(sum(v * v for v in vector.values()))
+        if norm:
+            vector = {t: v / norm for t, v in vector.items()}
+        return vector
+
+    def fit(
+            self,
+            examples: List[Tuple[str, str]],
+            epochs: int = 200,
+            learning_rate: float = 0.5,
+            l2: float = 1e-3,
+    ) -> None:
+        """
+        Entraîner le modèle.
+
+        Args:
+            examples: Couples (texte, intention)
+            epochs: Nombre d'itérations de descente de gradient
+            learning_rate: Pas d'apprentissage
+            l2: Régularisation L2
+        """
+        documents = [tokenize(normalize_text(text)) for text, _ in examples]
+        labels = [intent for _, intent in examples]
+
+        self.classes = sorted(set(labels))
+        vocabulary = sorted({t for doc in documents for t in doc})
+        index = {t: i for i, t in enumerate(vocabulary)}
+
+        # IDF lissé
+        doc_freq = np.zeros(len(vocabulary))
+        for doc in documents:
+            for token in set(doc):
+                doc_freq[index[token]] += 1
+        idf = np.log((1 + len(documents)) / (1 + doc_freq)) + 1
+        self.idf = {t: float(idf[i]) for t, i in index.items()}
+
+        # Matrice dense (le corpus reste petit)
+        x = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+        for row, doc in enumerate(documents):
+            for token, value in self._vectorize(doc).items():
+                x[row, index[token]] = value
+
+        y = np.zeros((len(documents), len(self.classes)), dtype=np.float32)
+        for row, label in enumerate(labels):
+            y[row, self.classes.index(label)] = 1.0
+
+        w = np.zeros((len(vocabulary), len(self.classes)), dtype=np.float32)
+        b = np.zeros(len(self.classes), dtype=np.float32)
+
+        for _ in range(epochs):
+            logits = x @ w + b
+            logits -= logits.max(axis=1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+
+            grad = (probs - y) / len(documents)
+            w -= learning_rate * (x.T @ grad + l2 * w)
+            b -= learning_rate * grad.sum(axis=0)
+
+        self.weights = {t: w[i].copy() for t, i in index.items()}
+        self.bias = b
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """
+        Prédire l'intention d'un texte.
+
+        Args:
+            text: Texte normalisé
+
+        Returns:
+            (intention, probabilité)
+        """
+        if not self.is_trained:
+            return "unknown", 0.0
+
+        logits = self.bias.copy()
+        for token, value in self._vectorize(tokenize(text)).items():
+            logits += value * self.weights[token]
+
+        logits -= logits.max()
+        probs = np.exp(logits)
+        probs /= probs.sum()
+
+        best = int(probs.argmax())
+        return self.classes[best], float(probs[best])
+
+
+class IntentClassifier:
+    """Moteur local d'intentions: motifs compilés puis classifieur TF-IDF."""
+
+    def __init__(self, training_data_path: Optional[str] = None):
+        """
+        Initialiser le classifieur.
+
+        Args:
+            training_data_path: Fichier JSONL de transcriptions annotées
+                ({"text": ..., "intent": ...} par ligne)
+        """
+        self.training_data_path = training_data_path
+        self.patterns = {
+            intent: re.compile(r"\b(?:" + "|".join(patterns) + r")\b")
+            for intent, patterns in INTENT_PATTERNS.items()
+        }
+        self.model = TfidfLogisticModel()
+
+    def load_training_data(self) -> List[Tuple[str, str]]:
+        """
+        Charger les transcriptions journalisées.
+
+        Returns:
+            Couples (texte, intention)
+        """
+        if not self.training_data_path:
+            return []
+
+        path = Path(self.training_data_path)
+        if not path.exists():
+            print(f"⚠️  Données d'intentions introuvables: {path}")
+            return []
+
+        examples = []
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if record.get("intent") in INTENTS and record.get("text"):
+                    examples.append((record["text"], record["intent"]))
+
+        return examples
+
+    def train(self, extra_examples: Optional[List[Tuple[str, str]]] = None) -> int:
+        """
+        Entraîner le classifieur statistique.
+
+        Args:
+            extra_examples: Exemples supplémentaires
+
+        Returns:
+            Nombre d'exemples utilisés
+        """
+        examples = SEED_EXAMPLES + self.load_training_data() + (extra_examples or [])
+        self.model.fit(examples)
+        print(f"🧠 Classifieur d'intentions entraîné: {len(examples)} exemples")
+        return len(examples)
+
+    def _append_example(self, line: str) -> None:
+        """Ajouter une ligne au fichier d'entraînement (appel bloquant)."""
+        try:
+            with open(self.training_data_path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            print(f"⚠️  Journalisation intention impossible: {e}")
+
+    async def log_example(self, transcript: str, intent: str) -> None:
+        """
+        Journaliser une transcription annotée pour le prochain entraînement.
+
+        L'écriture se fait dans un thread: le disque ne bloque pas la boucle
+        d'événements pendant un tour.
+
+        Args:
+            transcript: Transcription brute
+            intent: Intention retenue
+        """
+        if not self.training_data_path or intent not in INTENTS:
+            return
+
+        line = json.dumps({"text": transcript, "intent": intent}, ensure_ascii=False) + "\n"
+        await asyncio.to_thread(self._append_example, line)
+
+    def match_patterns(self, text: str) -> List[str]:
+        """
+        Intentions dont un motif apparaît dans le texte normalisé.
+
+        Une phrase niée n'active ni validation ni confirmation: le modèle
+        tranche (souvent une modification ou une suite de commande).
+
+        Args:
+            text: Texte normalisé
+
+        Returns:
+            Liste d'intentions détectées
+        """
+        negated = NEGATION_PATTERN.search(text) is not None
+        return [
+            intent for intent, pattern in self.patterns.items()
+            if pattern.search(text) and not (negated and intent in AFFIRMATIVE_INTENTS)
+        ]
+
+    def classify(self, transcript: str) -> Dict[str, Any]:
+        """
+        Classer une transcription.
+
+        Args:
+            transcript: Transcription brute
+
+        Returns:
+            Dict avec l'intention, la confiance et la source
+        """
+        if not self.model.is_trained:
+            self.train()
+
+        text = normalize_text(transcript)
+        if not text:
+            return {"intent": "unknown", "confidence": 0.0, "parameters": {}, "source": "local"}
+
+        model_intent, model_confidence = self.model.predict(text)
+        matches = self.match_patterns(text)
+
+        # Un seul motif: décision nette, renforcée si le modèle est d'accord
+        if len(matches) == 1:
+            intent = matches[0]
+            confidence = 0.99 if model_intent == intent else max(0.9, model_confidence)
+            return {"intent": intent, "confidence": confidence, "parameters": {}, "source": "pattern"}
+
+        # Plusieurs motifs ("oui, ajoute aussi..."): le modèle tranche parmi eux
+        if matches and model_intent not in matches:
+            return {
+                "intent": matches[0],
+                "confidence": min(model_confidence, 0.5),
+                "parameters": {},
+                "source": "pattern",
+            }
+
+        return {
+            "intent": model_intent,
+            "confidence": model_confidence,
+            "parameters": {},
+            "source": "model",
+        }
+
+
+# Instance globale
+intent_classifier = IntentClassifier(settings.intent_training_data_path or None)
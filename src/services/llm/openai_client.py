@@ -1,9 +1,15 @@
 """Client OpenAI pour extraction et dialogue."""
 import json
-from typing import Dict, Any, List
+import time
+from contextlib import aclosing
+from typing import Dict, Any, List, Optional, Callable, Awaitable, AsyncGenerator
 from openai import AsyncOpenAI
 
 from src.core.config import settings
+from src.services.llm.cascade import extraction_cascade
+from src.services.llm.intent_classifier import intent_classifier
+from src.services.llm.scheduler import llm_scheduler
+from src.utils.metrics import llm_latency, llm_time_to_first_token
 
 
 class OpenAIClient:
@@ -16,15 +22,131 @@ class OpenAIClient:
         self.temperature = settings.openai_temperature
         self.max_tokens = settings.openai_max_tokens
 
+        # Ordonnancement: priorité de l'appel et échéance du tour en cours
+        self.priority = 0
+        self.turn_deadline: Optional[float] = None
+
+        # Comptabilité de l'appel en cours (CallUsage), liée par l'orchestrateur
+        self.usage = None
+
+    def _schedule_params(self, kwargs: Dict[str, Any]) -> tuple[int, float]:
+        """Tokens estimés et échéance d'une requête pour l'ordonnanceur."""
+        # Estimation grossière: ~4 caractères par token
+        prompt_chars = sum(len(m.get("content") or "") for m in kwargs.get("messages", []))
+        estimated_tokens = prompt_chars // 4 + kwargs.get("max_tokens", self.max_tokens)
+
+        # Échéance du tour si elle est posée (plus longue en fin de dictée)
+        if self.turn_deadline is not None:
+            deadline = self.turn_deadline
+        else:
+            deadline = time.monotonic() + settings.llm_request_timeout
+
+        return estimated_tokens, deadline
+
+    async def _create_completion(self, hedge: bool = True, **kwargs):
+        """
+        Envoyer une requête chat via l'ordonnanceur global.
+
+        Args:
+            hedge: Autoriser un doublon si la requête tarde
+            **kwargs: Paramètres de chat.completions.create
+
+        Returns:
+            Réponse OpenAI
+        """
+        estimated_tokens, deadline = self._schedule_params(kwargs)
+
+        started_at = time.monotonic()
+        response = await llm_scheduler.submit(
+            lambda: self.client.chat.completions.create(**kwargs),
+            estimated_tokens=estimated_tokens,
+            priority=self.priority,
+            deadline=deadline,
+            hedge=hedge,
+        )
+        latency = time.monotonic() - started_at
+        llm_latency.observe(latency)
+
+        if self.usage is not None and response.usage is not None:
+            self.usage.record_llm(
+                kwargs.get("model", self.model),
+                response.usage.prompt_tokens,
+                response.usage.completion_tokens,
+                latency,
+            )
+
+        return response
+
+    async def _stream_completion(self, **kwargs) -> AsyncGenerator[str, None]:
+        """
+        Envoyer une requête chat en streaming via l'ordonnanceur global.
+
+        Pas de doublon (hedge): la réponse est consommée au fil de l'eau. La
+        place dans l'ordonnanceur est tenue jusqu'à la fin de la lecture.
+
+        Args:
+            **kwargs: Paramètres de chat.completions.create
+
+        Yields:
+            Fragments de texte générés
+        """
+        estimated_tokens, deadline = self._schedule_params(kwargs)
+
+        started_at = time.monotonic()
+        stream = llm_scheduler.stream(
+            lambda: self.client.chat.completions.create(
+                stream=True,
+                stream_options={"include_usage": True},
+                **kwargs,
+            ),
+            estimated_tokens=estimated_tokens,
+            priority=self.priority,
+            deadline=deadline,
+        )
+
+        usage = None
+        first_token = True
+        # aclosing: la place est rendue même si l'appelant arrête la lecture
+        async with aclosing(stream):
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    usage = chunk.usage
+
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if first_token:
+                        llm_time_to_first_token.observe(time.monotonic() - started_at)
+                        first_token = False
+                    yield chunk.choices[0].delta.content
+
+        latency = time.monotonic() - started_at
+        llm_latency.observe(latency)
+
+        if self.usage is not None and usage is not None:
+            self.usage.record_llm(
+                kwargs.get("model", self.model),
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                latency,
+            )
+
     async def extract_order_items(
-        self, transcript: str, context: Dict[str, Any]
+        self,
+        transcript: str,
+        context: Dict[str, Any],
+        catalog_scorer: Optional[Callable[[str], Awaitable[float]]] = None,
+        max_tokens: Optional[int] = None,
     ) -> str:
         """
         Extraire les produits et quantités depuis le transcript.
 
+        Le petit modèle est essayé d'abord; la sortie n'est confiée au grand
+        modèle que si elle est invalide ou peu sûre (voir ExtractionCascade).
+
         Args:
             transcript: Transcription de l'audio
             context: Contexte de la conversation
+            catalog_scorer: Fonction async nom -> score du meilleur match catalogue
+            max_tokens: Limite de génération (par défaut openai_max_tokens)
 
         Returns:
             JSON string avec les produits extraits
@@ -38,7 +160,8 @@ Format de sortie JSON strict:
     {
       "name": "nom du produit",
       "quantity": nombre,
-      "unit": "boites" ou "unités"
+      "unit": "boites" ou "unités",
+      "confidence": 0.0 à 1.0
     }
   ]
 }
@@ -49,6 +172,7 @@ Règles:
 - Normalise les noms de produits (enlève les "euh", "donc", etc.)
 - Si plusieurs produits, retourne tous dans le tableau
 - Si aucun produit détecté, retourne un tableau vide
+- "confidence" reflète ta certitude sur le nom et la quantité
 """
 
         conversation_history = context.get("conversation_history", [])
@@ -63,19 +187,25 @@ Historique récent:
 
 Extrais les produits commandés."""
 
-        try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
+        async def call_model(model: str) -> str:
+            response = await self._create_completion(
+                model=model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt},
                 ],
                 temperature=self.temperature,
-                max_tokens=self.max_tokens,
+                max_tokens=max_tokens or self.max_tokens,
                 response_format={"type": "json_object"},
             )
+            return response.choices[0].message.content
+
+        try:
+            if settings.llm_cascade_enabled:
+                result = await extraction_cascade.run(call_model, catalog_scorer)
+            else:
+                result = await call_model(self.model)
 
-            result = response.choices[0].message.content
             print(f"🤖 LLM Extraction: {result}")
 
             return result
@@ -85,19 +215,10 @@ Extrais les produits commandés."""
             # Retour par défaut en cas d'erreur
             return json.dumps({"products": []})
 
-    async def generate_response(
+    def _dialogue_messages(
         self, user_message: str, conversation_history: List[Dict[str, str]]
-    ) -> str:
-        """
-        Générer une réponse conversationnelle.
-
-        Args:
-            user_message: Message de l'utilisateur
-            conversation_history: Historique de la conversation
-
-        Returns:
-            Réponse générée
-        """
+    ) -> List[Dict[str, str]]:
+        """Messages de la réponse conversationnelle."""
         system_prompt = """Tu es un agent vocal professionnel pour prendre des commandes pharmaceutiques.
 
 Ton rôle:
@@ -118,14 +239,29 @@ Exemples de bonnes réponses:
 - "Parfait, je récapitule : 5 Efferalgan, 10 Doliprane. Je valide ?"
 """
 
-        messages = [
+        return [
             {"role": "system", "content": system_prompt},
             *conversation_history[-5:],  # Garder les 5 derniers messages
             {"role": "user", "content": user_message},
         ]
 
+    async def generate_response(
+        self, user_message: str, conversation_history: List[Dict[str, str]]
+    ) -> str:
+        """
+        Générer une réponse conversationnelle.
+
+        Args:
+            user_message: Message de l'utilisateur
+            conversation_history: Historique de la conversation
+
+        Returns:
+            Réponse générée
+        """
+        messages = self._dialogue_messages(user_message, conversation_history)
+
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=messages,
                 temperature=0.7,  # Un peu plus créatif pour le dialogue
@@ -141,6 +277,38 @@ Exemples de bonnes réponses:
             print(f"❌ Erreur OpenAI dialogue: {e}")
             return "Excusez-moi, je n'ai pas compris. Pouvez-vous répéter ?"
 
+    async def generate_response_stream(
+        self, user_message: str, conversation_history: List[Dict[str, str]]
+    ) -> AsyncGenerator[str, None]:
+        """
+        Générer une réponse conversationnelle, token par token.
+
+        Args:
+            user_message: Message de l'utilisateur
+            conversation_history: Historique de la conversation
+
+        Yields:
+            Fragments de la réponse (à brancher sur BaseTTSClient.text_stream_to_speech)
+        """
+        messages = self._dialogue_messages(user_message, conversation_history)
+        generated = False
+
+        try:
+            async for delta in self._stream_completion(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,  # Un peu plus créatif pour le dialogue
+                max_tokens=150,
+            ):
+                generated = True
+                yield delta
+
+        except Exception as e:
+            print(f"❌ Erreur OpenAI dialogue (streaming): {e}")
+            # Repli seulement si rien n'a encore été prononcé
+            if not generated:
+                yield "Excusez-moi, je n'ai pas compris. Pouvez-vous répéter ?"
+
     async def analyze_intent(self, transcript: str) -> Dict[str, Any]:
         """
         Analyser l'intention de l'utilisateur.
@@ -155,7 +323,8 @@ Exemples de bonnes réponses:
 
 Intentions possibles:
 - "add_product": Ajouter un produit
-- "validate_order": Valider la commande
+- "validate_order": Valider la commande (fin de dictée)
+- "confirm": Réponse affirmative (oui, d'accord)
 - "modify_order": Modifier un produit
 - "cancel": Annuler
 - "clarify": Demande de clarification
@@ -170,7 +339,7 @@ Format de sortie JSON:
 """
 
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -197,21 +366,36 @@ Format de sortie JSON:
         Returns:
             True si validation détectée
         """
-        validation_keywords = [
-            "c'est tout",
-            "je valide",
-            "confirme",
-            "d'accord",
-            "ok",
-            "oui",
-            "c'est bon",
-            "terminé",
-            "fini",
-            "envoie",
-        ]
+        result = intent_classifier.classify(transcript)
+        return result["intent"] in ("validate_order", "confirm")
 
-        transcript_lower = transcript.lower()
-        return any(keyword in transcript_lower for keyword in validation_keywords)
+    @staticmethod
+    def _summary_prompt(items: List[Dict[str, Any]]) -> str:
+        """Prompt du résumé de commande."""
+        items_text = "\n".join(
+            [
+                f"- {item.get('quantity')} {item.get('unit', 'boites')} de {item.get('product_name')}"
+                for item in items
+            ]
+        )
+
+        prompt = f"""Résume cette commande de manière naturelle et concise pour confirmation orale:
+
+{items_text}
+
+Fais une phrase courte et claire."""
+
+        return prompt
+
+    @staticmethod
+    def _summary_fallback(items: List[Dict[str, Any]]) -> str:
+        """Résumé sans LLM."""
+        return ", ".join(
+            [
+                f"{item['quantity']} {item.get('product_name', 'produit')}"
+                for item in items
+            ]
+        )
 
     async def summarize_order(self, items: List[Dict[str, Any]]) -> str:
         """
@@ -226,21 +410,10 @@ Format de sortie JSON:
         if not items:
             return "Aucun produit dans la commande"
 
-        items_text = "\n".join(
-            [
-                f"- {item.get('quantity')} {item.get('unit', 'boites')} de {item.get('product_name')}"
-                for item in items
-            ]
-        )
-
-        prompt = f"""Résume cette commande de manière naturelle et concise pour confirmation orale:
-
-{items_text}
-
-Fais une phrase courte et claire."""
+        prompt = self._summary_prompt(items)
 
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.5,
@@ -252,9 +425,37 @@ Fais une phrase courte et claire."""
         except Exception as e:
             print(f"❌ Erreur résumé: {e}")
             # Fallback simple
-            return ", ".join(
-                [
-                    f"{item['quantity']} {item.get('product_name', 'produit')}"
-                    for item in items
-                ]
-            )
\ No newline at end of file
+            return self._summary_fallback(items)
+
+    async def summarize_order_stream(
+        self, items: List[Dict[str, Any]]
+    ) -> AsyncGenerator[str, None]:
+        """
+        Créer un résumé naturel de la commande, token par token.
+
+        Args:
+            items: Liste des items de commande
+
+        Yields:
+            Fragments du résumé
+        """
+        if not items:
+            yield "Aucun produit dans la commande"
+            return
+
+        generated = False
+
+        try:
+            async for delta in self._stream_completion(
+                model=self.model,
+                messages=[{"role": "user", "content": self._summary_prompt(items)}],
+                temperature=0.5,
+                max_tokens=100,
+            ):
+                generated = True
+                yield delta
+
+        except Exception as e:
+            print(f"❌ Erreur résumé (streaming): {e}")
+            if not generated:
+                yield self._summary_fallback(items)
\ No newline at end of file
@@ -0,0 +1,348 @@
+"""Ordonnanceur LLM global: concurrence, budget de tokens, échéances et requêtes doublées."""
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from src.core.config import settings
+from src.utils.metrics import (
+    llm_queue_delay,
+    llm_hedge_total,
+    llm_requests_in_flight,
+    llm_timeouts_total,
+)
+
+
+class LLMScheduler:
+    """
+    File de priorité partagée par tous les appels du process.
+
+    Les requêtes sont servies par priorité décroissante puis par échéance la
+    plus proche (EDF). Les échéances sont exprimées en secondes sur l'horloge
+    ``time.monotonic()``.
+    """
+
+    def __init__(
+            self,
+            max_concurrency: int = 8,
+            tokens_per_minute: int = 300_000,
+            request_timeout: float = 10.0,
+            hedge_enabled: bool = True,
+            hedge_quantile: float = 0.95,
+            hedge_min_delay: float = 0.5,
+            hedge_default_delay: float = 2.0,
+            hedge_min_samples: int = 20,
+    ):
+        """
+        Initialiser l'ordonnanceur.
+
+        Args:
+            max_concurrency: Requêtes simultanées max vers le fournisseur
+            tokens_per_minute: Budget de tokens par minute
+            request_timeout: Délai par défaut si aucune échéance n'est fournie
+            hedge_enabled: Activer les requêtes doublées
+            hedge_quantile: Quantile de latence déclenchant le doublon
+            hedge_min_delay: Délai plancher avant doublon (secondes)
+            hedge_default_delay: Délai utilisé tant qu'il y a trop peu de mesures
+            hedge_min_samples: Mesures nécessaires avant d'utiliser le quantile
+        """
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.request_timeout = request_timeout
+        self.hedge_enabled = hedge_enabled
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_default_delay = hedge_default_delay
+        self.hedge_min_samples = hedge_min_samples
+
+        self._queue: list = []  # (-priorité, échéance, séquence, future, tokens)
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._latencies: deque = deque(maxlen=200)
+
+    # ---------- Budget ----------
+
+    def _refill(self) -> None:
+        """Recharger le seau de tokens."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(
+            float(self.tokens_per_minute),
+            self._tokens + elapsed * self.tokens_per_minute / 60,
+        )
+        self._last_refill = now
+
+    def _cost(self, tokens: int) -> float:
+        """Coût d'une requête (borné pour qu'une grosse requête passe toujours)."""
+        return float(min(tokens, self.tokens_per_minute))
+
+    def _dispatch(self) -> None:
+        """Attribuer les places libres aux requêtes en tête de file."""
+        self._refill()
+
+        while self._queue and self._in_flight < self.max_concurrency:
+            _, _, _, future, tokens = self._queue[0]
+
+            # Requête abandonnée pendant l'attente
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+
+            cost = self._cost(tokens)
+            if self._tokens < cost:
+                missing = cost - self._tokens
+                self._schedule_wakeup(missing * 60 / self.tokens_per_minute)
+                break
+
+            heapq.heappop(self._queue)
+            self._tokens -= cost
+            self._in_flight += 1
+            future.set_result(None)
+
+        llm_requests_in_flight.set(self._in_flight)
+
+    def _schedule_wakeup(self, delay: float) -> None:
+        """Relancer la distribution quand le budget sera rechargé."""
+        if self._wakeup is None:
+            loop = asyncio.get_running_loop()
+            self._wakeup = loop.call_later(delay, self._on_wakeup)
+
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        self._dispatch()
+
+    def _release(self) -> None:
+        """Libérer une place."""
+        self._in_flight -= 1
+        self._dispatch()
+
+    async def _acquire(self, tokens: int, priority: int, deadline: float) -> None:
+        """Attendre une place dans la file, au plus jusqu'à l'échéance."""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (-priority, deadline, next(self._sequence), future, tokens))
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(future, timeout=max(0.0, deadline - time.monotonic()))
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            # La place a pu être attribuée juste avant l'annulation
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _try_reserve_hedge(self, tokens: int) -> bool:
+        """Réserver une place pour un doublon, sans jamais passer devant la file."""
+        self._refill()
+        cost = self._cost(tokens)
+
+        if self._queue or self._in_flight >= self.max_concurrency or self._tokens < cost:
+            return False
+
+        self._tokens -= cost
+        self._in_flight += 1
+        llm_requests_in_flight.set(self._in_flight)
+        return True
+
+    # ---------- Doublons ----------
+
+    def hedge_delay(self) -> float:
+        """
+        Délai avant d'envoyer un doublon.
+
+        Returns:
+            Quantile de latence observé (borné par le plancher)
+        """
+        if len(self._latencies) < self.hedge_min_samples:
+            return self.hedge_default_delay
+
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.hedge_quantile))
+        return max(self.hedge_min_delay, ordered[index])
+
+    async def _execute(
+            self,
+            request_factory: Callable[[], Awaitable[Any]],
+            tokens: int,
+            hedge: bool,
+    ) -> Any:
+        """Exécuter la requête, en la doublant si elle tarde."""
+        started_at = time.monotonic()
+        primary = asyncio.ensure_future(request_factory())
+
+        try:
+            if not (hedge and self.hedge_enabled):
+                result = await primary
+                self._latencies.append(time.monotonic() - started_at)
+                return result
+
+            done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay())
+            if done or not self._try_reserve_hedge(tokens):
+                result = await primary
+                self._latencies.append(time.monotonic() - started_at)
+                return result
+
+            hedged = asyncio.ensure_future(request_factory())
+            labels = {primary: "primary", hedged: "hedge"}
+
+            try:
+                pending = set(labels)
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task.exception() is None:
+                            llm_hedge_total.labels(winner=labels[task]).inc()
+                            self._latencies.append(time.monotonic() - started_at)
+                            return task.result()
+
+                # Les deux requêtes ont échoué
+                llm_hedge_total.labels(winner="none").inc()
+                raise primary.exception()
+
+            finally:
+                if not hedged.done():
+                    hedged.cancel()
+                self._release()
+
+        finally:
+            if not primary.done():
+                primary.cancel()
+
+    # ---------- API ----------
+
+    async def submit(
+            self,
+            request_factory: Callable[[], Awaitable[Any]],
+            estimated_tokens: int,
+            priority: int = 0,
+            deadline: Optional[float] = None,
+            hedge: bool = True,
+    ) -> Any:
+        """
+        Soumettre une requête LLM.
+
+        Args:
+            request_factory: Fabrique de coroutine (appelée une fois par tentative)
+            estimated_tokens: Tokens estimés (prompt + complétion)
+            priority: Priorité (plus grand = plus urgent)
+            deadline: Échéance absolue sur time.monotonic()
+            hedge: Autoriser un doublon si la requête tarde
+
+        Returns:
+            Réponse du fournisseur
+
+        Raises:
+            asyncio.TimeoutError: Si l'échéance est dépassée
+        """
+        enqueued_at = time.monotonic()
+        if deadline is None:
+            deadline = enqueued_at + self.request_timeout
+
+        try:
+            await self._acquire(estimated_tokens, priority, deadline)
+        except asyncio.TimeoutError:
+            llm_timeouts_total.labels(stage="queue").inc()
+            raise
+
+        llm_queue_delay.observe(time.monotonic() - enqueued_at)
+
+        try:
+            remaining = deadline - time.monotonic()
+            return await asyncio.wait_for(
+                self._execute(request_factory, estimated_tokens, hedge),
+                timeout=max(0.0, remaining),
+            )
+        except asyncio.TimeoutError:
+            llm_timeouts_total.labels(stage="request").inc()
+            raise
+        finally:
+            self._release()
+
+    async def stream(
+            self,
+            request_factory: Callable[[], Awaitable[Any]],
+            estimated_tokens: int,
+            priority: int = 0,
+            deadline: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Soumettre une requête en streaming.
+
+        La place est tenue jusqu'à la fin (ou l'abandon) de la lecture et
+        l'échéance couvre toute la génération, pas seulement l'ouverture du
+        flux. Jamais doublée; sa latence n'entre pas dans le délai des doublons.
+
+        Args:
+            request_factory: Fabrique de coroutine renvoyant le flux
+            estimated_tokens: Tokens estimés (prompt + complétion)
+            priority: Priorité (plus grand = plus urgent)
+            deadline: Échéance absolue sur time.monotonic()
+
+        Yields:
+            Fragments du flux du fournisseur
+
+        Raises:
+            asyncio.TimeoutError: Si l'échéance est dépassée
+        """
+        enqueued_at = time.monotonic()
+        if deadline is None:
+            deadline = enqueued_at + self.request_timeout
+
+        try:
+            await self._acquire(estimated_tokens, priority, deadline)
+        except asyncio.TimeoutError:
+            llm_timeouts_total.labels(stage="queue").inc()
+            raise
+
+        llm_queue_delay.observe(time.monotonic() - enqueued_at)
+
+        stream = None
+        try:
+            try:
+                stream = await asyncio.wait_for(
+                    request_factory(), timeout=max(0.0, deadline - time.monotonic())
+                )
+                chunks = stream.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            chunks.__anext__(), timeout=max(0.0, deadline - time.monotonic())
+                        )
+                    except StopAsyncIteration:
+                        return
+                    yield chunk
+            except asyncio.TimeoutError:
+                llm_timeouts_total.labels(stage="request").inc()
+                raise
+        finally:
+            # Flux abandonné: fermer la connexion avant de rendre la place
+            if stream is not None and hasattr(stream, "close"):
+                await stream.close()
+            self._release()
+
+    def get_stats(self) -> dict:
+        """Statistiques courantes de l'ordonnanceur."""
+        return {
+            "in_flight": self._in_flight,
+            "queued": len(self._queue),
+            "tokens_available": int(self._tokens),
+            "hedge_delay": self.hedge_delay(),
+        }
+
+
+# Instance globale
+llm_scheduler = LLMScheduler(
+    max_concurrency=settings.llm_max_concurrency,
+    tokens_per_minute=settings.llm_tokens_per_minute,
+    request_timeout=settings.llm_request_timeout,
+    hedge_enabled=settings.llm_hedge_enabled,
+    hedge_quantile=settings.llm_hedge_quantile,
+    hedge_min_delay=settings.llm_hedge_min_delay,
+    hedge_default_delay=settings.llm_hedge_default_delay,
+)
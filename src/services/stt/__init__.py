@@ -1,5 +1,6 @@
 """Service Speech-to-Text."""
 from src.services.stt.deepgram_client import DeepgramSTTClient
 from src.services.stt.base import BaseSTTClient
+from src.services.stt.spelling import SpellingCorrector, spelling_corrector
 
-__all__ = ["DeepgramSTTClient", "BaseSTTClient"]
+__all__ = ["DeepgramSTTClient", "BaseSTTClient", "SpellingCorrector", "spelling_corrector"]
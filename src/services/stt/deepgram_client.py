@@ -9,6 +9,7 @@ from deepgram import (
 )
 
 from src.core.config import settings
+from src.utils.metrics import stt_latency
 
 
 class DeepgramSTTClient:
@@ -23,6 +24,13 @@ class DeepgramSTTClient:
         self.connection = None
         self.is_connected = False
 
+        # Audio entrant: mu-law 8 kHz mono (1 octet par échantillon)
+        self.bytes_per_second = 8000
+        self.audio_seconds_sent = 0.0
+
+        # Comptabilité de l'appel en cours (CallUsage), liée par l'orchestrateur
+        self.usage = None
+
     async def start_streaming(
         self,
         on_transcript_callback: Callable[[str, bool, float], Awaitable[None]],
@@ -33,6 +41,8 @@ class DeepgramSTTClient:
         Args:
             on_transcript_callback: Fonction async appelée avec (transcript, is_final, confidence)
         """
+        stt_client = self
+
         try:
             # Créer la connexion WebSocket
             self.connection = self.client.listen.asyncwebsocket.v("1")
@@ -44,6 +54,15 @@ class DeepgramSTTClient:
                 is_final = result.is_final
                 confidence = result.channel.alternatives[0].confidence
 
+                if is_final:
+                    # Retard entre l'audio envoyé et la fin du segment transcrit
+                    latency = max(
+                        0.0, stt_client.audio_seconds_sent - (result.start + result.duration)
+                    )
+                    stt_latency.observe(latency)
+                    if stt_client.usage is not None:
+                        stt_client.usage.record_stt_latency(latency)
+
                 if len(sentence) > 0:
                     await on_transcript_callback(sentence, is_final, confidence)
 
@@ -100,6 +119,11 @@ class DeepgramSTTClient:
         if self.connection and self.is_connected:
             try:
                 self.connection.send(audio_chunk)
+
+                seconds = len(audio_chunk) / self.bytes_per_second
+                self.audio_seconds_sent += seconds
+                if self.usage is not None:
+                    self.usage.record_stt_audio(seconds)
             except Exception as e:
                 print(f"❌ Erreur envoi audio: {e}")
         else:
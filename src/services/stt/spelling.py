@@ -0,0 +1,344 @@
+"""Correction orthographique des transcriptions sur le vocabulaire du catalogue (SymSpell)."""
+import pickle
+import re
+import time
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.config import settings
+from src.utils.metrics import transcript_corrections_total
+
+# Incrémenter si le format du fichier change
+DICTIONARY_FORMAT = 1
+
+# DCI courantes (dénominations communes), en plus des noms du catalogue
+COMMON_DCI = [
+    "paracetamol", "ibuprofene", "aspirine", "amoxicilline", "acide", "clavulanique",
+    "omeprazole", "esomeprazole", "pantoprazole", "metformine", "amlodipine",
+    "atorvastatine", "rosuvastatine", "simvastatine", "levothyroxine", "ramipril",
+    "perindopril", "bisoprolol", "furosemide", "hydrochlorothiazide", "losartan",
+    "valsartan", "tramadol", "codeine", "morphine", "prednisolone", "prednisone",
+    "cetirizine", "loratadine", "desloratadine", "salbutamol", "budesonide",
+    "fluticasone", "montelukast", "phloroglucinol", "loperamide", "diosmectite",
+    "macrogol", "lactulose", "domperidone", "metoclopramide", "azithromycine",
+    "clarithromycine", "doxycycline", "ciprofloxacine", "levofloxacine", "fosfomycine",
+    "nitrofurantoine", "diclofenac", "ketoprofene", "naproxene", "kardegic",
+    "clopidogrel", "apixaban", "rivaroxaban", "warfarine", "fluindione", "insuline",
+    "colecalciferol", "magnesium", "potassium", "calcium", "fer", "zinc", "vitamine",
+    "sertraline", "escitalopram", "paroxetine", "fluoxetine", "venlafaxine",
+    "alprazolam", "bromazepam", "lorazepam", "oxazepam", "zolpidem", "zopiclone",
+]
+
+# Vocabulaire des dosages et conditionnements
+DOSAGE_VOCABULARY = [
+    "milligramme", "milligrammes", "gramme", "grammes", "microgramme", "microgrammes",
+    "millilitre", "millilitres", "litre", "unite", "unites", "pourcent",
+    "comprime", "comprimes", "effervescent", "effervescents", "secable", "gelule",
+    "gelules", "sachet", "sachets", "sirop", "suspension", "buvable", "injectable",
+    "ampoule", "ampoules", "flacon", "flacons", "boite", "boites", "tube", "tubes",
+    "creme", "pommade", "collyre", "suppositoire", "suppositoires", "lyophilisat",
+    "orodispersible", "pediatrique", "adulte", "enfant", "nourrisson",
+]
+
+# Mots courants du dialogue: ne jamais les « corriger » vers un nom de produit
+DIALOGUE_VOCABULARY = [
+    "bonjour", "bonsoir", "merci", "voila", "alors", "donc", "aussi", "encore",
+    "ajouter", "ajoute", "ajoutez", "mettre", "mettez", "voudrais", "voudrait",
+    "faudrait", "besoin", "commande", "commander", "commandes", "valider", "valide",
+    "confirme", "confirmer", "annuler", "annule", "enlever", "enleve", "retirer",
+    "retire", "modifier", "modifie", "remplacer", "remplace", "corriger", "corrige",
+    "plutot", "parfait", "exactement", "accord", "termine", "fini", "rien", "autre",
+    "chose", "quoi", "combien", "revoir", "pharmacie", "centre", "stock",
+    "deux", "trois", "quatre", "cinq", "sept", "huit", "neuf", "onze", "douze",
+    "treize", "quatorze", "quinze", "seize", "vingt", "trente", "quarante",
+    "cinquante", "soixante", "cent", "cents", "mille", "demi", "dizaine", "douzaine",
+    "avec", "sans", "pour", "dans", "sur", "chez", "tout", "tous", "toute", "toutes",
+    "bien", "tres", "peut", "etre", "oui", "non", "nous", "vous", "elle", "elles",
+    "celui", "celle", "cette", "ceux", "meme", "comme", "quand", "aujourd", "hui",
+    "demain", "livraison", "urgent", "prochaine", "derniere", "premier", "premiere",
+]
+
+_WORD = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+
+def _fold(word: str) -> str:
+    """Minuscules sans accents (clé du dictionnaire)."""
+    word = unicodedata.normalize("NFKD", word.lower())
+    return "".join(c for c in word if not unicodedata.combining(c))
+
+
+def damerau_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """
+    Distance d'édition avec transpositions, coupée au-delà de max_distance.
+
+    Returns:
+        Distance, ou max_distance + 1 si elle dépasse la borne
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class SpellingCorrector:
+    """
+    Correcteur par suppressions symétriques (SymSpell).
+
+    Toutes les variantes à une ou deux suppressions près des mots du
+    vocabulaire sont précalculées: corriger un mot revient à générer ses
+    propres suppressions et à les chercher dans un dictionnaire, sans
+    parcourir le vocabulaire. Le dictionnaire se sauvegarde sur disque pour
+    être chargé tel quel par chaque worker.
+    """
+
+    def __init__(self, max_edit_distance: int = 2, prefix_length: int = 7, min_word_length: int = 4):
+        """
+        Initialiser le correcteur (vide).
+
+        Args:
+            max_edit_distance: Distance d'édition maximale d'une correction
+            prefix_length: Seul ce préfixe des mots est décliné (taille du dictionnaire)
+            min_word_length: Mots plus courts jamais corrigés ("les", "une")
+        """
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.min_word_length = min_word_length
+
+        self.words: Dict[str, int] = {}  # mot -> fréquence
+        # variante -> mots séparés par \x00 (une chaîne par entrée: chargement bien plus rapide)
+        self.deletes: Dict[str, str] = {}
+
+    @property
+    def is_ready(self) -> bool:
+        return bool(self.words)
+
+    def _variants(self, word: str) -> Set[str]:
+        """Le préfixe du mot et ses variantes à max_edit_distance suppressions près."""
+        prefix = word[:self.prefix_length]
+        variants = {prefix}
+        frontier = {prefix}
+        for _ in range(self.max_edit_distance):
+            frontier = {
+                variant[:i] + variant[i + 1:]
+                for variant in frontier
+                if len(variant) > 1
+                for i in range(len(variant))
+            }
+            variants |= frontier
+        return variants
+
+    # ---------- Construction ----------
+
+    def build(self, vocabulary: Dict[str, int], protected: Iterable[str] = ()) -> None:
+        """
+        Précalculer le dictionnaire.
+
+        Args:
+            vocabulary: Mots (déjà repliés, voir _fold) et leur fréquence
+            protected: Mots reconnus tels quels mais jamais proposés en correction
+        """
+        protected = set(protected)
+        deletes: Dict[str, List[str]] = {}
+        for word in vocabulary:
+            if word in protected:
+                continue
+            for variant in self._variants(word):
+                deletes.setdefault(variant, []).append(word)
+
+        # Remplacement d'un bloc: le dictionnaire précédent sert jusqu'au bout
+        self.words = {**dict.fromkeys(protected, 0), **vocabulary}
+        self.deletes = {variant: "\x00".join(words) for variant, words in deletes.items()}
+
+    def build_from_catalog(self, product_names: Iterable[str]) -> int:
+        """
+        Construire le vocabulaire: noms du catalogue, DCI, dosages et mots du dialogue.
+
+        Args:
+            product_names: Noms des produits
+
+        Returns:
+            Nombre de mots du vocabulaire
+        """
+        counts: Counter = Counter()
+        for name in product_names:
+            counts.update(_fold(word) for word in _WORD.findall(name) if len(word) >= 2)
+
+        # Les listes fixes pèsent au moins autant qu'un mot fréquent du catalogue
+        weight = max(counts.values(), default=1)
+        for word in COMMON_DCI + DOSAGE_VOCABULARY:
+            counts[word] = max(counts[word], weight)
+
+        # Mots du dialogue: connus (donc laissés tels quels), jamais cibles d'une
+        # correction ("centre" ne doit pas devenir "cette")
+        self.build(dict(counts), protected=DIALOGUE_VOCABULARY)
+        return len(self.words)
+
+    # ---------- Persistance ----------
+
+    def save(self, path: str) -> None:
+        """Sauvegarder le dictionnaire précalculé."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(
+                {
+                    "format": DICTIONARY_FORMAT,
+                    "max_edit_distance": self.max_edit_distance,
+                    "prefix_length": self.prefix_length,
+                    "words": self.words,
+                    "deletes": self.deletes,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        tmp_path.replace(path)
+
+    def load(self, path: str) -> bool:
+        """
+        Charger un dictionnaire sauvegardé (fichier produit par save uniquement).
+
+        Returns:
+            True si chargé (format et paramètres compatibles)
+        """
+        path = Path(path)
+        if not path.exists():
+            return False
+
+        started_at = time.perf_counter()
+        try:
+            with path.open("rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️  Dictionnaire orthographique illisible: {e}")
+            return False
+
+        if (
+                data.get("format") != DICTIONARY_FORMAT
+                or data.get("max_edit_distance") != self.max_edit_distance
+                or data.get("prefix_length") != self.prefix_length
+        ):
+            print("⚠️  Dictionnaire orthographique d'un autre format, reconstruction nécessaire")
+            return False
+
+        self.words, self.deletes = data["words"], data["deletes"]
+        print(
+            f"✅ Dictionnaire orthographique: {len(self.words)} mots "
+            f"chargés en {(time.perf_counter() - started_at) * 1000:.0f} ms"
+        )
+        return True
+
+    # ---------- Correction ----------
+
+    def lookup(self, word: str) -> Optional[Tuple[str, int]]:
+        """
+        Meilleure correction d'un mot.
+
+        Args:
+            word: Mot (replié)
+
+        Returns:
+            (mot du vocabulaire, distance), None si rien à distance autorisée
+        """
+        if word in self.words:
+            return word, 0
+
+        # Mots courts: une seule erreur tolérée
+        max_distance = 1 if len(word) < 6 else self.max_edit_distance
+
+        best: Optional[Tuple[str, int]] = None
+        best_frequency = 0
+        seen: Set[str] = set()
+        for variant in self._variants(word):
+            entry = self.deletes.get(variant)
+            if not entry:
+                continue
+            for candidate in entry.split("\x00"):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+
+                distance = damerau_levenshtein(word, candidate, max_distance)
+                if distance > max_distance:
+                    continue
+
+                frequency = self.words[candidate]
+                if best is None or (distance, -frequency) < (best[1], -best_frequency):
+                    best, best_frequency = (candidate, distance), frequency
+
+        return best
+
+    def correct(self, text: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """
+        Corriger une transcription mot à mot.
+
+        Deux mots consécutifs inconnus dont la concaténation est connue sont
+        recollés ("doli prane" -> "doliprane").
+
+        Args:
+            text: Transcription
+
+        Returns:
+            (texte corrigé, corrections (avant, après))
+        """
+        if not self.is_ready:
+            return text, []
+
+        matches = list(_WORD.finditer(text))
+        replacements: Dict[int, Tuple[int, str]] = {}  # début -> (fin, remplacement)
+        edits: List[Tuple[str, str]] = []
+
+        index = 0
+        while index < len(matches):
+            match = matches[index]
+            word = _fold(match.group())
+
+            # Mots coupés par la transcription
+            if index + 1 < len(matches) and word not in self.words:
+                following = matches[index + 1]
+                joined = word + _fold(following.group())
+                only_space = text[match.end():following.start()].isspace()
+                if only_space and joined in self.words and _fold(following.group()) not in self.words:
+                    replacements[match.start()] = (following.end(), joined)
+                    edits.append((text[match.start():following.end()], joined))
+                    index += 2
+                    continue
+
+            if len(word) >= self.min_word_length:
+                suggestion = self.lookup(word)
+                if suggestion is not None and suggestion[1] > 0:
+                    replacements[match.start()] = (match.end(), suggestion[0])
+                    edits.append((match.group(), suggestion[0]))
+            index += 1
+
+        if not edits:
+            return text, []
+
+        parts, position = [], 0
+        for start in sorted(replacements):
+            end, replacement = replacements[start]
+            parts.append(text[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(text[position:])
+
+        transcript_corrections_total.inc(len(edits))
+        return "".join(parts), edits
+
+
+# Instance globale
+spelling_corrector = SpellingCorrector(max_edit_distance=settings.spelling_max_edit_distance)
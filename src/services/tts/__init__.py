@@ -2,5 +2,29 @@
 from src.services.tts.elevenlabs_client import ElevenLabsTTSClient
 from src.services.tts.base import BaseTTSClient
 from src.services.tts.cache import TTSCache, tts_cache
+from src.services.tts.caching_client import CachingTTSClient
+from src.services.tts.audio_store import AudioCacheStore, audio_store
+from src.services.tts.phrase_bank import PhraseBank, phrase_bank
+from src.services.tts.segments import SegmentAssembler, segment_assembler
+from src.services.tts.planner import TTSPlanner
+from src.services.tts.local_client import LocalTTSClient
+from src.services.tts.router import TTSRoute, TTSRouter, create_tts_router
 
-__all__ = ["ElevenLabsTTSClient", "BaseTTSClient", "TTSCache", "tts_cache"]
+__all__ = [
+    "ElevenLabsTTSClient",
+    "BaseTTSClient",
+    "TTSCache",
+    "tts_cache",
+    "CachingTTSClient",
+    "AudioCacheStore",
+    "audio_store",
+    "PhraseBank",
+    "phrase_bank",
+    "SegmentAssembler",
+    "segment_assembler",
+    "TTSPlanner",
+    "LocalTTSClient",
+    "TTSRoute",
+    "TTSRouter",
+    "create_tts_router",
+]
@@ -0,0 +1,161 @@
+"""Stockage de l'audio TTS: LRU en mémoire (budget en octets) + Redis binaire."""
+import zlib
+from collections import OrderedDict
+from typing import Optional
+
+from src.core.config import settings
+from src.utils.cache import binary_cache, BinaryCacheManager
+from src.utils.metrics import tts_audio_store_lookups_total, tts_audio_store_memory_bytes
+
+# En-tête d'un octet devant chaque valeur Redis
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class ByteBudgetLRU:
+    """Cache LRU borné par la taille cumulée des valeurs."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialiser le cache.
+
+        Args:
+            max_bytes: Budget total en octets
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Récupérer une valeur (et la marquer comme récente)."""
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """Stocker une valeur, en évinçant les plus anciennes si nécessaire."""
+        # Une valeur plus grosse que le budget viderait tout le cache
+        if len(value) > self.max_bytes:
+            return
+
+        previous = self._items.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+
+        self._items[key] = value
+        self.size += len(value)
+
+        while self.size > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.size -= len(evicted)
+
+    def delete(self, key: str) -> None:
+        """Supprimer une valeur."""
+        value = self._items.pop(key, None)
+        if value is not None:
+            self.size -= len(value)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class AudioCacheStore:
+    """Cache audio à deux niveaux: mémoire du process puis Redis binaire."""
+
+    def __init__(
+            self,
+            memory_max_bytes: int = 64 * 1024 * 1024,
+            compression: bool = True,
+            compression_level: int = 1,
+            redis: BinaryCacheManager = binary_cache,
+    ):
+        """
+        Initialiser le stockage.
+
+        Args:
+            memory_max_bytes: Budget du niveau mémoire
+            compression: Compresser en zlib avant Redis (si c'est rentable)
+            compression_level: Niveau zlib (1 = rapide)
+            redis: Connexion Redis binaire
+        """
+        self.memory = ByteBudgetLRU(memory_max_bytes)
+        self.compression = compression
+        self.compression_level = compression_level
+        self.redis = redis
+
+    def _encode(self, audio: bytes) -> bytes:
+        """Encoder pour Redis: compressé seulement si le gain dépasse 10 %."""
+        if self.compression:
+            compressed = zlib.compress(audio, self.compression_level)
+            if len(compressed) < len(audio) * 0.9:
+                return _ZLIB + compressed
+        return _RAW + audio
+
+    @staticmethod
+    def _decode(value: bytes) -> bytes:
+        """Décoder une valeur Redis."""
+        header, payload = value[:1], value[1:]
+        if header == _ZLIB:
+            return zlib.decompress(payload)
+        return payload
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Récupérer de l'audio.
+
+        Args:
+            key: Clé de cache
+
+        Returns:
+            Audio brut ou None
+        """
+        audio = self.memory.get(key)
+        if audio is not None:
+            tts_audio_store_lookups_total.labels(tier="memory", result="hit").inc()
+            return audio
+
+        value = await self.redis.get(key)
+        if value is None:
+            tts_audio_store_lookups_total.labels(tier="redis", result="miss").inc()
+            return None
+
+        tts_audio_store_lookups_total.labels(tier="redis", result="hit").inc()
+        audio = self._decode(value)
+        self.memory.set(key, audio)
+        tts_audio_store_memory_bytes.set(self.memory.size)
+        return audio
+
+    async def set(self, key: str, audio: bytes, ttl: Optional[int] = None) -> None:
+        """
+        Stocker de l'audio dans les deux niveaux.
+
+        Args:
+            key: Clé de cache
+            audio: Audio brut
+            ttl: Durée de vie Redis en secondes (None = sans expiration)
+        """
+        self.memory.set(key, audio)
+        tts_audio_store_memory_bytes.set(self.memory.size)
+        await self.redis.set(key, self._encode(audio), ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        """Supprimer de l'audio des deux niveaux."""
+        self.memory.delete(key)
+        tts_audio_store_memory_bytes.set(self.memory.size)
+        await self.redis.delete(key)
+
+    def get_stats(self) -> dict:
+        """Occupation du niveau mémoire."""
+        return {
+            "memory_items": len(self.memory),
+            "memory_bytes": self.memory.size,
+            "memory_max_bytes": self.memory.max_bytes,
+        }
+
+
+# Instance globale
+audio_store = AudioCacheStore(
+    memory_max_bytes=settings.tts_cache_memory_max_bytes,
+    compression=settings.tts_cache_compression,
+)
@@ -5,7 +5,14 @@
 # ========================================
 """Interface de base pour les services TTS."""
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, AsyncIterator, Dict
+
+from src.services.tts.streaming import SentenceBuffer
+
+# Positionné par un client qui a servi un audio de substitution (autre voix,
+# repli pré-rendu, synthèse coupée): cet audio ne doit pas être mis en cache
+audio_degraded: ContextVar[bool] = ContextVar("audio_degraded", default=False)
 
 
 class BaseTTSClient(ABC):
@@ -20,3 +27,38 @@ class BaseTTSClient(ABC):
     async def text_to_speech(self, text: str) -> bytes:
         """Convertir texte en audio (complet)."""
         pass
+
+    async def text_stream_to_speech(
+            self, text_chunks: AsyncIterator[str]
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Convertir un texte en cours de génération en audio.
+
+        Par défaut, chaque phrase complète est synthétisée dès qu'elle arrive;
+        les fournisseurs à entrée en streaming surchargent cette méthode.
+
+        Args:
+            text_chunks: Fragments de texte (tokens LLM)
+
+        Yields:
+            Chunks audio en bytes
+        """
+        buffer = SentenceBuffer()
+
+        async for delta in text_chunks:
+            for sentence in buffer.push(delta):
+                async for chunk in self.text_to_speech_stream(sentence):
+                    yield chunk
+
+        rest = buffer.flush()
+        if rest:
+            async for chunk in self.text_to_speech_stream(rest):
+                yield chunk
+
+    def is_prerendered(self, text: str) -> bool:
+        """Le texte est servi sans synthèse (banque de phrases, assemblage)."""
+        return False
+
+    def voice_profile(self) -> Dict[str, Any]:
+        """Paramètres qui déterminent l'audio produit (clé de cache)."""
+        return {"voice_id": getattr(self, "voice_id", "")}
@@ -4,80 +4,77 @@
 # ========================================
 """Cache pour le TTS."""
 import hashlib
-from typing import Optional
-from src.utils.cache import cache
+import json
+from typing import Any, Dict, Optional
+
+from src.core.config import settings
+from src.services.tts.audio_store import AudioCacheStore, audio_store
 
 
 class TTSCache:
     """Cache pour les réponses TTS."""
 
-    def __init__(self, ttl: int = 3600):
+    def __init__(self, ttl: int = 3600, store: AudioCacheStore = audio_store):
         """
         Initialiser le cache TTS.
 
         Args:
             ttl: Durée de vie en secondes
+            store: Stockage audio (mémoire + Redis binaire)
         """
         self.ttl = ttl
         self.prefix = "tts:"
+        self.store = store
 
-    def _get_cache_key(self, text: str, voice_id: str) -> str:
+    def _get_cache_key(self, text: str, voice_profile: Dict[str, Any]) -> str:
         """
         Générer une clé de cache.
 
         Args:
             text: Texte
-            voice_id: ID de la voix
+            voice_profile: Voix, modèle, réglages et format de sortie
 
         Returns:
             Clé de cache
         """
-        hash_input = f"{text}:{voice_id}".encode("utf-8")
-        text_hash = hashlib.md5(hash_input).hexdigest()
+        profile = json.dumps(voice_profile, sort_keys=True, default=str)
+        hash_input = f"{text}\x00{profile}".encode("utf-8")
+        text_hash = hashlib.sha256(hash_input).hexdigest()
         return f"{self.prefix}{text_hash}"
 
-    async def get(self, text: str, voice_id: str) -> Optional[bytes]:
+    async def get(self, text: str, voice_profile: Dict[str, Any]) -> Optional[bytes]:
         """
         Récupérer audio depuis le cache.
 
         Args:
             text: Texte
-            voice_id: ID de la voix
+            voice_profile: Profil de voix (voir BaseTTSClient.voice_profile)
 
         Returns:
             Audio en bytes ou None
         """
-        key = self._get_cache_key(text, voice_id)
-        cached = await cache.get(key)
+        key = self._get_cache_key(text, voice_profile)
+        cached = await self.store.get(key)
 
         if cached:
             print(f"✅ TTS Cache HIT: {text[:30]}...")
-            # Décoder depuis base64 si nécessaire
-            import base64
-
-            return base64.b64decode(cached)
+            return cached
 
         return None
 
-    async def set(self, text: str, voice_id: str, audio_data: bytes):
+    async def set(self, text: str, voice_profile: Dict[str, Any], audio_data: bytes):
         """
         Mettre en cache l'audio.
 
         Args:
             text: Texte
-            voice_id: ID de la voix
+            voice_profile: Profil de voix
             audio_data: Audio en bytes
         """
-        key = self._get_cache_key(text, voice_id)
-
-        # Encoder en base64 pour stockage
-        import base64
-
-        audio_base64 = base64.b64encode(audio_data).decode("utf-8")
-
-        await cache.set(key, audio_base64, ttl=self.ttl)
+        key = self._get_cache_key(text, voice_profile)
+        await self.store.set(key, audio_data, ttl=self.ttl)
         print(f"💾 TTS mis en cache: {text[:30]}...")
 
 
 # Instance globale
-tts_cache = TTSCache()
+tts_cache = TTSCache(ttl=settings.tts_cache_ttl)
@@ -0,0 +1,242 @@
+"""Client TTS avec cache: lecture directe sur hit, tee vers le cache sur miss."""
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Dict, Optional
+
+from src.services.tts.base import BaseTTSClient, audio_degraded
+from src.services.tts.cache import TTSCache, tts_cache
+from src.services.tts.phrase_bank import PhraseBank, phrase_bank
+from src.services.tts.segments import SegmentAssembler, segment_assembler
+from src.utils.metrics import tts_cache_requests_total, tts_cache_bytes_saved_total
+
+
+class _InflightSynthesis:
+    """Synthèse en cours, lue en parallèle par tous les appelants de la même phrase."""
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.task: Optional[asyncio.Task] = None
+        self._condition = asyncio.Condition()
+
+    async def append(self, chunk: bytes) -> None:
+        async with self._condition:
+            self.chunks.append(chunk)
+            self._condition.notify_all()
+
+    async def finish(self, error: Optional[BaseException] = None) -> None:
+        async with self._condition:
+            self.done = True
+            self.error = error
+            self._condition.notify_all()
+
+    async def iterate(self) -> AsyncGenerator[bytes, None]:
+        """Lire les chunks depuis le début, au fur et à mesure de leur arrivée."""
+        index = 0
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(lambda: index < len(self.chunks) or self.done)
+                pending = self.chunks[index:]
+                finished = self.done
+                error = self.error
+
+            for chunk in pending:
+                yield chunk
+            index += len(pending)
+
+            if finished and index >= len(self.chunks):
+                if error is not None:
+                    raise error
+                return
+
+
+# Synthèses en cours, partagées entre tous les appels du process
+_inflight_syntheses: Dict[str, _InflightSynthesis] = {}
+
+
+class CachingTTSClient(BaseTTSClient):
+    """Enveloppe un client TTS avec cache et synthèse unique par phrase (single-flight)."""
+
+    def __init__(
+            self,
+            provider: BaseTTSClient,
+            cache: TTSCache = tts_cache,
+            bank: Optional[PhraseBank] = phrase_bank,
+            assembler: Optional[SegmentAssembler] = segment_assembler,
+            max_text_length: int = 300,
+            chunk_size: int = 4096,
+    ):
+        """
+        Initialiser le client.
+
+        Args:
+            provider: Client TTS sous-jacent (ElevenLabs, ...)
+            cache: Cache audio
+            bank: Banque de phrases pré-synthétisées (consultée en premier)
+            assembler: Assemblage par segments des confirmations (avant synthèse)
+            max_text_length: Au-delà, la phrase n'est pas mise en cache
+            chunk_size: Taille des chunks servis depuis le cache
+        """
+        self.provider = provider
+        self.cache = cache
+        self.bank = bank
+        self.assembler = assembler
+        self.max_text_length = max_text_length
+        self.chunk_size = chunk_size
+        self._inflight = _inflight_syntheses
+
+    @property
+    def voice_id(self) -> str:
+        return self.provider.voice_id
+
+    @property
+    def usage(self):
+        """Comptabilité de l'appel, portée par le fournisseur (seules les synthèses coûtent)."""
+        return self.provider.usage
+
+    @usage.setter
+    def usage(self, value):
+        self.provider.usage = value
+
+    def voice_profile(self) -> dict:
+        return self.provider.voice_profile()
+
+    def is_prerendered(self, text: str) -> bool:
+        """Phrase de la banque, ou phrase à trous assemblée depuis les segments."""
+        if self.bank is not None and self.bank.contains(text, self.voice_profile()):
+            return True
+        return self.assembler is not None and self.assembler.split(text) is not None
+
+    def _cache_key(self, text: str) -> str:
+        return self.cache._get_cache_key(text, self.voice_profile())
+
+    async def _synthesize(self, text: str, key: str, inflight: _InflightSynthesis) -> None:
+        """Tirer le flux du fournisseur vers les lecteurs, puis vers le cache."""
+        audio_degraded.set(False)
+        error: Optional[BaseException] = None
+        try:
+            # Les lecteurs sont toujours libérés, même si la tâche est annulée
+            try:
+                async for chunk in self.provider.text_to_speech_stream(text):
+                    await inflight.append(chunk)
+            except asyncio.CancelledError:
+                error = RuntimeError(f"Synthèse TTS annulée: {text[:50]}")
+                raise
+            except Exception as e:
+                error = e
+                return
+            finally:
+                await inflight.finish(error=error)
+
+            if audio_degraded.get():
+                return
+
+            try:
+                await self.cache.set(text, self.voice_profile(), b"".join(inflight.chunks))
+            except Exception as e:
+                print(f"⚠️  Mise en cache TTS impossible: {e}")
+
+        finally:
+            self._inflight.pop(key, None)
+
+    async def text_to_speech_stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """
+        Convertir texte en audio (streaming), via le cache.
+
+        Args:
+            text: Texte à convertir
+
+        Yields:
+            Chunks audio en bytes
+        """
+        if len(text) > self.max_text_length:
+            tts_cache_requests_total.labels(result="bypass").inc()
+            async for chunk in self.provider.text_to_speech_stream(text):
+                yield chunk
+            return
+
+        # Phrase fixe pré-rendue: aucun accès réseau
+        if self.bank is not None:
+            audio = self.bank.get(text, self.voice_profile())
+            if audio is not None:
+                tts_cache_requests_total.labels(result="phrase_bank").inc()
+                tts_cache_bytes_saved_total.inc(len(audio))
+                for i in range(0, len(audio), self.chunk_size):
+                    yield audio[i: i + self.chunk_size]
+                return
+
+        key = self._cache_key(text)
+
+        # Synthèse déjà en cours pour cette phrase: la partager
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            tts_cache_requests_total.labels(result="shared").inc()
+            async for chunk in inflight.iterate():
+                yield chunk
+            tts_cache_bytes_saved_total.inc(sum(len(c) for c in inflight.chunks))
+            return
+
+        cached = await self.cache.get(text, self.voice_profile())
+        if cached:
+            tts_cache_requests_total.labels(result="hit").inc()
+            tts_cache_bytes_saved_total.inc(len(cached))
+            for i in range(0, len(cached), self.chunk_size):
+                yield cached[i: i + self.chunk_size]
+            return
+
+        # Confirmation à trous: assemblée depuis les segments plutôt que synthétisée.
+        # Une phrase complète déjà en cache (meilleure prosodie) reste prioritaire.
+        if self.assembler is not None:
+            audio = await self.assembler.assemble(text, self)
+            if audio is not None:
+                tts_cache_requests_total.labels(result="assembled").inc()
+                for i in range(0, len(audio), self.chunk_size):
+                    yield audio[i: i + self.chunk_size]
+                return
+
+        # Re-vérifier: une synthèse a pu démarrer pendant la lecture du cache
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            tts_cache_requests_total.labels(result="miss").inc()
+            inflight = _InflightSynthesis()
+            self._inflight[key] = inflight
+            # Tâche détachée: la synthèse et la mise en cache survivent à un lecteur qui raccroche
+            inflight.task = asyncio.create_task(self._synthesize(text, key, inflight))
+        else:
+            tts_cache_requests_total.labels(result="shared").inc()
+
+        async for chunk in inflight.iterate():
+            yield chunk
+
+    async def text_to_speech(self, text: str) -> bytes:
+        """
+        Convertir texte en audio (complet), via le cache.
+
+        Args:
+            text: Texte à convertir
+
+        Returns:
+            Audio complet en bytes
+        """
+        chunks = [chunk async for chunk in self.text_to_speech_stream(text)]
+        return b"".join(chunks)
+
+    async def text_stream_to_speech(
+            self, text_chunks: AsyncIterator[str]
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Texte généré à la volée: transmis au fournisseur sans cache.
+
+        Args:
+            text_chunks: Fragments de texte (tokens LLM)
+
+        Yields:
+            Chunks audio en bytes
+        """
+        tts_cache_requests_total.labels(result="bypass").inc()
+        async for chunk in self.provider.text_stream_to_speech(text_chunks):
+            yield chunk
+
+    def get_stats(self) -> dict:
+        """Synthèses partagées en cours."""
+        return {"inflight": len(self._inflight)}
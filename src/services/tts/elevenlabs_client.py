@@ -1,19 +1,34 @@
 """Client ElevenLabs pour Text-to-Speech."""
-from typing import AsyncGenerator
+import asyncio
+import base64
+import json
+import time
+from typing import AsyncGenerator, AsyncIterator, Optional
+
+import websockets
 from elevenlabs import AsyncElevenLabs
 from elevenlabs.types import VoiceSettings
 
 from src.core.config import settings
+from src.services.tts.base import BaseTTSClient
+from src.services.tts.streaming import SentenceBuffer
+from src.utils.metrics import tts_latency
 
 
-class ElevenLabsTTSClient:
+class ElevenLabsTTSClient(BaseTTSClient):
     """Client ElevenLabs TTS en streaming."""
 
-    def __init__(self):
-        """Initialiser le client ElevenLabs."""
+    def __init__(self, model_id: Optional[str] = None):
+        """
+        Initialiser le client ElevenLabs.
+
+        Args:
+            model_id: Modèle de synthèse (par défaut elevenlabs_model)
+        """
         self.client = AsyncElevenLabs(api_key=settings.elevenlabs_api_key)
         self.voice_id = settings.elevenlabs_voice_id
-        self.model_id = settings.elevenlabs_model
+        self.model_id = model_id or settings.elevenlabs_model
+        self.output_format = settings.elevenlabs_output_format
 
         # Settings de voix optimisés pour agent vocal
         self.voice_settings = VoiceSettings(
@@ -23,6 +38,25 @@ class ElevenLabsTTSClient:
             use_speaker_boost=True,  # Améliore la clarté
         )
 
+        # Comptabilité de l'appel en cours (CallUsage), liée par l'orchestrateur
+        self.usage = None
+
+    def voice_profile(self) -> dict:
+        """Voix, modèle et réglages: tout ce qui change l'audio produit."""
+        return {
+            "provider": "elevenlabs",
+            "voice_id": self.voice_id,
+            "model_id": self.model_id,
+            "output_format": self.output_format,
+            "voice_settings": self.voice_settings.model_dump(),
+        }
+
+    def _record_usage(self, text: str, latency: float):
+        """Enregistrer une synthèse (latence au premier chunk)."""
+        tts_latency.observe(latency)
+        if self.usage is not None:
+            self.usage.record_tts(len(text), latency)
+
     async def text_to_speech_stream(
         self, text: str
     ) -> AsyncGenerator[bytes, None]:
@@ -37,15 +71,21 @@ class ElevenLabsTTSClient:
         """
         try:
             print(f"🔊 TTS génération: {text[:50]}...")
+            started_at = time.monotonic()
+            first_chunk = True
 
             audio_stream = self.client.text_to_speech.convert_as_stream(
                 voice_id=self.voice_id,
                 text=text,
                 model_id=self.model_id,
                 voice_settings=self.voice_settings,
+                output_format=self.output_format,
             )
 
             async for chunk in audio_stream:
+                if first_chunk:
+                    self._record_usage(text, time.monotonic() - started_at)
+                    first_chunk = False
                 yield chunk
 
             print("✅ TTS généré avec succès")
@@ -67,14 +107,19 @@ class ElevenLabsTTSClient:
         """
         try:
             print(f"🔊 TTS génération complète: {text[:50]}...")
+            started_at = time.monotonic()
 
-            audio = await self.client.text_to_speech.convert(
+            # convert() est un générateur async (SDK 1.x): l'audio arrive par chunks
+            audio_stream = self.client.text_to_speech.convert(
                 voice_id=self.voice_id,
                 text=text,
                 model_id=self.model_id,
                 voice_settings=self.voice_settings,
+                output_format=self.output_format,
             )
+            audio = b"".join([chunk async for chunk in audio_stream])
 
+            self._record_usage(text, time.monotonic() - started_at)
             print("✅ TTS généré avec succès")
             return audio
 
@@ -82,6 +127,79 @@ class ElevenLabsTTSClient:
             print(f"❌ Erreur ElevenLabs TTS: {e}")
             raise
 
+    async def text_stream_to_speech(
+        self, text_chunks: AsyncIterator[str]
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Convertir un texte en cours de génération en audio (entrée en streaming).
+
+        Une seule session WebSocket par réponse: chaque phrase complète est
+        envoyée avec flush, et l'audio de la première est joué pendant que le
+        LLM génère la suite.
+
+        Args:
+            text_chunks: Fragments de texte (tokens LLM)
+
+        Yields:
+            Chunks audio en bytes
+        """
+        uri = (
+            f"{settings.elevenlabs_stream_input_url}/{self.voice_id}/stream-input"
+            f"?model_id={self.model_id}&output_format={self.output_format}"
+        )
+        started_at = time.monotonic()
+        sent_text = []
+
+        async with websockets.connect(uri) as ws:
+            # Ouverture de session: réglages de voix et authentification
+            await ws.send(json.dumps({
+                "text": " ",
+                "voice_settings": self.voice_settings.model_dump(),
+                "xi_api_key": settings.elevenlabs_api_key,
+            }))
+
+            async def send_text():
+                buffer = SentenceBuffer()
+                async for delta in text_chunks:
+                    for sentence in buffer.push(delta):
+                        sent_text.append(sentence)
+                        await ws.send(json.dumps({"text": f"{sentence} ", "flush": True}))
+
+                rest = buffer.flush()
+                if rest:
+                    sent_text.append(rest)
+                    await ws.send(json.dumps({"text": f"{rest} ", "flush": True}))
+
+                # Texte vide: fin de l'entrée
+                await ws.send(json.dumps({"text": ""}))
+
+            sender = asyncio.create_task(send_text())
+            first_chunk = True
+
+            try:
+                async for message in ws:
+                    data = json.loads(message)
+
+                    if data.get("audio"):
+                        if first_chunk:
+                            first_chunk_latency = time.monotonic() - started_at
+                            first_chunk = False
+                        yield base64.b64decode(data["audio"])
+
+                    if data.get("isFinal"):
+                        break
+
+                # Remonter une erreur côté LLM
+                await sender
+
+            finally:
+                if not sender.done():
+                    sender.cancel()
+
+        if not first_chunk:
+            self._record_usage(" ".join(sent_text), first_chunk_latency)
+        print("✅ TTS streaming généré avec succès")
+
     async def get_available_voices(self) -> list:
         """
         Récupérer les voix disponibles.
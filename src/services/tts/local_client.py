@@ -0,0 +1,91 @@
+"""Fournisseur TTS local de substitution (tests, démo, panne fournisseur)."""
+import asyncio
+import audioop
+from typing import AsyncGenerator, Optional
+
+import numpy as np
+
+from src.services.tts.base import BaseTTSClient
+
+
+class LocalTTSClient(BaseTTSClient):
+    """
+    Fournisseur en process: produit une tonalité mu-law 8 kHz déterministe.
+
+    La durée suit la longueur du texte; latence et pannes sont réglables
+    pour simuler un fournisseur lent ou défaillant.
+    """
+
+    def __init__(
+            self,
+            first_chunk_delay: float = 0.0,
+            chunk_delay: float = 0.0,
+            error: Optional[Exception] = None,
+            ms_per_character: int = 60,
+            chunk_size: int = 1600,
+            voice_id: str = "local",
+    ):
+        """
+        Initialiser le fournisseur.
+
+        Args:
+            first_chunk_delay: Attente avant le premier chunk (secondes)
+            chunk_delay: Attente entre deux chunks (secondes)
+            error: Exception levée avant le premier chunk (simule une panne)
+            ms_per_character: Durée d'audio produite par caractère
+            chunk_size: Taille des chunks (1600 octets = 200 ms)
+            voice_id: Identifiant de voix (profil de cache)
+        """
+        self.first_chunk_delay = first_chunk_delay
+        self.chunk_delay = chunk_delay
+        self.error = error
+        self.ms_per_character = ms_per_character
+        self.chunk_size = chunk_size
+        self.voice_id = voice_id
+        self.requests = 0
+        self.usage = None
+
+    def voice_profile(self) -> dict:
+        return {"provider": "local", "voice_id": self.voice_id, "output_format": "ulaw_8000"}
+
+    def _render(self, text: str) -> bytes:
+        """Tonalité de 440 Hz, d'une durée proportionnelle au texte."""
+        samples = 8000 * self.ms_per_character * max(len(text), 1) // 1000
+        t = np.arange(samples) / 8000
+        pcm = (np.sin(2 * np.pi * 440 * t) * 6000).astype(np.int16).tobytes()
+        return audioop.lin2ulaw(pcm, 2)
+
+    async def text_to_speech_stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """
+        Convertir texte en audio (streaming).
+
+        Args:
+            text: Texte à convertir
+
+        Yields:
+            Chunks audio en bytes
+        """
+        self.requests += 1
+        await asyncio.sleep(self.first_chunk_delay)
+
+        if self.error is not None:
+            raise self.error
+
+        audio = self._render(text)
+        for i in range(0, len(audio), self.chunk_size):
+            if i and self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            yield audio[i: i + self.chunk_size]
+
+    async def text_to_speech(self, text: str) -> bytes:
+        """
+        Convertir texte en audio (complet).
+
+        Args:
+            text: Texte à convertir
+
+        Returns:
+            Audio complet en bytes
+        """
+        chunks = [chunk async for chunk in self.text_to_speech_stream(text)]
+        return b"".join(chunks)
@@ -0,0 +1,219 @@
+"""Banque de phrases pré-synthétisées (format opérateur), servie depuis un fichier mappé."""
+import asyncio
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.core.config import settings
+from src.services.tts.base import BaseTTSClient
+
+
+class PhraseBank:
+    """
+    Phrases fixes du dialogue rendues une fois par voix.
+
+    Disposition sur disque (un jeu de fichiers par profil de voix):
+        bank-<profil>.bin   audio concaténé
+        bank-<profil>.json  index {phrase: [début, fin]} + profil
+    """
+
+    def __init__(self, directory: str, concurrency: int = 4):
+        """
+        Initialiser la banque.
+
+        Args:
+            directory: Répertoire de stockage
+            concurrency: Synthèses simultanées pendant le préchauffage
+        """
+        self.directory = Path(directory)
+        self.concurrency = concurrency
+        self.is_ready = False
+        self.profile_hash: Optional[str] = None
+        self.voice_profile: Optional[Dict[str, Any]] = None
+        self._index: Dict[str, List[int]] = {}
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    @staticmethod
+    def _hash_profile(voice_profile: Dict[str, Any]) -> str:
+        profile = json.dumps(voice_profile, sort_keys=True, default=str)
+        return hashlib.sha256(profile.encode("utf-8")).hexdigest()[:16]
+
+    def _paths(self, profile_hash: str) -> tuple[Path, Path]:
+        return (
+            self.directory / f"bank-{profile_hash}.bin",
+            self.directory / f"bank-{profile_hash}.json",
+        )
+
+    @contextmanager
+    def _locked(self, profile_hash: str, exclusive: bool):
+        """Verrou de fichier entre workers: la paire bin/index se lit et se publie d'un bloc."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with (self.directory / f"bank-{profile_hash}.lock").open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def load(self, voice_profile: Dict[str, Any]) -> bool:
+        """
+        Charger (mapper en mémoire) la banque d'un profil de voix.
+
+        Args:
+            voice_profile: Profil de voix du client TTS
+
+        Returns:
+            True si une banque existe pour ce profil
+        """
+        profile_hash = self._hash_profile(voice_profile)
+        bin_path, index_path = self._paths(profile_hash)
+
+        if not bin_path.exists() or not index_path.exists():
+            return False
+
+        with self._locked(profile_hash, exclusive=False):
+            with index_path.open(encoding="utf-8") as f:
+                index = json.load(f)["phrases"]
+
+            self._close()
+            self._file = bin_path.open("rb")
+            if os.fstat(self._file.fileno()).st_size > 0:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._index = index
+        self.profile_hash = profile_hash
+        self.voice_profile = voice_profile
+        return True
+
+    def get(self, text: str, voice_profile: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Récupérer l'audio d'une phrase.
+
+        Args:
+            text: Phrase exacte
+            voice_profile: Profil de voix demandé
+
+        Returns:
+            Audio ou None (phrase absente, banque non prête ou autre voix)
+        """
+        if not self.is_ready or self._mmap is None:
+            return None
+
+        span = self._index.get(text)
+        if span is None or voice_profile != self.voice_profile:
+            return None
+
+        return self._mmap[span[0]:span[1]]
+
+    def contains(self, text: str, voice_profile: Dict[str, Any]) -> bool:
+        """La phrase est disponible pour ce profil de voix."""
+        return (
+            self.is_ready
+            and self._mmap is not None
+            and text in self._index
+            and voice_profile == self.voice_profile
+        )
+
+    async def build(self, tts_client: BaseTTSClient, phrases: List[str]) -> int:
+        """
+        Synthétiser les phrases et écrire la banque sur disque.
+
+        Args:
+            tts_client: Client TTS (fournisseur direct, sans cache)
+            phrases: Phrases à rendre
+
+        Returns:
+            Nombre de phrases rendues
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def render(phrase: str) -> bytes:
+            async with semaphore:
+                return await tts_client.text_to_speech(phrase)
+
+        audios = await asyncio.gather(*(render(phrase) for phrase in phrases))
+
+        profile_hash = self._hash_profile(tts_client.voice_profile())
+        bin_path, index_path = self._paths(profile_hash)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Fichiers temporaires propres au process: plusieurs workers peuvent
+        # construire la même banque en même temps
+        index = {}
+        offset = 0
+        with tempfile.NamedTemporaryFile("wb", dir=self.directory, suffix=".tmp", delete=False) as f:
+            tmp_bin = Path(f.name)
+            for phrase, audio in zip(phrases, audios):
+                f.write(audio)
+                index[phrase] = [offset, offset + len(audio)]
+                offset += len(audio)
+
+        with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            tmp_index = Path(f.name)
+            json.dump(
+                {"profile": tts_client.voice_profile(), "phrases": index},
+                f,
+                ensure_ascii=False,
+                default=str,
+            )
+
+        # Paire remplacée sous verrou: un lecteur ne voit jamais le bin d'un
+        # worker avec l'index d'un autre
+        with self._locked(profile_hash, exclusive=True):
+            os.replace(tmp_bin, bin_path)
+            os.replace(tmp_index, index_path)
+
+        print(f"🎙️  Banque de phrases écrite: {len(phrases)} phrases, {offset} octets")
+        return len(phrases)
+
+    async def warm(self, tts_client: BaseTTSClient, phrases: List[str]) -> bool:
+        """
+        Préparer la banque: charger depuis le disque, rendre les phrases manquantes.
+
+        Args:
+            tts_client: Client TTS (fournisseur direct, sans cache)
+            phrases: Phrases attendues
+
+        Returns:
+            True si la banque est prête
+        """
+        voice_profile = tts_client.voice_profile()
+
+        try:
+            loaded = self.load(voice_profile)
+            missing = [p for p in phrases if p not in self._index] if loaded else phrases
+
+            if missing:
+                print(f"🎙️  Préchauffage banque de phrases: {len(missing)} à synthétiser")
+                # Tout re-rendre: la banque reste un fichier unique et cohérent
+                await self.build(tts_client, phrases)
+                self.load(voice_profile)
+
+            self.is_ready = True
+            print(f"✅ Banque de phrases prête: {len(self._index)} phrases")
+
+        except Exception as e:
+            print(f"❌ Erreur préchauffage banque de phrases: {e}")
+
+        return self.is_ready
+
+
+# Instance globale
+phrase_bank = PhraseBank(settings.phrase_bank_dir)
@@ -0,0 +1,172 @@
+"""Planification TTS: découpage en phrases, synthèse parallèle, lecture dans l'ordre."""
+import asyncio
+import re
+import time
+from contextlib import nullcontext
+from typing import AsyncGenerator, List, Optional, Set
+
+from src.core.config import settings
+from src.services.tts.base import BaseTTSClient
+from src.utils.metrics import (
+    tts_time_to_first_audio,
+    tts_response_duration,
+    tts_planner_segments,
+)
+
+# Fin d'une unité de dialogue (une confirmation se termine par "Autre chose ?")
+_STRONG_BOUNDARY = re.compile(r"(?<=[?!])\s+")
+# Fin de phrase, puis fin de proposition (la virgule décimale "1,5" n'est pas coupée)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.;:])\s+")
+_CLAUSE_BOUNDARY = re.compile(r"(?<=,)\s+")
+
+
+# Préchargements en cours (référence forte: une tâche orpheline peut être collectée)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class TTSPlanner:
+    """Découpe une réponse et la synthétise par morceaux, lus dans l'ordre."""
+
+    def __init__(
+            self,
+            tts_client: BaseTTSClient,
+            max_segment_chars: int = settings.tts_planner_max_segment_chars,
+            slots: Optional[asyncio.Semaphore] = None,
+    ):
+        """
+        Initialiser le planificateur.
+
+        Args:
+            tts_client: Client TTS (avec cache)
+            max_segment_chars: Longueur au-delà de laquelle une unité est redécoupée
+            slots: Limite de concurrence propre au planificateur (par défaut aucune:
+                la limite du fournisseur est appliquée par TTSRouter)
+        """
+        self.tts_client = tts_client
+        self.max_segment_chars = max_segment_chars
+        self.slots = slots
+
+    def _pack(self, parts: List[str]) -> List[str]:
+        """Regrouper des morceaux consécutifs tant qu'ils tiennent dans max_segment_chars."""
+        packed: List[str] = []
+        for part in parts:
+            if packed and len(packed[-1]) + 1 + len(part) <= self.max_segment_chars:
+                packed[-1] = f"{packed[-1]} {part}"
+            else:
+                packed.append(part)
+        return packed
+
+    def split_text(self, text: str) -> List[str]:
+        """
+        Découper une réponse en segments synthétisables séparément.
+
+        Chaque unité de dialogue (terminée par ? ou !) reste entière pour
+        profiter du cache et des segments pré-rendus. Une unité trop longue, ou
+        qui contient des phrases pré-rendues (page de récapitulatif), est coupée
+        aux phrases: les phrases pré-rendues restent seules, les autres sont
+        regroupées puis coupées aux virgules si besoin.
+
+        Args:
+            text: Réponse complète
+
+        Returns:
+            Segments dans l'ordre
+        """
+        segments: List[str] = []
+        prerendered = self.tts_client.is_prerendered
+
+        def add_run(run: List[str]) -> None:
+            for sentence in self._pack(run):
+                if len(sentence) <= self.max_segment_chars:
+                    segments.append(sentence)
+                else:
+                    segments.extend(self._pack(_CLAUSE_BOUNDARY.split(sentence)))
+
+        for unit in _STRONG_BOUNDARY.split(text.strip()):
+            sentences = _SENTENCE_BOUNDARY.split(unit)
+            has_prerendered = len(sentences) > 1 and any(prerendered(s) for s in sentences)
+
+            if prerendered(unit) or (len(unit) <= self.max_segment_chars and not has_prerendered):
+                segments.append(unit)
+                continue
+
+            run: List[str] = []
+            for sentence in sentences:
+                if prerendered(sentence):
+                    add_run(run)
+                    run = []
+                    segments.append(sentence)
+                else:
+                    run.append(sentence)
+            add_run(run)
+
+        return [segment for segment in segments if segment]
+
+    def prefetch(self, text: str) -> None:
+        """
+        Synthétiser une réponse à l'avance, en arrière-plan, pour le cache.
+
+        Les segments sont ceux que stream() demandera: la lecture sera un hit
+        (pour une phrase assemblée, c'est le rendu du produit qui est préparé).
+
+        Args:
+            text: Réponse à venir
+        """
+        for segment in self.split_text(text):
+            task = asyncio.create_task(self._warm(segment))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+    async def _warm(self, segment: str) -> None:
+        try:
+            await self.tts_client.text_to_speech(segment)
+        except Exception as e:
+            print(f"⚠️  Préchargement TTS impossible ({segment[:30]}...): {e}")
+
+    async def _produce(self, segment: str, queue: asyncio.Queue) -> None:
+        """Synthétiser un segment dans sa file (None marque la fin)."""
+        try:
+            async with self.slots or nullcontext():
+                async for chunk in self.tts_client.text_to_speech_stream(segment):
+                    queue.put_nowait(chunk)
+        except Exception as e:
+            print(f"⚠️  Segment TTS ignoré ({segment[:30]}...): {e}")
+        finally:
+            queue.put_nowait(None)
+
+    async def stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """
+        Synthétiser une réponse, segments en parallèle, audio dans l'ordre.
+
+        Args:
+            text: Réponse complète
+
+        Yields:
+            Chunks audio, segment après segment
+        """
+        start_time = time.perf_counter()
+        segments = self.split_text(text)
+        tts_planner_segments.observe(len(segments))
+
+        queues = [asyncio.Queue() for _ in segments]
+        tasks = [
+            asyncio.create_task(self._produce(segment, queue))
+            for segment, queue in zip(segments, queues)
+        ]
+
+        first_audio = True
+        try:
+            for queue in queues:
+                while (chunk := await queue.get()) is not None:
+                    if first_audio:
+                        tts_time_to_first_audio.observe(time.perf_counter() - start_time)
+                        first_audio = False
+                    yield chunk
+
+            tts_response_duration.observe(time.perf_counter() - start_time)
+
+        finally:
+            # Lecteur interrompu (raccroché): libérer les créneaux du fournisseur
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
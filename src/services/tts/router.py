@@ -0,0 +1,359 @@
+"""Routage TTS: limite de concurrence par fournisseur, délais et repli."""
+import asyncio
+import time
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional
+
+from src.core.config import settings
+from src.services.tts.base import BaseTTSClient, audio_degraded
+from src.services.tts.elevenlabs_client import ElevenLabsTTSClient
+from src.services.tts.local_client import LocalTTSClient
+from src.services.tts.phrase_bank import PhraseBank, phrase_bank
+from src.utils.metrics import (
+    tts_router_attempts_total,
+    tts_router_served_total,
+    tts_router_queue_delay,
+)
+
+
+class _ProviderSlots:
+    """Créneaux d'un fournisseur: sa limite de requêtes simultanées, et la file d'attente."""
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.active = 0
+
+
+# Créneaux par fournisseur, partagés par tous les appels du process
+# (la limite est celle du compte, pas celle d'un appel)
+_provider_slots: Dict[str, _ProviderSlots] = {}
+
+
+class TTSRoute:
+    """Un fournisseur du routeur, avec sa file et son délai de premier chunk."""
+
+    def __init__(
+            self,
+            name: str,
+            client: BaseTTSClient,
+            max_concurrency: int,
+            first_chunk_deadline: float,
+            provider: Optional[str] = None,
+    ):
+        """
+        Initialiser la route.
+
+        Args:
+            name: Nom (étiquette des métriques)
+            client: Client du fournisseur
+            max_concurrency: Requêtes simultanées autorisées par le fournisseur
+            first_chunk_deadline: Délai (file incluse) avant de solliciter la route suivante
+            provider: Compte fournisseur (défaut: name); les routes d'un même
+                compte partagent ses créneaux
+        """
+        self.name = name
+        self.client = client
+        self.first_chunk_deadline = first_chunk_deadline
+        self.slots = _provider_slots.setdefault(provider or name, _ProviderSlots(max_concurrency))
+
+    async def stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """Synthétiser en occupant un créneau du fournisseur (attente en file sinon)."""
+        queued_at = time.monotonic()
+        async with self.slots.semaphore:
+            tts_router_queue_delay.labels(provider=self.name).observe(
+                time.monotonic() - queued_at
+            )
+            self.slots.active += 1
+            try:
+                async for chunk in self.client.text_to_speech_stream(text):
+                    yield chunk
+            finally:
+                self.slots.active -= 1
+
+
+class _Attempt:
+    """Synthèse en cours sur une route, premier chunk attendu en tâche."""
+
+    def __init__(self, route: TTSRoute, text: str):
+        self.route = route
+        self.stream = route.stream(text)
+        self.first_chunk = asyncio.create_task(self._next())
+
+    async def _next(self) -> bytes:
+        return await self.stream.__anext__()
+
+    async def cancel(self) -> None:
+        if not self.first_chunk.done():
+            self.first_chunk.cancel()
+        try:
+            await self.first_chunk
+        except (asyncio.CancelledError, Exception):
+            pass
+        await self.stream.aclose()
+
+
+class TTSRouter(BaseTTSClient):
+    """
+    Client TTS qui répartit les synthèses entre plusieurs fournisseurs.
+
+    La route principale est sollicitée d'abord; si son premier chunk n'arrive
+    pas dans le délai, la route suivante est lancée en parallèle (la plus
+    rapide gagne). Si toutes échouent, l'audio pré-rendu prend le relais: une
+    voix un peu dégradée plutôt qu'un silence.
+    """
+
+    def __init__(
+            self,
+            routes: List[TTSRoute],
+            bank: Optional[PhraseBank] = phrase_bank,
+            fallback_phrase: Optional[str] = None,
+    ):
+        """
+        Initialiser le routeur.
+
+        Args:
+            routes: Fournisseurs par ordre de préférence (le premier donne la voix)
+            bank: Banque de phrases pré-rendues (voix principale)
+            fallback_phrase: Phrase pré-rendue jouée si aucune synthèse n'aboutit
+        """
+        self.routes = routes
+        self.bank = bank
+        self.fallback_phrase = fallback_phrase
+
+    @property
+    def primary(self) -> BaseTTSClient:
+        return self.routes[0].client
+
+    @property
+    def voice_id(self) -> str:
+        return self.primary.voice_id
+
+    @property
+    def usage(self):
+        """Comptabilité de l'appel, partagée par tous les fournisseurs."""
+        return self.primary.usage
+
+    @usage.setter
+    def usage(self, value):
+        for route in self.routes:
+            route.client.usage = value
+
+    def voice_profile(self) -> dict:
+        return self.primary.voice_profile()
+
+    def _prerendered(self, text: str) -> Optional[bytes]:
+        """Audio pré-rendu de la phrase, à défaut la phrase de repli."""
+        if self.bank is None:
+            return None
+
+        voice_profile = self.voice_profile()
+        for candidate in (text, self.fallback_phrase):
+            if candidate:
+                audio = self.bank.get(candidate, voice_profile)
+                if audio is not None:
+                    return audio
+        return None
+
+    async def _race(self, text: str) -> tuple[Optional[_Attempt], Optional[bytes]]:
+        """
+        Lancer les routes en cascade jusqu'au premier chunk.
+
+        Returns:
+            (tentative gagnante, premier chunk), ou (None, None) si tout a échoué
+        """
+        pending: List[_Attempt] = []
+        winner: Optional[_Attempt] = None
+        first_chunk: Optional[bytes] = None
+
+        try:
+            for index, route in enumerate(self.routes):
+                pending.append(_Attempt(route, text))
+
+                # Les routes déjà lancées restent en course pendant ce délai
+                deadline = time.monotonic() + route.first_chunk_deadline
+                last_route = index == len(self.routes) - 1
+
+                while pending and winner is None:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+
+                    done, _ = await asyncio.wait(
+                        [attempt.first_chunk for attempt in pending],
+                        timeout=timeout,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+
+                    for attempt in [a for a in pending if a.first_chunk in done]:
+                        pending.remove(attempt)
+                        try:
+                            chunk = attempt.first_chunk.result()
+                        except StopAsyncIteration:
+                            # Audio vide: traité comme un échec
+                            tts_router_attempts_total.labels(
+                                provider=attempt.route.name, result="empty"
+                            ).inc()
+                            continue
+                        except Exception as e:
+                            print(f"⚠️  TTS {attempt.route.name} en échec: {e}")
+                            tts_router_attempts_total.labels(
+                                provider=attempt.route.name, result="error"
+                            ).inc()
+                            continue
+
+                        if winner is None:
+                            winner, first_chunk = attempt, chunk
+                            tts_router_attempts_total.labels(
+                                provider=attempt.route.name, result="first_chunk"
+                            ).inc()
+                        else:
+                            await attempt.cancel()
+
+                if winner is not None:
+                    break
+
+                if not last_route:
+                    for attempt in pending:
+                        if attempt.route is route:
+                            print(f"⏱️  TTS {route.name} lent, route suivante sollicitée")
+                            tts_router_attempts_total.labels(
+                                provider=route.name, result="slow"
+                            ).inc()
+
+            for attempt in pending:
+                if winner is None:
+                    tts_router_attempts_total.labels(
+                        provider=attempt.route.name, result="timeout"
+                    ).inc()
+                await attempt.cancel()
+
+        except BaseException:
+            # Lecteur interrompu: ne laisser aucune synthèse orpheline
+            for attempt in pending:
+                await attempt.cancel()
+            if winner is not None:
+                await winner.stream.aclose()
+            raise
+
+        return winner, first_chunk
+
+    async def text_to_speech_stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """
+        Convertir texte en audio (streaming), avec repli.
+
+        Args:
+            text: Texte à convertir
+
+        Yields:
+            Chunks audio en bytes
+        """
+        winner, first_chunk = await self._race(text)
+
+        if winner is None:
+            audio = self._prerendered(text)
+            if audio is None:
+                tts_router_served_total.labels(source="none").inc()
+                raise RuntimeError("Aucun fournisseur TTS disponible")
+
+            print(f"🆘 TTS de repli pré-rendu pour: {text[:30]}...")
+            tts_router_served_total.labels(source="prerendered").inc()
+            audio_degraded.set(True)
+            yield audio
+            return
+
+        tts_router_served_total.labels(source=winner.route.name).inc()
+        if winner.route is not self.routes[0]:
+            # Autre voix: ne pas la mettre en cache sous le profil principal
+            audio_degraded.set(True)
+
+        try:
+            yield first_chunk
+            async for chunk in winner.stream:
+                yield chunk
+        except Exception as e:
+            # Coupure en cours de phrase: on garde l'audio déjà envoyé
+            print(f"⚠️  TTS {winner.route.name} interrompu: {e}")
+            audio_degraded.set(True)
+        finally:
+            await winner.stream.aclose()
+
+    async def text_to_speech(self, text: str) -> bytes:
+        """
+        Convertir texte en audio (complet), avec repli.
+
+        Args:
+            text: Texte à convertir
+
+        Returns:
+            Audio complet en bytes
+        """
+        chunks = [chunk async for chunk in self.text_to_speech_stream(text)]
+        return b"".join(chunks)
+
+    async def text_stream_to_speech(
+            self, text_chunks: AsyncIterator[str]
+    ) -> AsyncGenerator[bytes, None]:
+        """Texte généré à la volée: session d'entrée en streaming du fournisseur principal."""
+        async for chunk in self.primary.text_stream_to_speech(text_chunks):
+            yield chunk
+
+    def get_stats(self) -> dict:
+        """Synthèses en cours par fournisseur."""
+        return {
+            route.name: {
+                "active": route.slots.active,
+                "max_concurrency": route.slots.max_concurrency,
+            }
+            for route in self.routes
+        }
+
+
+def create_tts_router(fallback_phrase: Optional[str] = None) -> TTSRouter:
+    """
+    Construire le routeur depuis la configuration.
+
+    Args:
+        fallback_phrase: Phrase pré-rendue jouée si aucune synthèse n'aboutit
+
+    Returns:
+        Routeur ElevenLabs (modèle principal, puis modèle rapide ou fournisseur local)
+
+    Raises:
+        ValueError: Fournisseur local demandé hors développement/test
+    """
+    routes = [
+        TTSRoute(
+            "elevenlabs",
+            ElevenLabsTTSClient(),
+            max_concurrency=settings.tts_max_concurrency,
+            first_chunk_deadline=settings.tts_first_chunk_deadline,
+        )
+    ]
+
+    if settings.tts_secondary_provider == "elevenlabs":
+        # Même compte: même limite de concurrence que la route principale
+        routes.append(
+            TTSRoute(
+                "secondary_elevenlabs",
+                ElevenLabsTTSClient(model_id=settings.tts_secondary_model),
+                max_concurrency=settings.tts_max_concurrency,
+                first_chunk_deadline=settings.tts_secondary_first_chunk_deadline,
+                provider="elevenlabs",
+            )
+        )
+    elif settings.tts_secondary_provider == "local":
+        # Tonalité de test: jamais jouée à un vrai appelant
+        if settings.app_env not in ("development", "test"):
+            raise ValueError(
+                f"tts_secondary_provider=local interdit en environnement {settings.app_env}"
+            )
+        routes.append(
+            TTSRoute(
+                "secondary_local",
+                LocalTTSClient(),
+                max_concurrency=settings.tts_secondary_max_concurrency,
+                first_chunk_deadline=settings.tts_secondary_first_chunk_deadline,
+            )
+        )
+
+    return TTSRouter(routes, fallback_phrase=fallback_phrase)
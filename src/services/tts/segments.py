@@ -0,0 +1,201 @@
+"""TTS concaténatif: phrases à trous assemblées à partir de segments pré-rendus."""
+import re
+from string import Formatter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.audio.format_converter import AudioFormatConverter
+from src.core.config import settings
+from src.services.tts.base import BaseTTSClient
+from src.services.tts.phrase_bank import PhraseBank
+from src.utils.metrics import tts_segments_total
+
+# Seul format dont on sait décoder et raccorder les échantillons
+SEGMENT_OUTPUT_FORMAT = "ulaw_8000"
+
+# Unités de l'extraction (enum de extract_order)
+DEFAULT_UNITS = ("boites", "unités", "flacons")
+
+
+class SegmentAssembler:
+    """
+    Assemble des phrases à trous à partir de segments audio.
+
+    Les segments sans variable, les quantités et les unités sont pré-rendus dans
+    une banque dédiée; le nom du produit est synthétisé une fois puis servi par
+    le cache TTS. Toute phrase qui ne correspond pas au gabarit, ou dont un
+    segment manque, repart en synthèse complète.
+    """
+
+    def __init__(
+            self,
+            bank: PhraseBank,
+            units: Sequence[str] = DEFAULT_UNITS,
+            max_quantity: int = 1000,
+            crossfade_ms: int = 10,
+            max_product_length: int = 80,
+    ):
+        """
+        Initialiser l'assembleur.
+
+        Args:
+            bank: Banque des segments pré-rendus
+            units: Unités pré-rendues
+            max_quantity: Quantités pré-rendues de 1 à max_quantity
+            crossfade_ms: Durée du fondu enchaîné entre segments
+            max_product_length: Au-delà, synthèse complète (prosodie d'un nom long)
+        """
+        self.bank = bank
+        self.units = list(units)
+        self.max_quantity = max_quantity
+        self.crossfade_ms = crossfade_ms
+        self.max_product_length = max_product_length
+        self.templates: List[Tuple[List[str], re.Pattern]] = []
+
+    def set_templates(self, templates: Sequence[Sequence[str]]) -> None:
+        """
+        Définir les gabarits segmentés (ex: DialogueManager.SEGMENTED_TEMPLATES).
+
+        Args:
+            templates: Gabarits, chacun une liste de segments qui, joints par
+                des espaces, forment la phrase
+        """
+        groups = {
+            "quantity": r"(?P<quantity>\d+)",
+            "unit": "(?P<unit>" + "|".join(re.escape(u) for u in self.units) + ")",
+            "product": r"(?P<product>.+?)",
+        }
+
+        self.templates = []
+        for segments in templates:
+            pattern = ""
+            for literal, field, _, _ in Formatter().parse(" ".join(segments)):
+                pattern += re.escape(literal)
+                if field:
+                    pattern += groups[field]
+
+            self.templates.append((list(segments), re.compile(f"^{pattern}$")))
+
+    def _is_prerendered(self, segment: str) -> bool:
+        """Segment indépendant du produit."""
+        return "{product}" not in segment
+
+    def prerendered_phrases(self) -> List[str]:
+        """
+        Toutes les variantes des segments pré-rendus.
+
+        Returns:
+            Textes à synthétiser dans la banque de segments
+        """
+        phrases = []
+        segments = [segment for template, _ in self.templates for segment in template]
+        for segment in segments:
+            if not self._is_prerendered(segment):
+                continue
+
+            fields = {name for _, name, _, _ in Formatter().parse(segment) if name}
+            if not fields:
+                phrases.append(segment)
+            elif fields == {"quantity"}:
+                phrases.extend(
+                    segment.format(quantity=q) for q in range(1, self.max_quantity + 1)
+                )
+            elif fields == {"unit"}:
+                phrases.extend(segment.format(unit=u) for u in self.units)
+
+        return list(dict.fromkeys(phrases))
+
+    def split(self, text: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Découper une phrase selon le premier gabarit correspondant.
+
+        Args:
+            text: Phrase complète
+
+        Returns:
+            Couples (segment du gabarit, texte), ou None si la phrase ne se
+            prête pas à l'assemblage
+        """
+        for segments, pattern in self.templates:
+            match = pattern.match(text)
+            if not match:
+                continue
+
+            values: Dict[str, str] = match.groupdict()
+            if "quantity" in values and not 1 <= int(values["quantity"]) <= self.max_quantity:
+                return None
+            if len(values.get("product", "")) > self.max_product_length:
+                return None
+
+            return [(segment, segment.format(**values)) for segment in segments]
+
+        return None
+
+    async def assemble(self, text: str, tts_client: BaseTTSClient) -> Optional[bytes]:
+        """
+        Assembler l'audio d'une phrase.
+
+        Args:
+            text: Phrase complète
+            tts_client: Client TTS avec cache (rend le nom du produit)
+
+        Returns:
+            Audio mu-law 8 kHz, ou None pour une synthèse complète
+        """
+        if not settings.tts_segments_enabled or not self.bank.is_ready:
+            return None
+
+        voice_profile = tts_client.voice_profile()
+        if voice_profile.get("output_format") != SEGMENT_OUTPUT_FORMAT:
+            return None
+
+        parts = self.split(text)
+        if parts is None:
+            return None
+
+        try:
+            pcm_segments = []
+            for segment_template, part in parts:
+                if self._is_prerendered(segment_template):
+                    audio = self.bank.get(part, voice_profile)
+                    if audio is None:
+                        tts_segments_total.labels(result="missing_segment").inc()
+                        return None
+                else:
+                    audio = await tts_client.text_to_speech(part)
+
+                pcm = AudioFormatConverter.mulaw_to_pcm(audio)
+                pcm_segments.append(AudioFormatConverter.trim_silence(pcm))
+
+            pcm = AudioFormatConverter.crossfade(pcm_segments, overlap_ms=self.crossfade_ms)
+
+        except Exception as e:
+            print(f"⚠️  Assemblage TTS impossible, synthèse complète: {e}")
+            tts_segments_total.labels(result="error").inc()
+            return None
+
+        tts_segments_total.labels(result="assembled").inc()
+        return AudioFormatConverter.pcm_to_mulaw(pcm)
+
+    async def warm(
+            self, tts_client: BaseTTSClient, templates: Sequence[Sequence[str]]
+    ) -> bool:
+        """
+        Définir les gabarits et préparer la banque de segments.
+
+        Args:
+            tts_client: Client TTS (fournisseur direct, sans cache)
+            templates: Gabarits segmentés
+
+        Returns:
+            True si la banque est prête
+        """
+        self.set_templates(templates)
+        return await self.bank.warm(tts_client, self.prerendered_phrases())
+
+
+# Instance globale
+segment_assembler = SegmentAssembler(
+    PhraseBank(settings.segment_bank_dir),
+    max_quantity=settings.tts_segments_max_quantity,
+    crossfade_ms=settings.tts_segments_crossfade_ms,
+)
@@ -0,0 +1,80 @@
+"""Découpage à la volée d'un texte généré token par token (LLM -> TTS)."""
+import re
+from typing import List, Optional
+
+# Fin de phrase suivie d'un espace (le point de "500 mg." en fin de flux est vidé par flush)
+_SENTENCE_END = re.compile(r"[.!?;:]\s+")
+_CLAUSE_END = re.compile(r",\s+")
+
+
+class SentenceBuffer:
+    """
+    Accumule des fragments de texte et libère des phrases complètes.
+
+    Une phrase part au TTS dès sa ponctuation finale; une proposition longue
+    part à la virgule, et un texte sans ponctuation au dernier espace, pour ne
+    pas retarder le premier audio.
+    """
+
+    def __init__(self, clause_min_chars: int = 40, max_chars: int = 200):
+        """
+        Initialiser le tampon.
+
+        Args:
+            clause_min_chars: Longueur minimale pour couper à une virgule
+            max_chars: Longueur forçant une coupe au dernier espace
+        """
+        self.clause_min_chars = clause_min_chars
+        self.max_chars = max_chars
+        self.text = ""
+
+    def push(self, delta: str) -> List[str]:
+        """
+        Ajouter un fragment.
+
+        Args:
+            delta: Fragment généré
+
+        Returns:
+            Segments prêts à synthétiser (éventuellement aucun)
+        """
+        self.text += delta
+        ready = []
+
+        while True:
+            cut = self._find_cut()
+            if cut is None:
+                break
+            segment, self.text = self.text[:cut].strip(), self.text[cut:]
+            if segment:
+                ready.append(segment)
+
+        return ready
+
+    def _find_cut(self) -> Optional[int]:
+        """Position de coupe dans le tampon, ou None s'il faut attendre."""
+        match = _SENTENCE_END.search(self.text)
+        if match:
+            return match.end()
+
+        if len(self.text) >= self.clause_min_chars:
+            match = _CLAUSE_END.search(self.text, self.clause_min_chars - 1)
+            if match:
+                return match.end()
+
+        if len(self.text) >= self.max_chars:
+            space = self.text.rfind(" ", 0, self.max_chars)
+            if space > 0:
+                return space + 1
+
+        return None
+
+    def flush(self) -> Optional[str]:
+        """
+        Vider le tampon en fin de génération.
+
+        Returns:
+            Dernier segment, ou None s'il est vide
+        """
+        segment, self.text = self.text.strip(), ""
+        return segment or None
@@ -1,13 +1,41 @@
 """Service base de données vectorielle."""
+from src.services.vector_db.model_registry import ModelRegistry, model_registry
+from src.services.vector_db.embedding_service import EmbeddingService, embedding_service
+from src.services.vector_db.query_cache import QueryEmbeddingCache, query_embedding_cache
+from src.services.vector_db.local_index import LocalVectorIndex, local_vector_index
+from src.services.vector_db.hybrid_search import (
+    LexicalIndex,
+    HybridSearcher,
+    lexical_index,
+    hybrid_searcher,
+)
+from src.services.vector_db.phonetic_index import PhoneticIndex, phonetic_index
 from src.services.vector_db.qcadrant_client import qdrant_client, QdrantClient
 from src.services.vector_db.embeddings import EmbeddingGenerator, embedding_generator
 from src.services.vector_db.indexer import ProductIndexer, product_indexer
+from src.services.vector_db.catalog_sync import CatalogSync, catalog_sync
 
 __all__ = [
+    "ModelRegistry",
+    "model_registry",
+    "EmbeddingService",
+    "embedding_service",
+    "QueryEmbeddingCache",
+    "query_embedding_cache",
+    "LocalVectorIndex",
+    "local_vector_index",
+    "LexicalIndex",
+    "HybridSearcher",
+    "lexical_index",
+    "hybrid_searcher",
+    "PhoneticIndex",
+    "phonetic_index",
     "qdrant_client",
     "QdrantClient",
     "EmbeddingGenerator",
     "embedding_generator",
     "ProductIndexer",
     "product_indexer",
+    "CatalogSync",
+    "catalog_sync",
 ]
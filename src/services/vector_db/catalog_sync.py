@@ -0,0 +1,252 @@
+"""Synchronisation incrémentale du catalogue (base -> Qdrant et index local)."""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select, tuple_
+
+from src.core.config import settings
+from src.data.database import AsyncSessionLocal
+from src.data.models.product import Product
+from src.services.vector_db.qcadrant_client import qdrant_client
+from src.utils.metrics import catalog_sync_changes_total
+
+
+class CatalogSync:
+    """
+    Suivi des modifications du catalogue par Product.updated_at.
+
+    Chaque passage ne lit que les lignes modifiées depuis le dernier point
+    de synchronisation et les compare aux points de Qdrant: seules celles
+    dont le texte embeddé change sont réencodées, les autres ne reçoivent
+    que leur nouveau payload. Les suppressions (lignes absentes de la base)
+    sont rapprochées à un rythme plus lent. La comparaison se fait avec
+    Qdrant: plusieurs workers peuvent synchroniser en même temps, seul le
+    premier écrit, les autres ne mettent à jour que leur index local.
+    """
+
+    def __init__(
+            self,
+            batch_size: int = 256,
+            overlap_seconds: float = 5.0,
+            max_delete_ratio: float = 0.2,
+    ):
+        """
+        Initialiser la synchronisation.
+
+        Args:
+            batch_size: Lignes lues (et comparées) par page
+            overlap_seconds: Relecture avant le point de synchronisation
+                (transactions validées après une ligne plus récente)
+            max_delete_ratio: Part maximale de l'index supprimable en un passage
+        """
+        self.batch_size = batch_size
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.max_delete_ratio = max_delete_ratio
+
+        # updated_at de la ligne la plus récente synchronisée
+        self.watermark: Optional[datetime] = None
+        self.last_sync_at: Optional[float] = None
+        self.last_reconcile_at: Optional[float] = None
+        self._counts = {"embedded": 0, "payload": 0, "local": 0, "deleted": 0}
+
+    @staticmethod
+    def product_dict(product: Product) -> Dict[str, Any]:
+        """Ligne produit au format attendu par QdrantClient."""
+        return {
+            "id": product.id,
+            "cip13": product.cip13,
+            "ean": product.ean,
+            "name": product.name,
+            "category": product.category,
+            "supplier_code": product.supplier_code,
+            "unit_price": product.unit_price,
+            "updated_at": product.updated_at.isoformat() if product.updated_at else None,
+        }
+
+    def _initial_watermark(self) -> Optional[datetime]:
+        """Point de départ: ligne la plus récente déjà présente dans l'index local."""
+        dates = [
+            p["updated_at"] for p in qdrant_client.local_index.payloads() if p.get("updated_at")
+        ]
+        return datetime.fromisoformat(max(dates, key=datetime.fromisoformat)) if dates else None
+
+    # ---------- Modifications ----------
+
+    async def _changed_rows(self, cursor: Optional[Tuple[datetime, int]]) -> List[Product]:
+        """Page suivante de lignes modifiées, par (updated_at, id) croissants."""
+        query = select(Product).order_by(Product.updated_at, Product.id).limit(self.batch_size)
+        if cursor is not None:
+            query = query.where(tuple_(Product.updated_at, Product.id) > tuple_(*cursor))
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(query)
+            return list(result.scalars().all())
+
+    async def _apply(self, products: List[Dict[str, Any]]) -> None:
+        """Répercuter une page de lignes modifiées."""
+        current = await qdrant_client.retrieve_points(
+            [p["id"] for p in products], with_vectors=qdrant_client.local_index is not None
+        )
+
+        to_embed, to_update, up_to_date = [], [], []
+        for product in products:
+            point = current.get(product["id"])
+            if point is None or qdrant_client.product_text(point.payload) != qdrant_client.product_text(product):
+                to_embed.append(product)
+            elif point.payload != qdrant_client.product_point(product, []).payload:
+                to_update.append(product)
+            else:
+                up_to_date.append(point)
+
+        if to_embed:
+            vectors = await asyncio.to_thread(qdrant_client.encode_products, to_embed)
+            await qdrant_client.upsert_vectors(to_embed, vectors)
+        if to_update:
+            await qdrant_client.update_payloads(to_update)
+
+        # Déjà écrits par un autre worker: seul l'index local est en retard
+        local_index = qdrant_client.local_index
+        stale = []
+        if local_index is not None and local_index.is_ready and up_to_date:
+            local = local_index.get([point.id for point in up_to_date])
+            stale = [point for point in up_to_date if local.get(point.id) != point.payload]
+        if stale:
+            await local_index.upsert(
+                [point.id for point in stale],
+                np.array([point.vector for point in stale], dtype=np.float32),
+                [point.payload for point in stale],
+            )
+
+        for kind, count in (("embedded", len(to_embed)), ("payload", len(to_update)), ("local", len(stale))):
+            if count:
+                self._counts[kind] += count
+                catalog_sync_changes_total.labels(kind=kind).inc(count)
+
+    async def sync_once(self, since: Optional[datetime] = None) -> int:
+        """
+        Répercuter les lignes modifiées depuis le dernier passage.
+
+        Args:
+            since: Relire aussi les lignes modifiées depuis cette date
+                (rattrapage après une réindexation complète)
+
+        Returns:
+            Nombre de lignes lues (-1 si l'index local n'est pas encore chargé)
+        """
+        if since is not None:
+            self.watermark = min(self.watermark or since, since)
+
+        local_index = qdrant_client.local_index
+        if self.watermark is None and local_index is not None:
+            if not local_index.is_ready:
+                return -1
+            self.watermark = self._initial_watermark()
+
+        cursor = (self.watermark - self.overlap, 0) if self.watermark else None
+        seen = 0
+        while True:
+            rows = await self._changed_rows(cursor)
+            if not rows:
+                break
+
+            await self._apply([self.product_dict(row) for row in rows])
+            seen += len(rows)
+
+            last = rows[-1]
+            if last.updated_at is None:
+                break
+            cursor = (last.updated_at, last.id)
+            self.watermark = max(self.watermark or last.updated_at, last.updated_at)
+            if len(rows) < self.batch_size:
+                break
+
+        self.last_sync_at = time.time()
+        return seen
+
+    # ---------- Suppressions ----------
+
+    async def reconcile_deletions(self) -> int:
+        """
+        Retirer de l'index les produits supprimés de la base.
+
+        Returns:
+            Nombre de produits retirés
+        """
+        # Index lu avant la base: un produit créé entre-temps n'est pas supprimé
+        local_index = qdrant_client.local_index
+        if local_index is not None and local_index.is_ready:
+            indexed = set(local_index.ids())
+        else:
+            indexed = set()
+            async for points in qdrant_client.iter_points(with_vectors=False, with_payload=False):
+                indexed.update(point.id for point in points)
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(select(Product.id))
+            existing = set(result.scalars().all())
+
+        removed = sorted(indexed - existing)
+        self.last_reconcile_at = time.time()
+        if not removed:
+            return 0
+
+        # Base vide ou incomplète: ne pas vider l'index
+        if len(removed) > self.max_delete_ratio * len(indexed):
+            print(
+                f"⚠️  Synchronisation catalogue: {len(removed)}/{len(indexed)} produits "
+                f"absents de la base, suppression ignorée"
+            )
+            return 0
+
+        for start in range(0, len(removed), self.batch_size):
+            await qdrant_client.delete_products(removed[start:start + self.batch_size])
+
+        self._counts["deleted"] += len(removed)
+        catalog_sync_changes_total.labels(kind="deleted").inc(len(removed))
+        print(f"🗑️  Synchronisation catalogue: {len(removed)} produits retirés de l'index")
+        return len(removed)
+
+    # ---------- Tâche de fond ----------
+
+    async def run(self, interval: float, reconcile_interval: float) -> None:
+        """
+        Synchroniser en continu (tâche de fond).
+
+        Args:
+            interval: Secondes entre deux passages
+            reconcile_interval: Secondes entre deux rapprochements des suppressions
+        """
+        while True:
+            try:
+                changed = await self.sync_once()
+                if changed > 0:
+                    print(f"🔄 Synchronisation catalogue: {changed} produits modifiés")
+
+                due = self.last_reconcile_at is None or time.time() - self.last_reconcile_at >= reconcile_interval
+                if changed >= 0 and due:
+                    await self.reconcile_deletions()
+
+            except Exception as e:
+                print(f"❌ Erreur synchronisation catalogue: {e}")
+
+            await asyncio.sleep(interval)
+
+    def get_stats(self) -> dict:
+        """Point de synchronisation et volumes traités."""
+        return {
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "last_sync_at": self.last_sync_at,
+            "last_reconcile_at": self.last_reconcile_at,
+            **self._counts,
+        }
+
+
+# Instance globale
+catalog_sync = CatalogSync(
+    batch_size=settings.catalog_sync_batch_size,
+    overlap_seconds=settings.catalog_sync_overlap_seconds,
+    max_delete_ratio=settings.catalog_sync_max_delete_ratio,
+)
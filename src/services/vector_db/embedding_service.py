@@ -0,0 +1,138 @@
+"""Inférence d'embeddings hors boucle, avec micro-batchs partagés entre appels."""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.core.config import settings
+from src.services.vector_db.model_registry import ModelRegistry, model_registry
+from src.utils.metrics import embedding_queue_delay, embedding_batch_size
+
+
+class EmbeddingService:
+    """
+    Encode les requêtes dans un pool de threads.
+
+    Les demandes arrivées dans la même fenêtre (quelques millisecondes), tous
+    appels confondus, sont encodées en un seul batch: sur CPU, un batch de 16
+    coûte à peine plus qu'une requête seule, et la boucle d'événements reste
+    libre pour l'audio pendant l'inférence.
+    """
+
+    def __init__(
+            self,
+            registry: ModelRegistry = model_registry,
+            window_ms: float = 5.0,
+            max_batch_size: int = 32,
+            workers: int = 1,
+    ):
+        """
+        Initialiser le service.
+
+        Args:
+            registry: Registre des modèles
+            window_ms: Attente max pour regrouper des requêtes concurrentes
+            max_batch_size: Taille max d'un batch (déclenche l'encodage sans attendre)
+            workers: Threads d'inférence (torch parallélise déjà chaque batch)
+        """
+        self.registry = registry
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="embeddings"
+        )
+        self._pending: List[Tuple[str, asyncio.Future, float]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encodage bloquant (exécuté dans le pool)."""
+        return self.registry.get().encode(texts, batch_size=len(texts))
+
+    def submit(self, text: str) -> asyncio.Future:
+        """
+        Mettre une requête dans le prochain batch.
+
+        Args:
+            text: Texte à encoder
+
+        Returns:
+            Future résolue avec le vecteur (np.ndarray)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future, time.monotonic()))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+
+        return future
+
+    def _flush(self) -> None:
+        """Lancer l'encodage des requêtes en attente."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        # Requêtes abandonnées (appel raccroché) avant l'encodage
+        batch = [item for item in batch if not item[1].cancelled()]
+        if not batch:
+            return
+
+        now = time.monotonic()
+        for _, _, enqueued_at in batch:
+            embedding_queue_delay.observe(now - enqueued_at)
+        embedding_batch_size.observe(len(batch))
+
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._executor, self._encode, [text for text, _, _ in batch])
+        task.add_done_callback(lambda done: self._resolve(batch, done))
+
+    @staticmethod
+    def _resolve(batch: List[Tuple[str, asyncio.Future, float]], done: asyncio.Future) -> None:
+        """Distribuer les vecteurs (ou l'erreur) aux demandeurs."""
+        error = done.exception()
+        for index, (_, future, _) in enumerate(batch):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(done.result()[index])
+
+    async def encode(self, text: str) -> np.ndarray:
+        """
+        Encoder une requête.
+
+        Args:
+            text: Texte à encoder
+
+        Returns:
+            Vecteur d'embedding
+        """
+        return await self.submit(text)
+
+    async def encode_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Encoder plusieurs requêtes (regroupées avec celles des autres appels).
+
+        Args:
+            texts: Textes à encoder
+
+        Returns:
+            Vecteurs, dans l'ordre de texts
+        """
+        futures = [self.submit(text) for text in texts]
+        return list(await asyncio.gather(*futures))
+
+
+# Instance globale
+embedding_service = EmbeddingService(
+    window_ms=settings.embedding_batch_window_ms,
+    max_batch_size=settings.embedding_max_batch_size,
+    workers=settings.embedding_workers,
+)
@@ -4,24 +4,29 @@
 # src/services/vector_db/embeddings.py
 # ========================================
 """Génération d'embeddings pour les produits."""
-from typing import List
-from sentence_transformers import SentenceTransformer
+from typing import List, Optional
+
+from src.core.config import settings
+from src.services.vector_db.model_registry import model_registry
 
 
 class EmbeddingGenerator:
     """Générateur d'embeddings pour recherche sémantique."""
 
-    def __init__(
-            self, model_name: str = "paraphrase-multilingual-mpnet-base-v2"
-    ):
+    def __init__(self, model_name: Optional[str] = None):
         """
         Initialiser le générateur.
 
         Args:
-            model_name: Nom du modèle sentence-transformers
+            model_name: Nom du modèle sentence-transformers (par défaut celui de la recherche)
         """
-        self.model = SentenceTransformer(f"sentence-transformers/{model_name}")
-        self.vector_size = 768
+        self.model_name = model_name or settings.embedding_model_name
+        self.vector_size = settings.embedding_vector_size
+
+    @property
+    def model(self):
+        """Modèle partagé avec la recherche (chargé au premier usage)."""
+        return model_registry.get(self.model_name)
 
     def generate_embedding(self, text: str) -> List[float]:
         """
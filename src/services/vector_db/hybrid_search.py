@@ -0,0 +1,298 @@
+"""Recherche hybride: index lexical (BM25 sur n-grammes) + vecteurs, fusion par rangs."""
+import asyncio
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.core.config import settings
+
+# Dosage: nombre éventuellement suivi d'une unité ("1000", "1 g", "2,5mg", "5%")
+_DOSAGE = re.compile(r"(?<![\d.,])(\d+(?:[.,]\d+)?)(?!\d)\s*(mg|g|µg|ug|mcg|ml|ui|%)?(?![a-z])")
+
+# Conversion en mg des unités de masse
+_TO_MG = {"mg": 1.0, "g": 1000.0, "µg": 0.001, "ug": 0.001, "mcg": 0.001}
+
+
+def normalize_text(text: str) -> str:
+    """Minuscules, sans accents ni ponctuation (µ conservé pour les dosages)."""
+    text = unicodedata.normalize("NFKD", text.lower().replace("µ", "\x00"))
+    text = "".join(c for c in text if not unicodedata.combining(c)).replace("\x00", "µ")
+    return re.sub(r"[^a-z0-9µ%.,]+", " ", text).strip()
+
+
+def extract_dosages(text: str) -> Set[float]:
+    """
+    Dosages cités dans un texte.
+
+    Les masses sont aussi converties en mg ("1 g" et "1000 mg" se recoupent);
+    les nombres sans unité sont gardés tels quels ("doliprane 1000").
+
+    Args:
+        text: Nom de produit ou requête
+
+    Returns:
+        Valeurs numériques des dosages
+    """
+    dosages = set()
+    for value, unit in _DOSAGE.findall(normalize_text(text)):
+        # Codes CIP/EAN: pas des dosages
+        if len(value) >= 7:
+            continue
+        number = float(value.replace(",", "."))
+        dosages.add(number)
+        if unit in _TO_MG:
+            dosages.add(round(number * _TO_MG[unit], 3))
+    return dosages
+
+
+class LexicalIndex:
+    """
+    Index BM25 sur les mots, nombres et trigrammes de caractères des noms de produits.
+
+    Les trigrammes rattrapent les noms de marque mal transcrits ("doliprene"),
+    les mots et nombres départagent les dosages; les codes CIP13/EAN sont
+    résolus par correspondance exacte. Les poids BM25 sont calculés à la
+    construction: une requête ne fait que des additions sur des tableaux.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialiser l'index (vide).
+
+        Args:
+            k1: Saturation de la fréquence des termes
+            b: Normalisation par la longueur du document
+        """
+        self.k1 = k1
+        self.b = b
+        # (payloads, postings terme -> (documents, poids), codes -> document), remplacé d'un bloc
+        self._state: Tuple[List[Dict[str, Any]], Dict[str, Tuple[np.ndarray, np.ndarray]], Dict[str, int]] = (
+            [], {}, {}
+        )
+        self.source_version: Optional[int] = None
+        self._rebuild: Optional[asyncio.Task] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.source_version is not None
+
+    @staticmethod
+    def terms(text: str) -> List[str]:
+        """Termes d'un texte: mots, nombres et trigrammes (bornés par des espaces)."""
+        terms = []
+        for token in re.findall(r"\d+(?:\.\d+)?|[a-zµ]+", normalize_text(text).replace(",", ".")):
+            if token[0].isdigit():
+                terms.append(f"n:{token}")
+                continue
+            terms.append(f"w:{token}")
+            padded = f" {token} "
+            terms.extend(f"g:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return terms
+
+    @staticmethod
+    def _document_text(payload: Dict[str, Any]) -> str:
+        return f"{payload.get('name', '')} {payload.get('category') or ''}"
+
+    def build(self, payloads: Sequence[Dict[str, Any]], version: Optional[int] = None) -> None:
+        """
+        Construire l'index (bloquant).
+
+        Args:
+            payloads: Payloads des produits (voir QdrantClient.product_point)
+            version: Version de la source (voir LocalVectorIndex.version)
+        """
+        payloads = list(payloads)
+        documents = [Counter(self.terms(self._document_text(p))) for p in payloads]
+        lengths = np.array([sum(d.values()) for d in documents], dtype=np.float32)
+        average_length = float(lengths.mean()) if len(lengths) else 1.0
+
+        raw: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for index, document in enumerate(documents):
+            for term, frequency in document.items():
+                raw[term].append((index, frequency))
+
+        postings = {}
+        for term, entries in raw.items():
+            indices = np.array([index for index, _ in entries], dtype=np.int32)
+            frequencies = np.array([frequency for _, frequency in entries], dtype=np.float32)
+            idf = math.log(1 + (len(payloads) - len(entries) + 0.5) / (len(entries) + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * lengths[indices] / average_length)
+            postings[term] = (indices, idf * frequencies * (self.k1 + 1) / (frequencies + norm))
+
+        codes = {}
+        for index, payload in enumerate(payloads):
+            for field in ("cip13", "ean"):
+                if payload.get(field):
+                    codes[str(payload[field])] = index
+
+        self._state = (payloads, postings, codes)
+        self.source_version = version
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Meilleurs documents pour une requête.
+
+        Args:
+            query: Texte de recherche (nom, dosage ou code CIP)
+            limit: Nombre max de résultats
+
+        Returns:
+            Couples (payload, score BM25) par score décroissant; un code CIP
+            exact est seul en tête avec un score infini
+        """
+        payloads, postings, codes = self._state
+        if not payloads:
+            return []
+
+        digits = re.sub(r"\D", "", query)
+        if len(digits) >= 13 and digits[:13] in codes:
+            return [(payloads[codes[digits[:13]]], math.inf)]
+
+        scores = np.zeros(len(payloads), dtype=np.float32)
+        for term in set(self.terms(query)):
+            entry = postings.get(term)
+            if entry is not None:
+                np.add.at(scores, entry[0], entry[1])
+
+        k = min(limit, len(payloads))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(payloads[index], float(scores[index])) for index in top if scores[index] > 0]
+
+    def refresh(self, payloads_source, version: int) -> None:
+        """
+        Reconstruire en tâche de fond si la source a changé (l'ancien index sert entre-temps).
+
+        Args:
+            payloads_source: Fonction sans argument renvoyant les payloads
+            version: Version courante de la source
+        """
+        if version == self.source_version or (self._rebuild and not self._rebuild.done()):
+            return
+        self._rebuild = asyncio.create_task(
+            asyncio.to_thread(lambda: self.build(payloads_source(), version))
+        )
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Coefficient de Dice sur les trigrammes (0 à 1)."""
+    grams_a = {t for t in LexicalIndex.terms(a) if t.startswith("g:")}
+    grams_b = {t for t in LexicalIndex.terms(b) if t.startswith("g:")}
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+class HybridSearcher:
+    """
+    Fusion des résultats sémantiques et lexicaux.
+
+    Le classement suit la fusion par rangs réciproques (RRF), corrigée par le
+    dosage: "Doliprane 1000" écarte "Doliprane 500 mg" même si les deux noms
+    sont presque identiques. Le score renvoyé reste comparable aux scores
+    cosinus (seuils de confiance existants): c'est le meilleur des signaux
+    (cosinus, trigrammes, phonétique), pénalisé en cas de dosage contradictoire.
+    """
+
+    def __init__(
+            self,
+            index: LexicalIndex,
+            rrf_k: int = 60,
+            dosage_boost: float = 1.5,
+            dosage_penalty: float = 0.5,
+            dosage_mismatch_score: float = 0.75,
+    ):
+        """
+        Initialiser la fusion.
+
+        Args:
+            index: Index lexical
+            rrf_k: Constante de lissage RRF
+            dosage_boost: Facteur de rang si le dosage correspond
+            dosage_penalty: Facteur de rang si le dosage contredit la requête
+            dosage_mismatch_score: Facteur du score renvoyé si le dosage contredit
+        """
+        self.index = index
+        self.rrf_k = rrf_k
+        self.dosage_boost = dosage_boost
+        self.dosage_penalty = dosage_penalty
+        self.dosage_mismatch_score = dosage_mismatch_score
+
+    @staticmethod
+    def _key(payload: Dict[str, Any]) -> str:
+        return str(payload.get("cip13") or payload.get("name"))
+
+    def fuse(
+            self,
+            query: str,
+            semantic: List[Dict[str, Any]],
+            lexical: List[Tuple[Dict[str, Any], float]],
+            limit: int = 5,
+            score_threshold: float = 0.5,
+            phonetic: Optional[List[Tuple[Dict[str, Any], float]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fusionner les deux listes de candidats.
+
+        Args:
+            query: Texte de recherche
+            semantic: Résultats sémantiques (format search_product)
+            lexical: Résultats de LexicalIndex.search
+            limit: Nombre max de résultats
+            score_threshold: Score minimal (même échelle que le cosinus)
+            phonetic: Résultats de PhoneticIndex.search (noms mal transcrits)
+
+        Returns:
+            Résultats au format search_product, match_type "hybrid" (ou "cip")
+        """
+        if lexical and math.isinf(lexical[0][1]):
+            return [{"product": lexical[0][0], "score": 1.0, "match_type": "cip"}]
+
+        candidates: Dict[str, Dict[str, Any]] = {}
+
+        def add(rank: int, payload: Dict[str, Any], similarity: float = 0.0) -> None:
+            entry = candidates.setdefault(
+                self._key(payload), {"product": payload, "rrf": 0.0, "similarity": 0.0}
+            )
+            entry["rrf"] += 1 / (self.rrf_k + rank + 1)
+            entry["similarity"] = max(entry["similarity"], similarity)
+
+        for rank, result in enumerate(semantic):
+            add(rank, result["product"], result["score"])
+        for rank, (payload, _) in enumerate(lexical):
+            add(rank, payload)
+        for rank, (payload, similarity) in enumerate(phonetic or []):
+            add(rank, payload, similarity)
+
+        query_dosages = extract_dosages(query)
+        results = []
+        for entry in candidates.values():
+            name = entry["product"].get("name", "")
+            score = max(entry["similarity"], trigram_similarity(query, name))
+            rank_score = entry["rrf"]
+
+            product_dosages = extract_dosages(name)
+            if query_dosages and product_dosages:
+                if query_dosages & product_dosages:
+                    rank_score *= self.dosage_boost
+                else:
+                    rank_score *= self.dosage_penalty
+                    score *= self.dosage_mismatch_score
+
+            results.append((rank_score, score, entry["product"]))
+
+        results.sort(key=lambda r: r[0], reverse=True)
+        return [
+            {"product": product, "score": round(score, 4), "match_type": "hybrid"}
+            for _, score, product in results
+            if score >= score_threshold
+        ][:limit]
+
+
+# Instances globales
+lexical_index = LexicalIndex()
+hybrid_searcher = HybridSearcher(lexical_index, rrf_k=settings.hybrid_rrf_k)
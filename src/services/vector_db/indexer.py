@@ -4,60 +4,319 @@
 # ========================================
 """Indexeur de produits pour Qdrant."""
 import asyncio
-from typing import List, Dict, Any
+import json
+import random
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 
-from src.services.vector_db.embeddings import embedding_generator
+import numpy as np
+
+from src.core.config import settings
+from src.services.vector_db.embedding_service import embedding_service
 from src.services.vector_db.qcadrant_client import qdrant_client
 
 
 class ProductIndexer:
-    """Indexeur de produits dans Qdrant."""
+    """
+    Indexeur de produits dans Qdrant.
+
+    L'encodage d'un batch (thread d'inférence) se fait pendant l'envoi des
+    batchs précédents, plusieurs envois étant en vol à la fois sans attendre
+    leur application. Un point de reprise enregistre le dernier produit dont
+    tous les batchs précédents sont envoyés: une réindexation interrompue
+    reprend là où elle s'est arrêtée.
 
-    def __init__(self):
-        """Initialiser l'indexeur."""
-        self.batch_size = 50
+    Une réindexation complète construit une nouvelle collection versionnée,
+    la valide (nombre de points, test de rappel) puis bascule l'alias lu
+    par QdrantClient: les recherches ne voient jamais un catalogue partiel.
+    """
 
-    async def index_products(self, products: List[Dict[str, Any]]) -> int:
+    def __init__(
+            self,
+            batch_size: int = 256,
+            encode_batch_size: int = 64,
+            max_inflight_upserts: int = 4,
+            checkpoint_path: Optional[str] = None,
+            min_recall: float = 0.9,
+            smoke_sample: int = 50,
+            validation_timeout: float = 60.0,
+            keep_previous: bool = True,
+    ):
+        """
+        Initialiser l'indexeur.
+
+        Args:
+            batch_size: Produits par envoi à Qdrant
+            encode_batch_size: Taille des batchs d'inférence du modèle
+            max_inflight_upserts: Envois simultanés vers Qdrant
+            checkpoint_path: Fichier du point de reprise (None: pas de reprise)
+            min_recall: Rappel top-5 minimal de la nouvelle collection
+            smoke_sample: Produits interrogés par le test de rappel
+            validation_timeout: Attente max de l'application des envois (secondes)
+            keep_previous: Garder la collection remplacée (retour arrière)
+        """
+        self.batch_size = batch_size
+        self.encode_batch_size = encode_batch_size
+        self.max_inflight_upserts = max_inflight_upserts
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.min_recall = min_recall
+        self.smoke_sample = smoke_sample
+        self.validation_timeout = validation_timeout
+        self.keep_previous = keep_previous
+
+    # ---------- Point de reprise ----------
+
+    def _read_checkpoint(self) -> Dict[str, Any]:
+        """Contenu du point de reprise (vide s'il n'existe pas)."""
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return {}
+
+        try:
+            return json.loads(self.checkpoint_path.read_text())
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Point de reprise illisible, indexation complète: {e}")
+            return {}
+
+    def _load_checkpoint(self, collection_name: str) -> Optional[int]:
+        """Dernier ID indexé dans la collection, ou None."""
+        checkpoint = self._read_checkpoint()
+        if checkpoint.get("collection") != collection_name:
+            return None
+        return checkpoint.get("last_id")
+
+    def _save_checkpoint(self, collection_name: str, last_id: int, indexed: int) -> None:
+        if self.checkpoint_path is None:
+            return
+
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({
+            "collection": collection_name,
+            "last_id": last_id,
+            "indexed": indexed,
+        }))
+        tmp_path.replace(self.checkpoint_path)
+
+    def clear_checkpoint(self) -> None:
+        """Oublier le point de reprise."""
+        if self.checkpoint_path is not None:
+            self.checkpoint_path.unlink(missing_ok=True)
+
+    # ---------- Indexation ----------
+
+    async def index_products(
+            self,
+            products: List[Dict[str, Any]],
+            resume: bool = False,
+            collection_name: Optional[str] = None,
+    ) -> int:
         """
         Indexer une liste de produits.
 
         Args:
             products: Liste de produits
+            resume: Reprendre après le dernier point de reprise
+            collection_name: Collection cible (défaut: alias en service)
 
         Returns:
             Nombre de produits indexés
         """
-        total_indexed = 0
+        collection_name = collection_name or qdrant_client.collection_name
+
+        # Ordre stable: le point de reprise est un ID
+        products = sorted(products, key=lambda p: p["id"])
+
+        last_id = self._load_checkpoint(collection_name) if resume else None
+        if last_id is not None:
+            products = [p for p in products if p["id"] > last_id]
+            print(f"⏩ Reprise après le produit {last_id}: {len(products)} restants")
+        else:
+            self.clear_checkpoint()
+
+        batches = [
+            products[i: i + self.batch_size]
+            for i in range(0, len(products), self.batch_size)
+        ]
+
+        started_at = time.monotonic()
+        slots = asyncio.Semaphore(self.max_inflight_upserts)
+        sent: Dict[int, int] = {}
+        progress = {"next_batch": 0, "indexed": 0}
+        failed = False
+
+        def advance_checkpoint() -> None:
+            # Seul le préfixe contigu des batchs envoyés est acquis
+            while progress["next_batch"] in sent:
+                index = progress["next_batch"]
+                progress["indexed"] += sent[index]
+                progress["next_batch"] += 1
+                self._save_checkpoint(collection_name, batches[index][-1]["id"], progress["indexed"])
+
+        async def upsert(index: int, batch: List[Dict[str, Any]], vectors: np.ndarray) -> int:
+            nonlocal failed
+            try:
+                count = await qdrant_client.upsert_vectors(
+                    batch, vectors, wait=False, collection_name=collection_name
+                )
+            except Exception as e:
+                print(f"❌ Erreur envoi batch {index + 1}: {e}")
+                failed = True
+                return 0
+            finally:
+                slots.release()
+
+            sent[index] = count
+            advance_checkpoint()
+            return count
+
+        tasks = []
+        for index, batch in enumerate(batches):
+            try:
+                vectors = await asyncio.to_thread(
+                    qdrant_client.encode_products, batch, self.encode_batch_size
+                )
+            except Exception as e:
+                print(f"❌ Erreur encodage batch {index + 1}: {e}")
+                failed = True
+                break
+
+            # Au plus max_inflight_upserts envois en vol; l'encodage suivant démarre aussitôt
+            await slots.acquire()
+            tasks.append(asyncio.create_task(upsert(index, batch, vectors)))
+
+            done = (index + 1) * self.batch_size
+            rate = min(done, len(products)) / max(time.monotonic() - started_at, 1e-6)
+            print(f"📦 Batch {index + 1}/{len(batches)} encodé ({rate:.0f} produits/s)")
 
-        # Indexer par batch
-        for i in range(0, len(products), self.batch_size):
-            batch = products[i: i + self.batch_size]
+        total_indexed = sum(await asyncio.gather(*tasks))
 
-            count = await qdrant_client.index_products_batch(batch)
-            total_indexed += count
+        elapsed = time.monotonic() - started_at
+        print(
+            f"✅ {total_indexed} produits indexés en {elapsed:.1f}s "
+            f"({total_indexed / max(elapsed, 1e-6):.0f} produits/s)"
+        )
 
-            print(f"📦 Batch {i // self.batch_size + 1}: {count} produits indexés")
+        if not failed:
+            self.clear_checkpoint()
 
         return total_indexed
 
-    async def reindex_all(self, products: List[Dict[str, Any]]) -> int:
+    async def reindex_all(
+            self, products: List[Dict[str, Any]], resume: bool = False
+    ) -> int:
         """
-        Réindexer tous les produits (efface et recréé).
+        Réindexer tous les produits dans une nouvelle collection, puis basculer l'alias.
+
+        La collection en service répond pendant toute la construction; en cas
+        d'échec de la validation, l'alias n'est pas modifié.
 
         Args:
-            products: Liste de produits
+            products: Liste de produits (catalogue complet)
+            resume: Reprendre une réindexation interrompue
+
+        Returns:
+            Nombre indexé (0 si la nouvelle collection n'a pas été mise en service)
+        """
+        if not products:
+            print("⚠️  Catalogue vide, réindexation annulée")
+            return 0
+
+        live = await qdrant_client.resolve_collection()
+
+        # Reprise: collection en construction du point de reprise, si elle existe encore
+        target = self._read_checkpoint().get("collection") if resume else None
+        if not (
+                target
+                and qdrant_client.is_version(target)
+                and target != live
+                and target in await qdrant_client.list_collections()
+        ):
+            resume = False
+            target = qdrant_client.new_collection_name()
+            await qdrant_client.create_collection(target)
+
+        print(f"🔄 Réindexation complète dans {target} (en service: {live or qdrant_client.collection_name})")
+        indexed = await self.index_products(products, resume=resume, collection_name=target)
+
+        if not await self.validate_collection(target, products):
+            print(f"❌ Collection {target} non mise en service (alias inchangé)")
+            return 0
+
+        previous = await qdrant_client.switch_alias(target)
+        await self.collect_garbage(keep=[target, previous] if self.keep_previous else [target])
+        return indexed
+
+    async def validate_collection(self, collection_name: str, products: List[Dict[str, Any]]) -> bool:
+        """
+        Vérifier une collection avant sa mise en service.
+
+        Args:
+            collection_name: Collection construite
+            products: Produits qu'elle doit contenir
 
         Returns:
-            Nombre indexé
+            True si le nombre de points et le rappel sont conformes
+        """
+        # Envois sans attente: le compte rattrape l'application des derniers batchs
+        deadline = time.monotonic() + self.validation_timeout
+        count = await qdrant_client.count_points(collection_name)
+        while count < len(products) and time.monotonic() < deadline:
+            await asyncio.sleep(1)
+            count = await qdrant_client.count_points(collection_name)
+
+        if count != len(products):
+            print(f"❌ Validation {collection_name}: {count} points pour {len(products)} produits")
+            return False
+
+        recall = await self._smoke_test(collection_name, products)
+        if recall < self.min_recall:
+            print(f"❌ Validation {collection_name}: rappel {recall:.1%} < {self.min_recall:.0%}")
+            return False
+
+        print(f"✅ Validation {collection_name}: {count} points, rappel {recall:.1%}")
+        return True
+
+    async def _smoke_test(self, collection_name: str, products: List[Dict[str, Any]]) -> float:
+        """Rappel top-5: chaque nom de produit échantillonné retrouve son produit."""
+        sample = random.Random(42).sample(products, min(self.smoke_sample, len(products)))
+        vectors = await embedding_service.encode_batch([p["name"] for p in sample])
+        results = await qdrant_client.search_vectors(
+            vectors, limit=5, score_threshold=0.0, collection_name=collection_name
+        )
+
+        found = sum(
+            any(hit["product"].get("cip13") == product["cip13"] for hit in hits)
+            for product, hits in zip(sample, results)
+        )
+        return found / len(sample)
+
+    async def collect_garbage(self, keep: List[Optional[str]]) -> int:
         """
-        print("🔄 Réindexation complète...")
+        Supprimer les versions de la collection hors service.
 
-        # Réinitialiser la collection
-        await qdrant_client.initialize_collection()
+        Args:
+            keep: Collections à conserver (en service, précédente)
 
-        # Indexer
-        return await self.index_products(products)
+        Returns:
+            Nombre de collections supprimées
+        """
+        removed = 0
+        for collection_name in await qdrant_client.list_collections():
+            if qdrant_client.is_version(collection_name) and collection_name not in keep:
+                await qdrant_client.delete_collection(collection_name)
+                removed += 1
+        return removed
 
 
 # Instance globale
-product_indexer = ProductIndexer()
\ No newline at end of file
+product_indexer = ProductIndexer(
+    batch_size=settings.indexer_batch_size,
+    encode_batch_size=settings.indexer_encode_batch_size,
+    max_inflight_upserts=settings.indexer_max_inflight_upserts,
+    checkpoint_path=settings.indexer_checkpoint_path,
+    min_recall=settings.reindex_min_recall,
+    smoke_sample=settings.reindex_smoke_sample,
+    validation_timeout=settings.reindex_validation_timeout,
+    keep_previous=settings.reindex_keep_previous,
+)
@@ -0,0 +1,287 @@
+"""Index vectoriel en mémoire du catalogue (Qdrant reste la source de vérité)."""
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.config import settings
+
+
+class LocalVectorIndex:
+    """
+    Matrice float32 normalisée des produits, recherche exacte par produit matriciel.
+
+    Quelques dizaines de milliers de produits tiennent en une centaine de Mo:
+    le top-k exact coûte alors moins qu'un aller-retour réseau vers Qdrant.
+    Les mises à jour reconstruisent les tableaux (dans un thread, hors de la
+    boucle d'événements) puis les remplacent d'un bloc: une recherche en cours
+    voit l'ancien ou le nouvel état, jamais un mélange.
+    """
+
+    def __init__(self, vector_size: int = 768):
+        """
+        Initialiser l'index (vide).
+
+        Args:
+            vector_size: Dimension des vecteurs
+        """
+        self.vector_size = vector_size
+        self.loaded_at: Optional[float] = None
+        # Incrémentée à chaque changement (index dérivés à reconstruire)
+        self.version = 0
+
+        # (matrice, ids, payloads, position par id), remplacé d'un seul bloc
+        self._state: Tuple[np.ndarray, List[Any], List[Dict[str, Any]], Dict[Any, int]] = (
+            np.zeros((0, vector_size), dtype=np.float32), [], [], {}
+        )
+        self._write_lock = threading.Lock()
+        # Mises à jour reçues pendant un chargement, rejouées sur le nouvel état
+        self._journal: Optional[List[Tuple[str, tuple]]] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._state[1])
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """Normaliser les lignes (score cosinus = produit scalaire)."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    # ---------- Chargement ----------
+
+    async def load(self, pages: AsyncIterator[List[Any]]) -> int:
+        """
+        Charger toute la collection.
+
+        Args:
+            pages: Pages de points avec vecteurs (voir QdrantClient.iter_points)
+
+        Returns:
+            Nombre de produits chargés
+        """
+        started_at = time.perf_counter()
+        ids, vectors, payloads = [], [], []
+
+        with self._write_lock:
+            self._journal = []
+
+        try:
+            async for points in pages:
+                for point in points:
+                    ids.append(point.id)
+                    vectors.append(point.vector)
+                    payloads.append(point.payload)
+        except BaseException:
+            with self._write_lock:
+                self._journal = None
+            raise
+
+        # Normalisation et publication hors boucle
+        matrix = await asyncio.to_thread(self._publish, ids, vectors, payloads)
+
+        print(
+            f"✅ Index local: {len(ids)} produits chargés en "
+            f"{time.perf_counter() - started_at:.1f}s ({matrix.nbytes / 1024 / 1024:.0f} Mo)"
+        )
+        return len(ids)
+
+    def _publish(self, ids: List[Any], vectors: List[Any], payloads: List[Dict[str, Any]]) -> np.ndarray:
+        """Publier un chargement complet puis rejouer le journal (bloquant)."""
+        matrix = (
+            self._normalize(np.array(vectors))
+            if vectors
+            else np.zeros((0, self.vector_size), dtype=np.float32)
+        )
+
+        with self._write_lock:
+            journal, self._journal = self._journal, None
+            self._replace(matrix, ids, payloads)
+            for operation, args in journal:
+                getattr(self, operation)(*args)
+            self.loaded_at = time.time()
+        return matrix
+
+    def _replace(self, matrix: np.ndarray, ids: List[Any], payloads: List[Dict[str, Any]]) -> None:
+        """Publier un nouvel état (sous le verrou d'écriture)."""
+        positions = {point_id: index for index, point_id in enumerate(ids)}
+        self._state = (matrix, ids, payloads, positions)
+        self.version += 1
+
+    def payloads(self) -> List[Dict[str, Any]]:
+        """Payloads de tous les produits de l'index."""
+        return self._state[2]
+
+    def ids(self) -> List[Any]:
+        """IDs de tous les produits de l'index."""
+        return self._state[1]
+
+    def get(self, ids: Sequence[Any]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Payloads de quelques produits.
+
+        Args:
+            ids: IDs des points
+
+        Returns:
+            Payloads des produits présents, par ID
+        """
+        _, _, payloads, positions = self._state
+        return {i: payloads[positions[i]] for i in ids if i in positions}
+
+    # ---------- Mises à jour incrémentales ----------
+
+    def _write(self, operation: str, args: tuple) -> None:
+        """Appliquer une écriture, journalisée pendant un chargement (bloquant)."""
+        with self._write_lock:
+            if self._journal is not None:
+                self._journal.append((operation, args))
+            getattr(self, operation)(*args)
+
+    async def upsert(
+            self,
+            ids: Sequence[Any],
+            vectors: Optional[np.ndarray],
+            payloads: Sequence[Dict[str, Any]],
+    ) -> None:
+        """
+        Ajouter ou remplacer des produits.
+
+        Args:
+            ids: IDs des points
+            vectors: Vecteurs (None: mise à jour du payload seul)
+            payloads: Payloads (même ordre que ids)
+        """
+        if not ids:
+            return
+
+        normalized = self._normalize(vectors) if vectors is not None else None
+        await asyncio.to_thread(self._write, "_upsert", (ids, normalized, payloads))
+
+    def _upsert(
+            self,
+            ids: Sequence[Any],
+            normalized: Optional[np.ndarray],
+            payloads: Sequence[Dict[str, Any]],
+    ) -> None:
+        """Ajout ou remplacement (sous le verrou d'écriture)."""
+        matrix, current_ids, current_payloads, positions = self._state
+        current_ids = list(current_ids)
+        current_payloads = list(current_payloads)
+
+        # Matrice copiée seulement si une ligne existante change de vecteur:
+        # une mise à jour de payload la partage avec l'état précédent
+        copied = False
+        new_rows = []
+        for index, point_id in enumerate(ids):
+            position = positions.get(point_id)
+            if position is not None:
+                current_payloads[position] = payloads[index]
+                if normalized is not None:
+                    if not copied:
+                        matrix, copied = matrix.copy(), True
+                    matrix[position] = normalized[index]
+            elif normalized is not None:
+                current_ids.append(point_id)
+                current_payloads.append(payloads[index])
+                new_rows.append(normalized[index])
+
+        if new_rows:
+            matrix = np.vstack([matrix, np.array(new_rows, dtype=np.float32)])
+
+        self._replace(matrix, current_ids, current_payloads)
+
+    async def delete(self, ids: Sequence[Any]) -> None:
+        """
+        Retirer des produits.
+
+        Args:
+            ids: IDs des points
+        """
+        await asyncio.to_thread(self._write, "_delete", (ids,))
+
+    def _delete(self, ids: Sequence[Any]) -> None:
+        """Suppression (sous le verrou d'écriture)."""
+        matrix, current_ids, current_payloads, positions = self._state
+        removed = {positions[i] for i in ids if i in positions}
+        if not removed:
+            return
+
+        keep = [index for index in range(len(current_ids)) if index not in removed]
+        self._replace(
+            matrix[keep],
+            [current_ids[index] for index in keep],
+            [current_payloads[index] for index in keep],
+        )
+
+    # ---------- Recherche ----------
+
+    def search_batch(
+            self, query_vectors: np.ndarray, limit: int = 5, score_threshold: float = 0.5
+    ) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Top-k exact pour plusieurs requêtes.
+
+        Args:
+            query_vectors: Vecteurs de requête (une ligne par requête)
+            limit: Nombre max de résultats par requête
+            score_threshold: Score cosinus minimal
+
+        Returns:
+            Par requête, couples (payload, score) par score décroissant
+        """
+        matrix, _, payloads, _ = self._state
+        queries = self._normalize(np.atleast_2d(query_vectors))
+        if not len(payloads):
+            return [[] for _ in queries]
+
+        scores = queries @ matrix.T
+        k = min(limit, len(payloads))
+
+        results = []
+        for row in scores:
+            # Sélection partielle puis tri des seuls k meilleurs
+            top = np.argpartition(-row, k - 1)[:k]
+            top = top[np.argsort(-row[top])]
+            results.append([
+                (payloads[index], float(row[index]))
+                for index in top
+                if row[index] >= score_threshold
+            ])
+
+        return results
+
+    def search(
+            self, query_vector: np.ndarray, limit: int = 5, score_threshold: float = 0.5
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Top-k exact pour une requête.
+
+        Args:
+            query_vector: Vecteur de requête
+            limit: Nombre max de résultats
+            score_threshold: Score cosinus minimal
+
+        Returns:
+            Couples (payload, score) par score décroissant
+        """
+        return self.search_batch(query_vector, limit, score_threshold)[0]
+
+    def get_stats(self) -> dict:
+        """Taille et fraîcheur de l'index."""
+        matrix, ids, _, _ = self._state
+        return {
+            "products": len(ids),
+            "memory_bytes": matrix.nbytes,
+            "loaded_at": self.loaded_at,
+        }
+
+
+# Instance globale
+local_vector_index = LocalVectorIndex(vector_size=settings.embedding_vector_size)
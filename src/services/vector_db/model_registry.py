@@ -0,0 +1,105 @@
+"""Registre des modèles d'embeddings: un chargement par process, à la demande."""
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from src.core.config import settings
+from src.utils.metrics import embedding_model_load_seconds, embedding_model_memory_bytes
+
+
+class ModelRegistry:
+    """
+    Modèles SentenceTransformer partagés par la recherche et l'indexation.
+
+    Le modèle n'est chargé qu'au premier usage (ou au préchauffage explicite):
+    un process qui ne fait jamais de recherche ne paie ni la mémoire ni le
+    temps de démarrage.
+    """
+
+    def __init__(self, default_model: str):
+        """
+        Initialiser le registre.
+
+        Args:
+            default_model: Modèle utilisé quand aucun nom n'est précisé
+        """
+        self.default_model = default_model
+        self._models: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _model_bytes(model: Any) -> int:
+        """Mémoire occupée par les poids du modèle."""
+        return sum(p.numel() * p.element_size() for p in model.parameters())
+
+    def get(self, name: Optional[str] = None):
+        """
+        Récupérer un modèle, en le chargeant si besoin.
+
+        Args:
+            name: Nom du modèle (par défaut embedding_model_name)
+
+        Returns:
+            Instance SentenceTransformer partagée
+        """
+        name = name or self.default_model
+
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        # Un seul chargement même si plusieurs threads le demandent en même temps
+        with self._lock:
+            model = self._models.get(name)
+            if model is None:
+                model = self._load(name)
+                self._models[name] = model
+
+        return model
+
+    def _load(self, name: str):
+        """Charger un modèle et mesurer son coût."""
+        # Import différé: torch n'est chargé que par les process qui en ont besoin
+        from sentence_transformers import SentenceTransformer
+
+        print(f"🧠 Chargement du modèle d'embeddings: {name}")
+        started_at = time.perf_counter()
+        model = SentenceTransformer(name)
+        load_seconds = time.perf_counter() - started_at
+
+        memory_bytes = self._model_bytes(model)
+        embedding_model_load_seconds.labels(model=name).set(load_seconds)
+        embedding_model_memory_bytes.labels(model=name).set(memory_bytes)
+        self._stats[name] = {
+            "load_seconds": round(load_seconds, 3),
+            "memory_bytes": memory_bytes,
+        }
+
+        print(f"✅ Modèle chargé en {load_seconds:.1f}s ({memory_bytes / 1024 / 1024:.0f} Mo)")
+        return model
+
+    def is_loaded(self, name: Optional[str] = None) -> bool:
+        """Le modèle est-il déjà en mémoire ?"""
+        return (name or self.default_model) in self._models
+
+    async def warmup(self, name: Optional[str] = None) -> None:
+        """
+        Charger un modèle hors de la boucle d'événements.
+
+        Args:
+            name: Nom du modèle (par défaut embedding_model_name)
+        """
+        try:
+            await asyncio.to_thread(self.get, name)
+        except Exception as e:
+            print(f"❌ Erreur chargement modèle d'embeddings: {e}")
+
+    def get_stats(self) -> dict:
+        """Temps de chargement et mémoire par modèle chargé."""
+        return dict(self._stats)
+
+
+# Instance globale
+model_registry = ModelRegistry(settings.embedding_model_name)
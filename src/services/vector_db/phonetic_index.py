@@ -0,0 +1,255 @@
+"""Index phonétique français des noms de produits (erreurs de transcription STT)."""
+import asyncio
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+# Règles appliquées dans l'ordre, sur un texte en minuscules sans accents.
+# Majuscules = sons notés d'un seul symbole: A (an/en), O (on), I (in/un),
+# U (ou), C (ch), E (è/é/ai/ei).
+_RULES = [
+    (r"(.)\1+", r"\1"),
+    (r"ph", "f"),
+    (r"sch|sh|ch", "C"),
+    (r"qu|q|ck", "k"),
+    (r"gu(?=[eiy])", "g"),
+    (r"g(?=[eiy])", "j"),
+    (r"sc(?=[eiy])", "s"),
+    (r"c(?=[eiy])", "s"),
+    (r"c", "k"),
+    (r"x", "ks"),
+    (r"z", "s"),
+    (r"w", "v"),
+    (r"h", ""),
+    (r"eau|au", "o"),
+    (r"ou", "U"),
+    (r"oi", "va"),
+    (r"(?:ai|ei)(?![mn])", "E"),
+    (r"y", "i"),
+    (r"(?:ain|ein|in|im|un|um)(?![aeiouyAEIOU])", "I"),
+    (r"(?:an|am|en|em)(?![aeiouAEIOU])", "A"),
+    (r"(?:on|om)(?![aeiouAEIOU])", "O"),
+    (r"e[rtz]$", "E"),
+    (r"(.)\1+", r"\1"),
+    # Consonnes finales muettes, puis e muet
+    (r"(?<=.)[dpstx]$", ""),
+    (r"(?<=..)e$", ""),
+]
+_COMPILED_RULES = [(re.compile(pattern), replacement) for pattern, replacement in _RULES]
+
+_VOWELS = re.compile(r"[aeiouUE]")
+_NASALS = re.compile(r"[AOIn]")
+
+
+def _strip_accents(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def french_phonetic(word: str) -> str:
+    """
+    Forme phonétique d'un mot français (variante simplifiée de Phonex).
+
+    "spass fond" et "spasfon", "efféralgan" et "efferalgan" ont la même forme.
+
+    Args:
+        word: Mot (ou mots, les espaces sont ignorés)
+
+    Returns:
+        Forme phonétique, vide si le mot n'a pas de lettres
+    """
+    text = re.sub(r"[^a-z]", "", _strip_accents(word))
+    for pattern, replacement in _COMPILED_RULES:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Distance d'édition entre deux chaînes courtes."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def _words(text: str) -> List[str]:
+    """Mots alphabétiques (les dosages et codes n'ont pas de forme phonétique)."""
+    return re.findall(r"[a-z]+", _strip_accents(text))
+
+
+class PhoneticIndex:
+    """
+    Clés phonétiques de chaque nom de produit, de ses mots et de ses paires de mots.
+
+    Une requête est découpée de la même façon, plus les triplets de mots
+    ("doli prane" retrouve "doliprane"): chaque clé est cherchée en O(1),
+    ainsi que son squelette consonantique pour tolérer une voyelle mal
+    entendue; les candidats sont classés par distance d'édition sur la forme
+    phonétique. L'index suit le catalogue par différence (seuls les produits
+    ajoutés, renommés ou retirés sont recalculés).
+    """
+
+    def __init__(self, min_word_length: int = 3):
+        """
+        Initialiser l'index (vide).
+
+        Args:
+            min_word_length: Mots plus courts ignorés ("de", "le", "b")
+        """
+        self.min_word_length = min_word_length
+        self.source_version: Optional[int] = None
+
+        self._keys: Dict[str, Set[str]] = defaultdict(set)  # clé -> CIP
+        self._documents: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}  # CIP -> (payload, formes)
+        self._lock = threading.Lock()
+        self._refresh: Optional[asyncio.Task] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.source_version is not None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    @staticmethod
+    def _skeleton(form: str) -> str:
+        """Squelette consonantique (voyelles retirées, nasales confondues avec n)."""
+        return _NASALS.sub("n", _VOWELS.sub("", form))
+
+    def _similarity(self, query_form: str, form: str) -> float:
+        """Similarité phonétique: distance d'édition, plancher si même squelette long."""
+        similarity = 1 - levenshtein(query_form, form) / max(len(query_form), len(form))
+        skeleton = self._skeleton(form)
+        if len(skeleton) >= 4 and skeleton == self._skeleton(query_form):
+            similarity = max(similarity, 0.8)
+        return similarity
+
+    def _forms(self, text: str, max_span: int) -> List[str]:
+        """Formes phonétiques des mots et groupes de mots consécutifs d'un texte."""
+        words = [w for w in _words(text) if len(w) >= self.min_word_length or max_span > 2]
+        forms = []
+        for span in range(1, max_span + 1):
+            for start in range(len(words) - span + 1):
+                form = french_phonetic("".join(words[start:start + span]))
+                if len(form) >= self.min_word_length:
+                    forms.append(form)
+        return list(dict.fromkeys(forms))
+
+    # ---------- Mises à jour ----------
+
+    def _add(self, cip13: str, payload: Dict[str, Any]) -> None:
+        forms = self._forms(payload.get("name", ""), max_span=2)
+        self._documents[cip13] = (payload, forms)
+        for form in forms:
+            self._keys[form].add(cip13)
+            self._keys[self._skeleton(form)].add(cip13)
+
+    def _remove(self, cip13: str) -> None:
+        document = self._documents.pop(cip13, None)
+        if document is None:
+            return
+        for form in document[1]:
+            for key in (form, self._skeleton(form)):
+                self._keys[key].discard(cip13)
+                if not self._keys[key]:
+                    del self._keys[key]
+
+    def sync(self, payloads: Sequence[Dict[str, Any]], version: Optional[int] = None) -> int:
+        """
+        Mettre l'index en phase avec le catalogue.
+
+        Args:
+            payloads: Payloads de tous les produits
+            version: Version de la source (voir LocalVectorIndex.version)
+
+        Returns:
+            Nombre de produits recalculés (ajoutés, renommés ou retirés)
+        """
+        with self._lock:
+            if version is not None and version == self.source_version:
+                return 0
+
+            current = {str(p["cip13"]): p for p in payloads if p.get("cip13")}
+            changed = 0
+
+            for cip13 in self._documents.keys() - current.keys():
+                self._remove(cip13)
+                changed += 1
+
+            for cip13, payload in current.items():
+                document = self._documents.get(cip13)
+                if document is not None and document[0].get("name") == payload.get("name"):
+                    # Nom inchangé: seul le payload (prix, catégorie...) est remplacé
+                    self._documents[cip13] = (payload, document[1])
+                    continue
+                self._remove(cip13)
+                self._add(cip13, payload)
+                changed += 1
+
+            self.source_version = version
+            return changed
+
+    def refresh(self, payloads_source, version: int) -> None:
+        """
+        Resynchroniser en tâche de fond si la source a changé.
+
+        Args:
+            payloads_source: Fonction sans argument renvoyant les payloads
+            version: Version courante de la source
+        """
+        if version == self.source_version or (self._refresh and not self._refresh.done()):
+            return
+        self._refresh = asyncio.create_task(
+            asyncio.to_thread(lambda: self.sync(payloads_source(), version))
+        )
+
+    # ---------- Recherche ----------
+
+    def search(
+            self, query: str, limit: int = 5, min_similarity: float = 0.75
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Produits dont le nom sonne comme la requête.
+
+        Args:
+            query: Texte de recherche (transcription)
+            limit: Nombre max de résultats
+            min_similarity: Similarité phonétique minimale (0 à 1)
+
+        Returns:
+            Couples (payload, similarité) par similarité décroissante
+        """
+        query_forms = self._forms(query, max_span=3)
+
+        with self._lock:
+            candidates: Set[str] = set()
+            for form in query_forms:
+                candidates |= self._keys.get(form, set())
+                candidates |= self._keys.get(self._skeleton(form), set())
+
+            scored = []
+            for cip13 in candidates:
+                payload, forms = self._documents[cip13]
+                similarity = max(
+                    self._similarity(q, f) for q in query_forms for f in forms
+                )
+                if similarity >= min_similarity:
+                    scored.append((payload, round(similarity, 4)))
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+
+
+# Instance globale
+phonetic_index = PhoneticIndex()
@@ -1,53 +1,215 @@
 """Client Qdrant pour recherche vectorielle de produits."""
 import asyncio
-from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient as QdrantClientSDK
-from qdrant_client.models import Distance, VectorParams, PointStruct
-from sentence_transformers import SentenceTransformer
+import random
+import time
+from typing import List, Dict, Any, AsyncIterator, Optional
+import grpc
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Distance,
+    FieldCondition,
+    Filter,
+    InitFrom,
+    MatchValue,
+    VectorParams,
+    PointStruct,
+    SearchRequest,
+    SetPayload,
+    SetPayloadOperation,
+)
 
 from src.core.config import settings
+from src.services.vector_db.embedding_service import embedding_service
+from src.services.vector_db.hybrid_search import hybrid_searcher, lexical_index
+from src.services.vector_db.local_index import local_vector_index
+from src.services.vector_db.model_registry import model_registry
+from src.services.vector_db.phonetic_index import phonetic_index
+from src.services.vector_db.query_cache import query_embedding_cache
+from src.utils.metrics import qdrant_retries_total
+
+# Codes gRPC d'une indisponibilité passagère
+_TRANSIENT_GRPC_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+}
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Erreur réseau ou surcharge passagère: une nouvelle tentative peut réussir."""
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError, ResponseHandlingException)):
+        return True
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code in (429, 502, 503, 504)
+    if isinstance(error, grpc.RpcError):
+        return error.code() in _TRANSIENT_GRPC_CODES
+    return False
 
 
 class QdrantClient:
-    """Client pour Qdrant Vector Database."""
+    """
+    Client pour Qdrant Vector Database.
+
+    Toutes les requêtes passent par le client asynchrone du SDK (un seul
+    canal gRPC, ou pool HTTP, partagé par le process): un aller-retour
+    réseau ne bloque plus la boucle. Chaque requête a son propre timeout et
+    les erreurs passagères sont rejouées avec un délai exponentiel aléatoire.
+    """
 
     def __init__(self):
         """Initialiser le client Qdrant."""
-        self.client = QdrantClientSDK(
+        self.client = AsyncQdrantClient(
             host=settings.qdrant_host,
             port=settings.qdrant_port,
+            grpc_port=settings.qdrant_grpc_port,
+            prefer_grpc=settings.qdrant_prefer_grpc,
             api_key=settings.qdrant_api_key,
-            timeout=5,
+            timeout=int(settings.qdrant_timeout),
         )
 
+        # Alias vers la collection versionnée en service (voir ProductIndexer.reindex_all)
         self.collection_name = settings.qdrant_collection
 
-        # Modèle d'embeddings pour français
-        self.embedding_model = SentenceTransformer(
-            "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
+        # Dimension des embeddings
+        self.vector_size = settings.embedding_vector_size
+
+        # Copie en mémoire du catalogue: recherche vectorielle locale, index
+        # lexical et phonétique (None: chaque recherche interroge Qdrant)
+        self.local_index = (
+            local_vector_index
+            if settings.vector_search_backend == "local"
+            or settings.hybrid_search_enabled
+            or settings.phonetic_search_enabled
+            else None
         )
 
-        # Dimension des embeddings
-        self.vector_size = 768
+    async def _request(self, operation: str, request_timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Appeler une méthode du client avec timeout et retry.
 
-    async def initialize_collection(self):
-        """Créer la collection si elle n'existe pas."""
-        try:
-            # Vérifier si la collection existe
-            collections = self.client.get_collections().collections
-            exists = any(c.name == self.collection_name for c in collections)
+        Args:
+            operation: Nom de la méthode d'AsyncQdrantClient
+            request_timeout: Timeout de chaque tentative (défaut: qdrant_timeout)
+            **kwargs: Arguments de la méthode
 
-            if not exists:
-                print(f"📦 Création collection Qdrant: {self.collection_name}")
+        Returns:
+            Résultat de la méthode
+        """
+        method = getattr(self.client, operation)
+        timeout = request_timeout or settings.qdrant_timeout
+
+        for attempt in range(1, settings.qdrant_max_attempts + 1):
+            try:
+                return await asyncio.wait_for(method(**kwargs), timeout)
+
+            except Exception as e:
+                if attempt == settings.qdrant_max_attempts or not _is_transient(e):
+                    raise
+
+                # Délai aléatoire: les appels en échec ne réessaient pas tous ensemble
+                delay = random.uniform(0, min(
+                    settings.qdrant_retry_max_delay,
+                    settings.qdrant_retry_base_delay * 2 ** (attempt - 1),
+                ))
+                qdrant_retries_total.labels(operation=operation).inc()
+                print(
+                    f"⚠️  Qdrant {operation}: tentative {attempt}/{settings.qdrant_max_attempts} "
+                    f"échouée ({type(e).__name__}). Retry dans {delay:.2f}s..."
+                )
+                await asyncio.sleep(delay)
+
+    async def iter_points(
+            self,
+            collection_name: Optional[str] = None,
+            page_size: int = 1000,
+            with_vectors: bool = True,
+            with_payload: bool = True,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Parcourir une collection par pages de scroll.
+
+        Args:
+            collection_name: Collection (défaut: collection produits)
+            page_size: Points par page
+            with_vectors: Inclure les vecteurs
+            with_payload: Inclure les payloads
 
-                self.client.create_collection(
-                    collection_name=self.collection_name,
-                    vectors_config=VectorParams(
-                        size=self.vector_size, distance=Distance.COSINE
-                    ),
+        Yields:
+            Pages de points (id, vector, payload)
+        """
+        offset = None
+        while True:
+            points, offset = await self._request(
+                "scroll",
+                collection_name=collection_name or self.collection_name,
+                limit=page_size,
+                offset=offset,
+                with_payload=with_payload,
+                with_vectors=with_vectors,
+            )
+            yield points
+            if offset is None:
+                return
+
+    async def close(self) -> None:
+        """Fermer le canal partagé."""
+        await self.client.close()
+
+    @property
+    def embedding_model(self):
+        """Modèle d'embeddings pour français (partagé, chargé au premier usage)."""
+        return model_registry.get()
+
+    def _use_local_index(self) -> bool:
+        """Recherche vectorielle en mémoire possible (index chargé)."""
+        return (
+            settings.vector_search_backend == "local"
+            and self.local_index is not None
+            and self.local_index.is_ready
+        )
+
+    async def load_local_index(self) -> bool:
+        """
+        Charger (ou recharger) l'index local depuis la collection.
+
+        Returns:
+            True si l'index est chargé
+        """
+        if self.local_index is None:
+            return False
+
+        try:
+            await self.local_index.load(self.iter_points())
+            if settings.hybrid_search_enabled:
+                await asyncio.to_thread(
+                    lexical_index.build, self.local_index.payloads(), self.local_index.version
                 )
+            if settings.phonetic_search_enabled:
+                await asyncio.to_thread(
+                    phonetic_index.sync, self.local_index.payloads(), self.local_index.version
+                )
+            return True
+        except Exception as e:
+            print(f"❌ Erreur chargement index local: {e}")
+            return False
 
-                print(f"✅ Collection créée: {self.collection_name}")
+    async def initialize_collection(self):
+        """Créer la collection (version initiale derrière l'alias) si elle n'existe pas."""
+        try:
+            # Vérifier si l'alias (ou une ancienne collection du même nom) existe
+            collections = await self.list_collections()
+            exists = await self.resolve_collection() is not None or self.collection_name in collections
+
+            if not exists:
+                collection_name = self.new_collection_name()
+                await self.create_collection(collection_name)
+                await self.switch_alias(collection_name)
             else:
                 print(f"✅ Collection existe: {self.collection_name}")
 
@@ -55,6 +217,173 @@ class QdrantClient:
             print(f"❌ Erreur initialisation Qdrant: {e}")
             raise
 
+    # ---------- Collections versionnées ----------
+
+    def new_collection_name(self) -> str:
+        """Nom d'une nouvelle version de la collection ("products_v20261019101500")."""
+        return f"{self.collection_name}_v{time.strftime('%Y%m%d%H%M%S')}"
+
+    def is_version(self, collection_name: str) -> bool:
+        """Collection versionnée de cet alias."""
+        return collection_name.startswith(f"{self.collection_name}_v")
+
+    async def list_collections(self) -> List[str]:
+        """Noms des collections existantes."""
+        return [c.name for c in (await self._request("get_collections")).collections]
+
+    async def resolve_collection(self) -> Optional[str]:
+        """
+        Collection vers laquelle pointe l'alias.
+
+        Returns:
+            Nom de la collection, None si l'alias n'existe pas
+        """
+        aliases = (await self._request("get_aliases")).aliases
+        return next(
+            (a.collection_name for a in aliases if a.alias_name == self.collection_name), None
+        )
+
+    async def create_collection(self, collection_name: str, copy_from: Optional[str] = None) -> None:
+        """
+        Créer une collection.
+
+        Args:
+            collection_name: Nom de la collection
+            copy_from: Collection dont les points sont recopiés (None: vide)
+        """
+        print(f"📦 Création collection Qdrant: {collection_name}")
+        await self._request(
+            "create_collection",
+            collection_name=collection_name,
+            vectors_config=VectorParams(size=self.vector_size, distance=Distance.COSINE),
+            init_from=InitFrom(collection=copy_from) if copy_from else None,
+        )
+        print(f"✅ Collection créée: {collection_name}")
+
+    async def count_points(self, collection_name: str) -> int:
+        """Nombre exact de points d'une collection."""
+        return (await self._request("count", collection_name=collection_name, exact=True)).count
+
+    async def switch_alias(self, collection_name: str) -> Optional[str]:
+        """
+        Faire pointer l'alias vers une collection, en une opération atomique.
+
+        Args:
+            collection_name: Nouvelle collection en service
+
+        Returns:
+            Collection précédemment en service (None si aucune)
+        """
+        previous = await self.resolve_collection()
+        if previous is None and self.collection_name in await self.list_collections():
+            return await self._migrate_to_alias(collection_name)
+
+        operations = []
+        if previous is not None:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=self.collection_name)))
+        operations.append(self._create_alias(collection_name))
+
+        await self._request("update_collection_aliases", change_aliases_operations=operations)
+        print(f"🔀 Alias {self.collection_name} -> {collection_name}")
+        return previous
+
+    def _create_alias(self, collection_name: str) -> CreateAliasOperation:
+        return CreateAliasOperation(
+            create_alias=CreateAlias(collection_name=collection_name, alias_name=self.collection_name)
+        )
+
+    async def _migrate_to_alias(self, collection_name: str, copy_timeout: float = 300.0) -> str:
+        """
+        Remplacer l'ancienne collection non versionnée (du nom de l'alias) par l'alias.
+
+        Un alias ne peut pas porter le nom d'une collection existante: elle est
+        d'abord recopiée dans une version "legacy", qui sert de repli si la
+        création de l'alias échoue après sa suppression.
+
+        Args:
+            collection_name: Nouvelle collection en service
+            copy_timeout: Attente max de la copie (secondes)
+
+        Returns:
+            Nom de la copie de l'ancienne collection
+        """
+        legacy = f"{self.collection_name}_vlegacy"
+        expected = await self.count_points(self.collection_name)
+        if legacy not in await self.list_collections():
+            await self.create_collection(legacy, copy_from=self.collection_name)
+
+        deadline = time.monotonic() + copy_timeout
+        while (count := await self.count_points(legacy)) < expected:
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Copie {legacy} incomplète ({count}/{expected}), migration annulée")
+            await asyncio.sleep(1)
+
+        print(f"⚠️  Collection {self.collection_name} remplacée par un alias (copie: {legacy})")
+        await self._request("delete_collection", collection_name=self.collection_name)
+        try:
+            await self._request(
+                "update_collection_aliases", change_aliases_operations=[self._create_alias(collection_name)]
+            )
+        except Exception as e:
+            # Le nom ne doit jamais rester sans collection: repli sur la copie
+            print(f"❌ Création de l'alias impossible ({e}), repli sur {legacy}")
+            await self._request(
+                "update_collection_aliases", change_aliases_operations=[self._create_alias(legacy)]
+            )
+            raise
+
+        print(f"🔀 Alias {self.collection_name} -> {collection_name}")
+        return legacy
+
+    async def delete_collection(self, collection_name: str) -> None:
+        """Supprimer une collection (jamais celle en service)."""
+        if collection_name == await self.resolve_collection():
+            raise ValueError(f"Collection en service: {collection_name}")
+        await self._request("delete_collection", collection_name=collection_name)
+        print(f"🗑️  Collection supprimée: {collection_name}")
+
+    @staticmethod
+    def product_text(product: Dict[str, Any]) -> str:
+        """Texte à embedder (nom + catégorie + synonymes potentiels)."""
+        return f"{product['name']} {product.get('category', '')}"
+
+    @staticmethod
+    def product_point(product: Dict[str, Any], vector: List[float]) -> PointStruct:
+        """Point Qdrant d'un produit."""
+        return PointStruct(
+            id=product["id"],
+            vector=vector,
+            payload={
+                "cip13": product["cip13"],
+                "ean": product.get("ean"),
+                "name": product["name"],
+                "category": product.get("category"),
+                "supplier_code": product.get("supplier_code"),
+                "unit_price": product.get("unit_price"),
+                # Date ISO de la ligne en base (point de départ de CatalogSync)
+                "updated_at": product.get("updated_at"),
+            },
+        )
+
+    def encode_products(self, products: List[Dict[str, Any]], batch_size: int = 64) -> np.ndarray:
+        """
+        Encoder des produits en un seul passage du modèle (bloquant).
+
+        Args:
+            products: Liste de produits
+            batch_size: Taille des batchs d'inférence
+
+        Returns:
+            Matrice float32 de vecteurs normalisés (une ligne par produit)
+        """
+        embeddings = self.embedding_model.encode(
+            [self.product_text(product) for product in products],
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        return embeddings.astype(np.float32, copy=False)
+
     async def index_product(self, product: Dict[str, Any]) -> bool:
         """
         Indexer un produit dans Qdrant.
@@ -66,31 +395,21 @@ class QdrantClient:
             True si succès
         """
         try:
-            # Créer le texte à embedder (nom + catégorie + synonymes potentiels)
-            text_to_embed = f"{product['name']} {product.get('category', '')}"
-
-            # Générer l'embedding
-            embedding = self.embedding_model.encode(text_to_embed).tolist()
-
-            # Créer le point
-            point = PointStruct(
-                id=product["id"],
-                vector=embedding,
-                payload={
-                    "cip13": product["cip13"],
-                    "ean": product.get("ean"),
-                    "name": product["name"],
-                    "category": product.get("category"),
-                    "supplier_code": product.get("supplier_code"),
-                    "unit_price": product.get("unit_price"),
-                },
-            )
+            # Générer l'embedding (hors boucle)
+            embedding = (await embedding_service.encode(self.product_text(product))).tolist()
 
             # Insérer dans Qdrant
-            self.client.upsert(
-                collection_name=self.collection_name, points=[point], wait=True
+            point = self.product_point(product, embedding)
+            await self._request(
+                "upsert",
+                collection_name=self.collection_name,
+                points=[point],
+                wait=True,
             )
 
+            if self.local_index is not None:
+                await self.local_index.upsert([point.id], np.array([embedding]), [point.payload])
+
             print(f"✅ Produit indexé: {product['name']}")
             return True
 
@@ -98,85 +417,269 @@ class QdrantClient:
             print(f"❌ Erreur indexation produit: {e}")
             return False
 
-    async def index_products_batch(self, products: List[Dict[str, Any]]) -> int:
+    async def upsert_vectors(
+            self,
+            products: List[Dict[str, Any]],
+            vectors: np.ndarray,
+            wait: bool = True,
+            collection_name: Optional[str] = None,
+    ) -> int:
+        """
+        Insérer des produits déjà encodés.
+
+        Args:
+            products: Liste de produits
+            vectors: Vecteurs (même ordre que products)
+            wait: Attendre l'application par Qdrant (sinon simple accusé de réception)
+            collection_name: Collection cible (défaut: alias en service)
+
+        Returns:
+            Nombre de points envoyés
+        """
+        points = [
+            self.product_point(product, vector.tolist())
+            for product, vector in zip(products, vectors)
+        ]
+
+        await self._request(
+            "upsert",
+            collection_name=collection_name or self.collection_name,
+            points=points,
+            wait=wait,
+        )
+
+        # Collection en construction: l'index local suit la collection en service
+        if self.local_index is not None and collection_name in (None, self.collection_name):
+            await self.local_index.upsert(
+                [point.id for point in points], vectors, [point.payload for point in points]
+            )
+        return len(points)
+
+    async def update_payloads(self, products: List[Dict[str, Any]]) -> int:
+        """
+        Mettre à jour les payloads sans réencoder (prix, fournisseur...).
+
+        Args:
+            products: Produits dont le texte embeddé est inchangé
+
+        Returns:
+            Nombre de points mis à jour
+        """
+        payloads = [self.product_point(product, []).payload for product in products]
+        await self._request(
+            "batch_update_points",
+            collection_name=self.collection_name,
+            update_operations=[
+                SetPayloadOperation(set_payload=SetPayload(payload=payload, points=[product["id"]]))
+                for product, payload in zip(products, payloads)
+            ],
+        )
+
+        if self.local_index is not None:
+            await self.local_index.upsert([product["id"] for product in products], None, payloads)
+        return len(products)
+
+    async def retrieve_points(self, ids: List[int], with_vectors: bool = False) -> Dict[int, Any]:
+        """
+        Récupérer des points par ID.
+
+        Args:
+            ids: IDs des points
+            with_vectors: Inclure les vecteurs
+
+        Returns:
+            Points existants par ID
+        """
+        points = await self._request(
+            "retrieve",
+            collection_name=self.collection_name,
+            ids=ids,
+            with_payload=True,
+            with_vectors=with_vectors,
+        )
+        return {point.id: point for point in points}
+
+    async def delete_products(self, product_ids: List[int]) -> int:
+        """
+        Supprimer plusieurs produits de l'index.
+
+        Args:
+            product_ids: IDs des produits
+
+        Returns:
+            Nombre de points supprimés
+        """
+        if not product_ids:
+            return 0
+
+        await self._request(
+            "delete", collection_name=self.collection_name, points_selector=product_ids
+        )
+
+        if self.local_index is not None:
+            await self.local_index.delete(product_ids)
+        return len(product_ids)
+
+    async def index_products_batch(
+            self, products: List[Dict[str, Any]], wait: bool = True
+    ) -> int:
         """
         Indexer plusieurs produits en batch.
 
         Args:
             products: Liste de produits
+            wait: Attendre l'application par Qdrant
 
         Returns:
             Nombre de produits indexés
         """
         try:
-            points = []
-
-            for product in products:
-                text_to_embed = f"{product['name']} {product.get('category', '')}"
-                embedding = self.embedding_model.encode(text_to_embed).tolist()
-
-                point = PointStruct(
-                    id=product["id"],
-                    vector=embedding,
-                    payload={
-                        "cip13": product["cip13"],
-                        "ean": product.get("ean"),
-                        "name": product["name"],
-                        "category": product.get("category"),
-                        "supplier_code": product.get("supplier_code"),
-                        "unit_price": product.get("unit_price"),
-                    },
-                )
-                points.append(point)
-
-            # Insérer en batch
-            self.client.upsert(
-                collection_name=self.collection_name, points=points, wait=True
-            )
+            # Un seul passage du modèle pour tout le batch
+            vectors = await asyncio.to_thread(self.encode_products, products)
+            count = await self.upsert_vectors(products, vectors, wait=wait)
 
-            print(f"✅ {len(points)} produits indexés")
-            return len(points)
+            print(f"✅ {count} produits indexés")
+            return count
 
         except Exception as e:
             print(f"❌ Erreur indexation batch: {e}")
             return 0
 
+    async def _semantic_search_batch(
+            self, query_vectors: List[np.ndarray], limit: int, score_threshold: float
+    ) -> List[List[Dict[str, Any]]]:
+        """Top-k sémantique par vecteur: index local si chargé, sinon Qdrant."""
+        if self._use_local_index():
+            hits_by_query = self.local_index.search_batch(
+                np.array(query_vectors), limit, score_threshold
+            )
+            return [
+                [
+                    {"product": payload, "score": score, "match_type": "semantic"}
+                    for payload, score in hits
+                ]
+                for hits in hits_by_query
+            ]
+
+        return await self.search_vectors(query_vectors, limit, score_threshold)
+
+    async def search_vectors(
+            self,
+            query_vectors: List[np.ndarray],
+            limit: int,
+            score_threshold: float,
+            collection_name: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Top-k sémantique par vecteur, interrogé dans Qdrant.
+
+        Args:
+            query_vectors: Vecteurs de requête
+            limit: Nombre max de résultats par requête
+            score_threshold: Score cosinus minimal
+            collection_name: Collection interrogée (défaut: alias en service)
+
+        Returns:
+            Liste de résultats par requête
+        """
+        search_results = await self._request(
+            "search_batch",
+            request_timeout=settings.qdrant_search_timeout,
+            collection_name=collection_name or self.collection_name,
+            requests=[
+                SearchRequest(
+                    vector=embedding.tolist(),
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_payload=True,
+                )
+                for embedding in query_vectors
+            ],
+        )
+
+        return [
+            [
+                {"product": hit.payload, "score": hit.score, "match_type": "semantic"}
+                for hit in hits
+            ]
+            for hits in search_results
+        ]
+
+    def _use_hybrid(self, hybrid: Optional[bool]) -> bool:
+        """Fusion lexicale possible (index lexical construit) et souhaitée."""
+        if hybrid is None:
+            hybrid = settings.hybrid_search_enabled
+        if not hybrid or self.local_index is None:
+            return False
+
+        self._refresh_catalog_indexes()
+        return lexical_index.is_ready
+
+    def _refresh_catalog_indexes(self) -> None:
+        """Catalogue modifié depuis la construction: index dérivés refaits en tâche de fond."""
+        if settings.hybrid_search_enabled:
+            lexical_index.refresh(self.local_index.payloads, self.local_index.version)
+        if settings.phonetic_search_enabled:
+            phonetic_index.refresh(self.local_index.payloads, self.local_index.version)
+
+    async def _search(
+            self,
+            queries: List[str],
+            limit: int,
+            score_threshold: float,
+            hybrid: Optional[bool],
+    ) -> List[List[Dict[str, Any]]]:
+        """Recherche sémantique, fusionnée avec l'index lexical si disponible."""
+        # Requêtes absentes du cache encodées dans le même batch
+        query_vectors = await query_embedding_cache.encode_batch(queries)
+
+        if not self._use_hybrid(hybrid):
+            return await self._semantic_search_batch(query_vectors, limit, score_threshold)
+
+        # Plus de candidats, seuil plus bas: la fusion et le dosage font le tri
+        semantic = await self._semantic_search_batch(
+            query_vectors, settings.hybrid_candidates, settings.hybrid_semantic_floor
+        )
+        use_phonetic = settings.phonetic_search_enabled and phonetic_index.is_ready
+        return [
+            hybrid_searcher.fuse(
+                query,
+                candidates,
+                lexical_index.search(query, settings.hybrid_candidates),
+                limit=limit,
+                score_threshold=score_threshold,
+                phonetic=(
+                    phonetic_index.search(
+                        query, settings.hybrid_candidates, settings.phonetic_min_similarity
+                    )
+                    if use_phonetic
+                    else None
+                ),
+            )
+            for query, candidates in zip(queries, semantic)
+        ]
+
     async def search_product(
-            self, query: str, limit: int = 5, score_threshold: float = 0.5
+            self,
+            query: str,
+            limit: int = 5,
+            score_threshold: float = 0.5,
+            hybrid: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Rechercher des produits par similarité sémantique.
+        Rechercher des produits (sémantique, et lexical si la recherche hybride est active).
 
         Args:
             query: Texte de recherche
             limit: Nombre max de résultats
             score_threshold: Seuil de score minimal
+            hybrid: Forcer (ou désactiver) la fusion lexicale; None: configuration
 
         Returns:
             Liste de résultats avec scores
         """
         try:
-            # Générer l'embedding de la requête
-            query_embedding = self.embedding_model.encode(query).tolist()
-
-            # Rechercher dans Qdrant
-            search_result = self.client.search(
-                collection_name=self.collection_name,
-                query_vector=query_embedding,
-                limit=limit,
-                score_threshold=score_threshold,
-            )
-
-            # Formater les résultats
-            results = []
-            for hit in search_result:
-                results.append(
-                    {
-                        "product": hit.payload,
-                        "score": hit.score,
-                        "match_type": "semantic",
-                    }
-                )
+            results = (await self._search([query], limit, score_threshold, hybrid))[0]
 
             print(f"🔍 Recherche '{query}': {len(results)} résultats")
 
@@ -186,6 +689,39 @@ class QdrantClient:
             print(f"❌ Erreur recherche Qdrant: {e}")
             return []
 
+    async def search_products_batch(
+            self,
+            queries: List[str],
+            limit: int = 5,
+            score_threshold: float = 0.5,
+            hybrid: Optional[bool] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Rechercher plusieurs produits en une passe (un encodage, une requête Qdrant).
+
+        Args:
+            queries: Textes de recherche
+            limit: Nombre max de résultats par requête
+            score_threshold: Seuil de score minimal
+            hybrid: Forcer (ou désactiver) la fusion lexicale; None: configuration
+
+        Returns:
+            Liste de résultats par requête (même ordre que queries)
+        """
+        if not queries:
+            return []
+
+        try:
+            results = await self._search(queries, limit, score_threshold, hybrid)
+
+            print(f"🔍 Recherche groupée: {len(queries)} requêtes")
+
+            return results
+
+        except Exception as e:
+            print(f"❌ Erreur recherche groupée Qdrant: {e}")
+            return [[] for _ in queries]
+
     async def search_product_fuzzy(
             self, query: str, limit: int = 5
     ) -> List[Dict[str, Any]]:
@@ -206,32 +742,21 @@ class QdrantClient:
             if results:
                 return results
 
-            # Si pas de résultats, essayer recherche phonétique/fuzzy
-            # (Implémentation simplifiée - pourrait être améliorée)
-            query_lower = query.lower()
-
-            # Rechercher tous les produits et filtrer par similarité de nom
-            all_points = self.client.scroll(
-                collection_name=self.collection_name, limit=100, with_payload=True
-            )[0]
-
-            fuzzy_matches = []
-            for point in all_points:
-                product_name = point.payload.get("name", "").lower()
-
-                # Vérifier si le query est contenu dans le nom
-                if query_lower in product_name or product_name in query_lower:
-                    fuzzy_matches.append(
-                        {
-                            "product": point.payload,
-                            "score": 0.7,  # Score arbitraire pour fuzzy
-                            "match_type": "fuzzy",
-                        }
-                    )
+            # Si pas de résultats, recherche phonétique (nom mal transcrit)
+            if self.local_index is None or not phonetic_index.is_ready:
+                return []
+            self._refresh_catalog_indexes()
 
-            print(f"🔍 Recherche fuzzy '{query}': {len(fuzzy_matches)} résultats")
+            fuzzy_matches = [
+                {"product": payload, "score": similarity, "match_type": "phonetic"}
+                for payload, similarity in phonetic_index.search(
+                    query, limit, settings.phonetic_min_similarity
+                )
+            ]
 
-            return fuzzy_matches[:limit]
+            print(f"🔍 Recherche phonétique '{query}': {len(fuzzy_matches)} résultats")
+
+            return fuzzy_matches
 
         except Exception as e:
             print(f"❌ Erreur recherche fuzzy: {e}")
@@ -249,11 +774,13 @@ class QdrantClient:
         """
         try:
             # Rechercher par filtre sur le payload
-            search_result = self.client.scroll(
+            search_result = await self._request(
+                "scroll",
                 collection_name=self.collection_name,
-                scroll_filter={
-                    "must": [{"key": "cip13", "match": {"value": cip13}}]
-                },
+                # Modèle typé: le transport gRPC ne convertit pas un dict
+                scroll_filter=Filter(
+                    must=[FieldCondition(key="cip13", match=MatchValue(value=cip13))]
+                ),
                 limit=1,
                 with_payload=True,
             )
@@ -278,10 +805,13 @@ class QdrantClient:
             True si succès
         """
         try:
-            self.client.delete(
-                collection_name=self.collection_name, points_selector=[product_id]
+            await self._request(
+                "delete", collection_name=self.collection_name, points_selector=[product_id]
             )
 
+            if self.local_index is not None:
+                await self.local_index.delete([product_id])
+
             print(f"🗑️  Produit supprimé de l'index: {product_id}")
             return True
 
@@ -297,7 +827,7 @@ class QdrantClient:
             Infos de la collection
         """
         try:
-            info = self.client.get_collection(self.collection_name)
+            info = await self._request("get_collection", collection_name=self.collection_name)
 
             return {
                 "name": info.config.params.vectors.size,
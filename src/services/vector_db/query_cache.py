@@ -0,0 +1,174 @@
+"""Cache des embeddings de requêtes: LRU en mémoire + Redis binaire partagé."""
+import asyncio
+import hashlib
+import re
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.core.config import settings
+from src.services.vector_db.embedding_service import EmbeddingService, embedding_service
+from src.utils.cache import binary_cache, BinaryCacheManager
+from src.utils.metrics import embedding_cache_lookups_total
+
+
+class QueryEmbeddingCache:
+    """
+    Vecteurs des requêtes de recherche, par texte normalisé et version du modèle.
+
+    Le vocabulaire parlé est borné par le catalogue: les mêmes noms
+    ("doliprane", "spasfon lyoc") reviennent d'un appel à l'autre, et leur
+    vecteur est servi sans inférence. Le niveau Redis partage les vecteurs
+    entre instances et survit aux redémarrages.
+    """
+
+    def __init__(
+            self,
+            encoder: EmbeddingService = embedding_service,
+            max_entries: int = 10_000,
+            redis: Optional[BinaryCacheManager] = binary_cache,
+            ttl: int = 7 * 24 * 3600,
+            model_version: Optional[str] = None,
+    ):
+        """
+        Initialiser le cache.
+
+        Args:
+            encoder: Service d'encodage (appelé sur les absences)
+            max_entries: Vecteurs gardés en mémoire
+            redis: Connexion Redis binaire (None: mémoire seule)
+            ttl: Durée de vie Redis en secondes
+            model_version: Version du modèle dans la clé (un changement invalide le cache)
+        """
+        self.encoder = encoder
+        self.max_entries = max_entries
+        self.redis = redis
+        self.ttl = ttl
+        self.model_version = model_version or (
+            f"{settings.embedding_model_name}@{settings.embedding_model_version}"
+        )
+        self.prefix = "emb:"
+
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._lookups = 0
+        self._hits = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Texte de la requête sans variations de casse, d'espaces ni de forme Unicode."""
+        text = unicodedata.normalize("NFC", text).lower()
+        return re.sub(r"\s+", " ", text).strip(" .,;:!?")
+
+    def _key(self, normalized: str) -> str:
+        digest = hashlib.sha256(f"{self.model_version}\x00{normalized}".encode("utf-8")).hexdigest()
+        return f"{self.prefix}{digest}"
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """Ajouter au niveau mémoire, en évinçant le moins récent."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def _lookup(self, key: str) -> Optional[np.ndarray]:
+        """Chercher un vecteur en mémoire puis dans Redis."""
+        self._lookups += 1
+
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+            self._hits += 1
+            embedding_cache_lookups_total.labels(tier="memory", result="hit").inc()
+            return vector
+
+        if self.redis is None:
+            embedding_cache_lookups_total.labels(tier="memory", result="miss").inc()
+            return None
+
+        try:
+            value = await self.redis.get(key)
+        except Exception as e:
+            print(f"⚠️  Cache embeddings Redis indisponible: {e}")
+            value = None
+
+        if value is None:
+            embedding_cache_lookups_total.labels(tier="redis", result="miss").inc()
+            return None
+
+        self._hits += 1
+        embedding_cache_lookups_total.labels(tier="redis", result="hit").inc()
+        vector = np.frombuffer(value, dtype=np.float32)
+        self._remember(key, vector)
+        return vector
+
+    async def _compute(self, key: str, normalized: str) -> np.ndarray:
+        """Encoder une requête absente et la stocker dans les deux niveaux."""
+        vector = np.asarray(await self.encoder.encode(normalized), dtype=np.float32)
+        self._remember(key, vector)
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(key, vector.tobytes(), ttl=self.ttl)
+            except Exception as e:
+                print(f"⚠️  Cache embeddings Redis indisponible: {e}")
+
+        return vector
+
+    async def encode(self, text: str) -> np.ndarray:
+        """
+        Vecteur d'une requête, depuis le cache ou par inférence.
+
+        Args:
+            text: Texte de la requête
+
+        Returns:
+            Vecteur float32
+        """
+        normalized = self.normalize(text)
+        key = self._key(normalized)
+
+        vector = await self._lookup(key)
+        if vector is not None:
+            return vector
+
+        # Même requête déjà en cours d'encodage pour un autre appel
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.ensure_future(self._compute(key, normalized))
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def encode_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Vecteurs de plusieurs requêtes (les absences sont encodées dans le même batch).
+
+        Args:
+            texts: Textes des requêtes
+
+        Returns:
+            Vecteurs, dans l'ordre de texts
+        """
+        return list(await asyncio.gather(*[self.encode(text) for text in texts]))
+
+    def get_stats(self) -> dict:
+        """Taux de succès et occupation du niveau mémoire."""
+        return {
+            "entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "lookups": self._lookups,
+            "hit_ratio": round(self._hits / self._lookups, 3) if self._lookups else 0.0,
+        }
+
+
+# Instance globale
+query_embedding_cache = QueryEmbeddingCache(
+    max_entries=settings.embedding_cache_max_entries,
+    redis=binary_cache if settings.embedding_cache_redis else None,
+    ttl=settings.embedding_cache_ttl,
+)
@@ -1,5 +1,5 @@
 """Utilitaires."""
-from src.utils.cache import cache
+from src.utils.cache import cache, binary_cache
 from src.utils.formatters import (
     format_currency,
     format_datetime,
@@ -14,10 +14,46 @@ from src.utils.metrics import (
     api_latency,
     stt_latency,
     llm_latency,
+    llm_time_to_first_token,
     tts_latency,
+    llm_queue_delay,
+    llm_hedge_total,
+    llm_timeouts_total,
+    llm_cascade_stage_latency,
+    llm_cascade_escalations_total,
+    llm_cascade_requests_total,
+    tts_cache_requests_total,
+    tts_cache_bytes_saved_total,
+    tts_segments_total,
+    tts_time_to_first_audio,
+    tts_response_duration,
+    tts_planner_segments,
+    tts_router_attempts_total,
+    tts_router_served_total,
+    tts_router_queue_delay,
+    tts_audio_store_lookups_total,
+    tts_audio_store_memory_bytes,
+    embedding_model_load_seconds,
+    embedding_model_memory_bytes,
+    embedding_queue_delay,
+    embedding_batch_size,
+    embedding_cache_lookups_total,
+    qdrant_retries_total,
+    catalog_sync_changes_total,
+    transcript_corrections_total,
+    turn_latency,
+    turn_budget_overruns_total,
+    turn_degraded_total,
+    call_llm_tokens,
+    call_stt_audio_seconds,
+    call_tts_characters,
+    call_cost,
+    call_stage_latency,
     active_calls,
     active_sessions,
+    llm_requests_in_flight,
     record_call_completed,
+    record_call_usage,
     record_order_created,
     record_error,
 )
@@ -32,6 +68,7 @@ from src.utils.validators import (
 __all__ = [
     # Cache
     "cache",
+    "binary_cache",
     # Formatters
     "format_currency",
     "format_datetime",
@@ -45,10 +82,46 @@ __all__ = [
     "api_latency",
     "stt_latency",
     "llm_latency",
+    "llm_time_to_first_token",
     "tts_latency",
+    "llm_queue_delay",
+    "llm_hedge_total",
+    "llm_timeouts_total",
+    "llm_cascade_stage_latency",
+    "llm_cascade_escalations_total",
+    "llm_cascade_requests_total",
+    "tts_cache_requests_total",
+    "tts_cache_bytes_saved_total",
+    "tts_segments_total",
+    "tts_time_to_first_audio",
+    "tts_response_duration",
+    "tts_planner_segments",
+    "tts_router_attempts_total",
+    "tts_router_served_total",
+    "tts_router_queue_delay",
+    "tts_audio_store_lookups_total",
+    "tts_audio_store_memory_bytes",
+    "embedding_model_load_seconds",
+    "embedding_model_memory_bytes",
+    "embedding_queue_delay",
+    "embedding_batch_size",
+    "embedding_cache_lookups_total",
+    "qdrant_retries_total",
+    "catalog_sync_changes_total",
+    "transcript_corrections_total",
+    "turn_latency",
+    "turn_budget_overruns_total",
+    "turn_degraded_total",
+    "call_llm_tokens",
+    "call_stt_audio_seconds",
+    "call_tts_characters",
+    "call_cost",
+    "call_stage_latency",
     "active_calls",
     "active_sessions",
+    "llm_requests_in_flight",
     "record_call_completed",
+    "record_call_usage",
     "record_order_created",
     "record_error",
     # Parsers
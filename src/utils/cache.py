@@ -58,5 +58,43 @@ class CacheManager:
         return await self.redis.exists(key) > 0
 
 
-# Instance globale
-cache = CacheManager()
\ No newline at end of file
+class BinaryCacheManager:
+    """Connexion Redis binaire: octets bruts, sans JSON ni base64."""
+
+    def __init__(self):
+        self.redis: redis.Redis | None = None
+
+    async def connect(self):
+        """Connexion à Redis."""
+        self.redis = await redis.from_url(settings.redis_url, decode_responses=False)
+
+    async def disconnect(self):
+        """Fermer la connexion."""
+        if self.redis:
+            await self.redis.close()
+
+    async def get(self, key: str) -> bytes | None:
+        """Récupérer une valeur binaire."""
+        if not self.redis:
+            return None
+        return await self.redis.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int | None = 300):
+        """Stocker une valeur binaire (sans expiration si ttl est None)."""
+        if not self.redis:
+            return
+
+        if ttl is None:
+            await self.redis.set(key, value)
+        else:
+            await self.redis.setex(key, ttl, value)
+
+    async def delete(self, key: str):
+        """Supprimer une clé."""
+        if self.redis:
+            await self.redis.delete(key)
+
+
+# Instances globales
+cache = CacheManager()
+binary_cache = BinaryCacheManager()
\ No newline at end of file
@@ -25,13 +25,207 @@ stt_latency = Histogram("heyi_stt_latency_seconds", "Latence du STT")
 
 llm_latency = Histogram("heyi_llm_latency_seconds", "Latence du LLM")
 
+llm_time_to_first_token = Histogram(
+    "heyi_llm_time_to_first_token_seconds", "Délai avant le premier token (streaming)"
+)
+
 tts_latency = Histogram("heyi_tts_latency_seconds", "Latence du TTS")
 
+# Ordonnanceur LLM
+llm_queue_delay = Histogram(
+    "heyi_llm_queue_delay_seconds", "Attente dans la file de l'ordonnanceur LLM"
+)
+
+llm_hedge_total = Counter(
+    "heyi_llm_hedge_total", "Requêtes LLM doublées, par requête gagnante", ["winner"]
+)
+
+llm_timeouts_total = Counter(
+    "heyi_llm_timeouts_total", "Échéances LLM dépassées", ["stage"]
+)
+
+# Cascade d'extraction
+llm_cascade_stage_latency = Histogram(
+    "heyi_llm_cascade_stage_latency_seconds", "Latence par étage de la cascade", ["model"]
+)
+
+llm_cascade_escalations_total = Counter(
+    "heyi_llm_cascade_escalations_total", "Escalades vers le modèle suivant", ["reason"]
+)
+
+llm_cascade_requests_total = Counter(
+    "heyi_llm_cascade_requests_total", "Extractions, par modèle retenu", ["model"]
+)
+
+# Cache TTS
+tts_cache_requests_total = Counter(
+    "heyi_tts_cache_requests_total",
+    "Demandes de synthèse par résultat de cache (hit, miss, shared, bypass, phrase_bank, assembled)",
+    ["result"],
+)
+
+tts_cache_bytes_saved_total = Counter(
+    "heyi_tts_cache_bytes_saved_total", "Octets audio servis sans synthèse"
+)
+
+tts_segments_total = Counter(
+    "heyi_tts_segments_total",
+    "Confirmations reconnues par l'assembleur (assembled, missing_segment, error)",
+    ["result"],
+)
+
+# Planification TTS
+tts_time_to_first_audio = Histogram(
+    "heyi_tts_time_to_first_audio_seconds",
+    "Délai entre la réponse texte et le premier chunk audio",
+    buckets=[0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0],
+)
+
+tts_response_duration = Histogram(
+    "heyi_tts_response_duration_seconds",
+    "Durée totale de synthèse d'une réponse",
+    buckets=[0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 20.0],
+)
+
+tts_planner_segments = Histogram(
+    "heyi_tts_planner_segments",
+    "Segments synthétisés par réponse",
+    buckets=[1, 2, 3, 4, 6, 8, 12, 16],
+)
+
+# Routage TTS
+tts_router_attempts_total = Counter(
+    "heyi_tts_router_attempts_total",
+    "Tentatives de synthèse par fournisseur (first_chunk, slow, timeout, error, empty)",
+    ["provider", "result"],
+)
+
+tts_router_served_total = Counter(
+    "heyi_tts_router_served_total",
+    "Synthèses servies par source (fournisseur, prerendered, none)",
+    ["source"],
+)
+
+tts_router_queue_delay = Histogram(
+    "heyi_tts_router_queue_delay_seconds",
+    "Attente d'un créneau fournisseur",
+    ["provider"],
+)
+
+tts_audio_store_lookups_total = Counter(
+    "heyi_tts_audio_store_lookups_total",
+    "Lectures du stockage audio par niveau et résultat",
+    ["tier", "result"],
+)
+
+catalog_sync_changes_total = Counter(
+    "heyi_catalog_sync_changes_total",
+    "Produits répercutés par la synchronisation du catalogue",
+    ["kind"],  # embedded, payload, local, deleted
+)
+
+qdrant_retries_total = Counter(
+    "heyi_qdrant_retries_total",
+    "Requêtes Qdrant rejouées après une erreur passagère",
+    ["operation"],
+)
+
+transcript_corrections_total = Counter(
+    "heyi_transcript_corrections_total",
+    "Mots de transcription corrigés par le dictionnaire du catalogue",
+)
+
+tts_audio_store_memory_bytes = Gauge(
+    "heyi_tts_audio_store_memory_bytes", "Octets audio dans le niveau mémoire"
+)
+
+# Modèle d'embeddings
+embedding_model_load_seconds = Gauge(
+    "heyi_embedding_model_load_seconds", "Durée du chargement du modèle d'embeddings", ["model"]
+)
+
+embedding_model_memory_bytes = Gauge(
+    "heyi_embedding_model_memory_bytes", "Mémoire des poids du modèle d'embeddings", ["model"]
+)
+
+embedding_queue_delay = Histogram(
+    "heyi_embedding_queue_delay_seconds",
+    "Attente d'une requête avant son batch d'encodage",
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25],
+)
+
+embedding_batch_size = Histogram(
+    "heyi_embedding_batch_size",
+    "Requêtes encodées par batch",
+    buckets=[1, 2, 4, 8, 16, 32, 64],
+)
+
+embedding_cache_lookups_total = Counter(
+    "heyi_embedding_cache_lookups_total",
+    "Lectures du cache d'embeddings de requêtes par niveau et résultat",
+    ["tier", "result"],
+)
+
+# Budget de latence par tour
+turn_latency = Histogram(
+    "heyi_turn_latency_seconds",
+    "Durée de traitement d'un tour (transcription finale -> réponse)",
+    buckets=[0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0, 6.0, 10.0],
+)
+
+turn_budget_overruns_total = Counter(
+    "heyi_turn_budget_overruns_total",
+    "Tours au-delà du budget (soft: phrase d'attente, hard: abandon)",
+    ["kind"],
+)
+
+turn_degraded_total = Counter(
+    "heyi_turn_degraded_total",
+    "Tours abandonnés par repli (review, repeat)",
+    ["action"],
+)
+
+# Comptabilité par appel
+call_llm_tokens = Histogram(
+    "heyi_call_llm_tokens",
+    "Tokens LLM consommés par appel",
+    ["kind"],
+    buckets=(100, 500, 1000, 2500, 5000, 10000, 25000, 50000),
+)
+
+call_stt_audio_seconds = Histogram(
+    "heyi_call_stt_audio_seconds",
+    "Audio envoyé au STT par appel",
+    buckets=(15, 30, 60, 120, 300, 600, 1200),
+)
+
+call_tts_characters = Histogram(
+    "heyi_call_tts_characters",
+    "Caractères synthétisés par appel",
+    buckets=(100, 250, 500, 1000, 2500, 5000, 10000),
+)
+
+call_cost = Histogram(
+    "heyi_call_cost_usd",
+    "Coût estimé par appel (USD)",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+call_stage_latency = Histogram(
+    "heyi_call_stage_latency_seconds",
+    "Latence cumulée par étape et par appel",
+    ["stage"],
+)
+
 # Gauges (valeurs actuelles)
 active_calls = Gauge("heyi_active_calls", "Nombre d'appels actifs")
 
 active_sessions = Gauge("heyi_active_sessions", "Nombre de sessions actives")
 
+llm_requests_in_flight = Gauge(
+    "heyi_llm_requests_in_flight", "Requêtes LLM en cours (doublons inclus)"
+)
+
 
 def record_call_completed(duration: float, status: str):
     """Enregistrer un appel terminé."""
@@ -39,6 +233,18 @@ def record_call_completed(duration: float, status: str):
     call_duration.observe(duration)
 
 
+def record_call_usage(usage: dict):
+    """Enregistrer la consommation d'un appel terminé (voir CallUsage.to_dict)."""
+    call_llm_tokens.labels(kind="prompt").observe(usage["llm_prompt_tokens"])
+    call_llm_tokens.labels(kind="completion").observe(usage["llm_completion_tokens"])
+    call_stt_audio_seconds.observe(usage["stt_audio_seconds"])
+    call_tts_characters.observe(usage["tts_characters"])
+    call_cost.observe(usage["estimated_cost"])
+
+    for stage, summary in usage["latencies"].items():
+        call_stage_latency.labels(stage=stage).observe(summary["total"])
+
+
 def record_order_created(status: str):
     """Enregistrer une commande créée."""
     orders_total.labels(status=status).inc()
@@ -0,0 +1,58 @@
+"""Tests du classifieur local d'intentions (motifs + modèle)."""
+import pytest
+
+from src.services.llm.intent_classifier import IntentClassifier
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    classifier = IntentClassifier()
+    classifier.train()
+    return classifier
+
+
+@pytest.mark.parametrize(
+    "transcript, intent",
+    [
+        ("c'est tout", "validate_order"),
+        ("c est tout", "validate_order"),
+        ("oui c'est tout", "validate_order"),
+        ("je confirme", "validate_order"),
+        ("c'est bon envoie la commande", "validate_order"),
+        ("oui", "confirm"),
+        ("ok parfait", "confirm"),
+        ("oui merci", "confirm"),
+        ("oui ajoute 2 smecta", "add_product"),
+        ("annule la commande", "cancel"),
+    ],
+)
+def test_pattern_intents(classifier, transcript, intent):
+    result = classifier.classify(transcript)
+
+    assert result["intent"] == intent
+    assert result["source"] == "pattern"
+
+
+@pytest.mark.parametrize(
+    "transcript",
+    [
+        "confirmez-moi le prix du doliprane",
+        "je ne valide pas",
+        "pas fini",
+        "merci",
+    ],
+)
+def test_not_a_validation(classifier, transcript):
+    result = classifier.classify(transcript)
+
+    assert result["intent"] not in ("validate_order", "confirm")
+
+
+async def test_log_example_appends_record(tmp_path):
+    path = tmp_path / "intents.jsonl"
+    classifier = IntentClassifier(str(path))
+
+    await classifier.log_example("envoie", "validate_order")
+    await classifier.log_example("bonjour", "not_an_intent")
+
+    assert classifier.load_training_data() == [("envoie", "validate_order")]
@@ -0,0 +1,43 @@
+"""Tests du préchauffage de la banque de phrases avec le client ElevenLabs."""
+from types import SimpleNamespace
+
+from src.services.tts.elevenlabs_client import ElevenLabsTTSClient
+from src.services.tts.phrase_bank import PhraseBank
+
+
+class FakeTextToSpeech:
+    """SDK ElevenLabs 1.x: convert() est un générateur async de chunks."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def convert(self, voice_id, text, **kwargs):
+        self.calls.append(text)
+        for word in text.split():
+            yield word.encode("utf-8") + b"|"
+
+
+def make_client():
+    client = ElevenLabsTTSClient()
+    client.client = SimpleNamespace(text_to_speech=FakeTextToSpeech())
+    return client
+
+
+async def test_text_to_speech_collects_stream():
+    client = make_client()
+
+    audio = await client.text_to_speech("Bonjour pharmacie")
+
+    assert audio == b"Bonjour|pharmacie|"
+
+
+async def test_warm_reaches_ready(tmp_path):
+    client = make_client()
+    bank = PhraseBank(str(tmp_path))
+    phrases = ["Bonjour", "Autre chose ?"]
+
+    assert await bank.warm(client, phrases)
+
+    assert bank.is_ready
+    assert bank.get("Autre chose ?", client.voice_profile()) == b"Autre|chose|?|"
+    assert client.client.text_to_speech.calls == phrases
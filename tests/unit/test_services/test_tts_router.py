@@ -0,0 +1,105 @@
+"""Tests du routage TTS (repli entre fournisseurs), avec le fournisseur local."""
+import pytest
+
+from src.core.config import settings
+from src.services.tts import router as tts_router
+from src.services.tts.local_client import LocalTTSClient
+from src.services.tts.router import TTSRoute, TTSRouter, create_tts_router
+
+
+@pytest.fixture(autouse=True)
+def provider_slots():
+    """Créneaux par fournisseur remis à zéro entre les tests."""
+    tts_router._provider_slots.clear()
+    yield
+    tts_router._provider_slots.clear()
+
+
+def make_route(name, client, deadline=0.5, provider=None, max_concurrency=2):
+    return TTSRoute(
+        name,
+        client,
+        max_concurrency=max_concurrency,
+        first_chunk_deadline=deadline,
+        provider=provider,
+    )
+
+
+async def test_primary_serves_when_healthy():
+    primary = LocalTTSClient(voice_id="primary")
+    secondary = LocalTTSClient(voice_id="secondary")
+    router = TTSRouter([make_route("primary", primary), make_route("secondary", secondary)], bank=None)
+
+    audio = await router.text_to_speech("Bonjour")
+
+    assert audio == await LocalTTSClient().text_to_speech("Bonjour")
+    assert primary.requests == 1
+    assert secondary.requests == 0
+
+
+async def test_failover_on_primary_error():
+    primary = LocalTTSClient(error=RuntimeError("429"))
+    secondary = LocalTTSClient()
+    router = TTSRouter([make_route("primary", primary), make_route("secondary", secondary)], bank=None)
+
+    audio = await router.text_to_speech("Doliprane 1000")
+
+    assert audio
+    assert secondary.requests == 1
+
+
+async def test_failover_on_slow_primary():
+    primary = LocalTTSClient(first_chunk_delay=1.0)
+    secondary = LocalTTSClient()
+    router = TTSRouter(
+        [make_route("primary", primary, deadline=0.05), make_route("secondary", secondary)],
+        bank=None,
+    )
+
+    audio = await router.text_to_speech("Smecta")
+
+    assert audio
+    assert secondary.requests == 1
+    # La synthèse lente est abandonnée: son créneau est rendu
+    assert router.routes[0].slots.active == 0
+
+
+async def test_all_routes_failing_without_bank_raises():
+    router = TTSRouter(
+        [
+            make_route("primary", LocalTTSClient(error=RuntimeError("down"))),
+            make_route("secondary", LocalTTSClient(error=RuntimeError("down"))),
+        ],
+        bank=None,
+    )
+
+    with pytest.raises(RuntimeError):
+        await router.text_to_speech("Bonjour")
+
+
+def test_routes_of_same_provider_share_slots():
+    primary = make_route("elevenlabs", LocalTTSClient(), max_concurrency=4)
+    secondary = make_route("secondary_elevenlabs", LocalTTSClient(), provider="elevenlabs", max_concurrency=4)
+    other = make_route("secondary_local", LocalTTSClient())
+
+    assert primary.slots is secondary.slots
+    assert other.slots is not primary.slots
+
+
+def test_local_secondary_rejected_in_production(monkeypatch):
+    monkeypatch.setattr(tts_router, "ElevenLabsTTSClient", lambda **kwargs: LocalTTSClient())
+    monkeypatch.setattr(settings, "tts_secondary_provider", "local")
+    monkeypatch.setattr(settings, "app_env", "production")
+
+    with pytest.raises(ValueError):
+        create_tts_router()
+
+
+def test_local_secondary_allowed_in_test(monkeypatch):
+    monkeypatch.setattr(tts_router, "ElevenLabsTTSClient", lambda **kwargs: LocalTTSClient())
+    monkeypatch.setattr(settings, "tts_secondary_provider", "local")
+    monkeypatch.setattr(settings, "app_env", "test")
+
+    router = create_tts_router()
+
+    assert [route.name for route in router.routes] == ["elevenlabs", "secondary_local"]